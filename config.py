@@ -37,6 +37,11 @@ HUGGINGFACEHUB_API_TOKEN = os.getenv("HUGGINGFACEHUB_API_TOKEN", None)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 DEBUG_MODE = os.getenv("DEBUG_MODE", "False").lower() == "true"
 
+# 자동화 로거 출력별 최소 레벨 (DEBUG | INFO | WARNING | ERROR | CRITICAL)
+AUTOMATION_LOG_FILE_LEVEL = os.getenv("AUTOMATION_LOG_FILE_LEVEL", "DEBUG").upper()
+AUTOMATION_LOG_CONSOLE_LEVEL = os.getenv("AUTOMATION_LOG_CONSOLE_LEVEL", "INFO").upper()
+AUTOMATION_LOG_DB_LEVEL = os.getenv("AUTOMATION_LOG_DB_LEVEL", "INFO").upper()
+
 # 시스템 설정
 def _get_int_env(key: str, default: str) -> int:
     """환경변수를 안전하게 정수로 변환"""
@@ -60,6 +65,26 @@ PG_DB_NAME = os.getenv("PG_DB_NAME", "synergy")
 PG_DB_USER = os.getenv("PG_DB_USER", "synergy")
 PG_DB_PASSWORD = os.getenv("PG_DB_PASSWORD", "synergy")
 
+# 실시간 DB 업데이트 - 배수지별 아두이노 수위 센서 채널 (형식: "gagok=0,haeryong=1,sangsa=2")
+# 펌웨어(sensorChannels)는 채널 1, 2만 읽으며, 채널 N을 N번째 배수지(가곡, 해룡, 상사)로 보는 기존 매핑에 따라 해룡/상사에 대응
+# 채널이 지정되지 않은 배수지의 수위는 0으로 채우지 않고 NULL로 저장
+def _parse_channel_map(raw: str) -> dict:
+    """'이름=채널' 쉼표 목록을 {이름: 채널} 딕셔너리로 변환"""
+    return {
+        name.strip(): int(channel)
+        for name, channel in (item.split("=") for item in raw.split(",") if item.strip())
+    }
+
+def _get_channel_map_env(key: str, default: str) -> dict:
+    """환경변수를 안전하게 채널 매핑으로 변환"""
+    try:
+        return _parse_channel_map(os.getenv(key, default))
+    except ValueError:
+        logging.warning(f"잘못된 환경변수 값 {key}={os.getenv(key)}, 기본값 {default} 사용")
+        return _parse_channel_map(default)
+
+ARDUINO_LEVEL_CHANNELS = _get_channel_map_env("ARDUINO_LEVEL_CHANNELS", "haeryong=1,sangsa=2")
+
 def validate_config():
     """설정 검증"""
     required_vars = ["LM_STUDIO_BASE_URL", "EMBEDDING_MODEL_NAME"]
@@ -48,6 +48,18 @@ CREATE TABLE IF NOT EXISTS water (
 CREATE INDEX IF NOT EXISTS idx_water_measured_at ON water(measured_at);
 CREATE UNIQUE INDEX IF NOT EXISTS ux_water_measured_at ON water(measured_at);
 
+-- water INSERT 시 캐시 무효화 알림 (services/database_connector.py 가 LISTEN)
+CREATE OR REPLACE FUNCTION notify_water_insert() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('water_insert', '');
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER water_notify
+  AFTER INSERT ON water
+  FOR EACH STATEMENT EXECUTE FUNCTION notify_water_insert();
+
 -- ---- stable staging (영구 스테이징; 끝에 DROP) ----
 DROP TABLE IF EXISTS water_stage;
 CREATE TABLE water_stage (
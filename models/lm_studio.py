@@ -3,7 +3,8 @@
 import json
 import os
 import re
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from config import (
     LM_STUDIO_BASE_URL, 
     LM_STUDIO_API_KEY, 
@@ -16,6 +17,11 @@ from utils.helpers import retry
 
 logger = setup_logger(__name__)
 
+# LM Studio 연결 재사용 설정 (keep-alive 풀, 연결 실패 시 1회 재시도)
+# transport를 직접 넘기면 클라이언트의 limits는 무시되므로 transport에 지정
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60)
+HTTP_TIMEOUT = httpx.Timeout(120.0, connect=2.0)
+
 class LMStudioClient:
     """LM Studio API와 상호작용하는 클라이언트"""
     
@@ -35,11 +41,36 @@ class LMStudioClient:
         # API 클라이언트 초기화
         self.client = OpenAI(
             base_url=self.base_url,
-            api_key=self.api_key
+            api_key=self.api_key,
+            http_client=httpx.Client(
+                timeout=HTTP_TIMEOUT,
+                transport=httpx.HTTPTransport(retries=1, limits=HTTP_LIMITS)
+            )
         )
+        self._aclient = None
         
         logger.info(f"LM Studio 클라이언트 초기화: {self.model}, URL: {self.base_url}")
     
+    @property
+    def aclient(self):
+        """비동기 API 클라이언트 (닫혀 있으면 새로 생성)"""
+        if self._aclient is None or self._aclient.is_closed():
+            self._aclient = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                http_client=httpx.AsyncClient(
+                    timeout=HTTP_TIMEOUT,
+                    transport=httpx.AsyncHTTPTransport(retries=1, limits=HTTP_LIMITS)
+                )
+            )
+        return self._aclient
+    
+    async def aclose(self):
+        """비동기 API 클라이언트 종료 (생성된 적이 없거나 이미 닫혔으면 아무것도 하지 않음)"""
+        aclient, self._aclient = self._aclient, None
+        if aclient is not None and not aclient.is_closed():
+            await aclient.close()
+    
     @retry(max_retries=3)
     def generate_response(self, prompt, temperature=None):
         """
@@ -0,0 +1,61 @@
+# services/_decision_kernels.py - 의사결정 엔진 수치 커널 (Numba 사용 가능 시 컴파일)
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba 미설치 시 일반 파이썬 함수로 실행
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+# trend_kernel 결과 코드 순서
+TREND_NAMES = ("stable", "rising", "falling")
+
+@njit(nogil=True, cache=True)
+def trend_kernel(levels):
+    """최근 수위 배열의 트렌드 코드, 변화율, 신뢰도 계산"""
+    n = levels.shape[0]
+    if n < 2:
+        return 0, 0.0, 0.0
+
+    # 간단한 차이 기반 트렌드 계산
+    rate = (levels[n - 1] - levels[0]) / n
+    if abs(rate) < 0.5:
+        trend = 0
+    elif rate > 0:
+        trend = 1
+    else:
+        trend = 2
+
+    confidence = min(1.0, abs(rate) / 10.0)  # 기울기에 따른 신뢰도
+    return trend, rate, confidence
+
+@njit(parallel=True, nogil=True, cache=True)
+def batch_trend_kernel(levels_mat, counts):
+    """여러 배수지의 트렌드 일괄 계산 (행마다 앞쪽 counts[i]개 수위만 사용, 2개 미만이면 stable/0)"""
+    n_rows = levels_mat.shape[0]
+    out_trend = np.zeros(n_rows, np.int8)
+    out_rate = np.zeros(n_rows)
+    out_conf = np.zeros(n_rows)
+    
+    for i in prange(n_rows):
+        n = counts[i]
+        if n < 2:
+            continue
+        
+        rate = (levels_mat[i, n - 1] - levels_mat[i, 0]) / n
+        out_rate[i] = rate
+        if abs(rate) < 0.5:
+            out_trend[i] = 0
+        elif rate > 0:
+            out_trend[i] = 1
+        else:
+            out_trend[i] = 2
+        out_conf[i] = min(1.0, abs(rate) / 10.0)
+    
+    return out_trend, out_rate, out_conf
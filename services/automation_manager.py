@@ -6,17 +6,26 @@ import json
 import signal
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from dataclasses import dataclass
 
 from services.real_time_monitor import RealtimeMonitor, get_monitor
-from services.decision_engine import IntelligentDecisionEngine, Decision, ActionType
+from services.decision_engine import IntelligentDecisionEngine, Decision, ActionType, UrgencyLevel
 from tools.water_level_monitoring_tool import WaterLevelMonitor
 from utils.logger import setup_logger
 from storage.postgresql_storage import PostgreSQLStorage
 
 logger = setup_logger(__name__)
 
+# 긴급도 값 -> 이름 테이블 (Enum 속성 조회 대신 사용)
+URGENCY_NAME = {u.value: u.name for u in UrgencyLevel}
+
+# 자동 실행 최소 긴급도 (safety_mode 여부별)
+AUTO_EXECUTE_MIN_URGENCY = {
+    True: UrgencyLevel.CRITICAL.value,   # 안전 모드: CRITICAL 이상
+    False: UrgencyLevel.MEDIUM.value,    # 일반 모드: MEDIUM 이상
+}
+
 @dataclass
 class AutomationEvent:
     timestamp: datetime
@@ -36,6 +45,8 @@ class AutomationManager:
         # 상태 관리
         self.is_automation_active = False
         self.automation_thread = None
+        self._stop_event = threading.Event()
+        self._previous_signal_handlers = {}
         self.last_decisions = {}  # reservoir_id -> Decision
         self.historical_data = {}  # reservoir_id -> List[Dict]
         self.event_history = []
@@ -72,6 +83,8 @@ class AutomationManager:
             
             # 자동화 루프 시작
             self.is_automation_active = True
+            self._stop_event.clear()
+            self._install_signal_handlers()
             self.automation_thread = threading.Thread(
                 target=self._automation_loop, 
                 daemon=True,
@@ -96,6 +109,7 @@ class AutomationManager:
         logger.info("🛑 자동화 시스템 중단 중...")
         
         self.is_automation_active = False
+        self._stop_event.set()
         
         # 모니터링 중단
         self.monitor.stop_monitoring()
@@ -110,6 +124,32 @@ class AutomationManager:
         
         logger.info("자동화 시스템 중단 완료")
 
+    def _install_signal_handlers(self):
+        """SIGINT/SIGTERM 수신 시 자동화 시스템을 정상 종료하도록 핸들러 등록"""
+        # signal.signal은 메인 스레드에서만 호출 가능 (Streamlit 스크립트 스레드 등은 건너뜀)
+        if threading.current_thread() is not threading.main_thread():
+            return
+        
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                previous = signal.signal(signum, self._handle_shutdown_signal)
+                if previous is not self._handle_shutdown_signal:
+                    self._previous_signal_handlers[signum] = previous
+            except (ValueError, OSError) as e:
+                logger.debug(f"시그널 핸들러 등록 실패 ({signum}): {e}")
+
+    def _handle_shutdown_signal(self, signum, frame):
+        """종료 시그널 처리: 자동화 중단 후 기존 핸들러로 위임"""
+        logger.info(f"종료 시그널 수신 ({signal.Signals(signum).name})")
+        if self.is_automation_active:
+            self.stop_automation()
+        
+        previous = self._previous_signal_handlers.get(signum, signal.SIG_DFL)
+        if callable(previous):
+            previous(signum, frame)
+        elif previous != signal.SIG_IGN:
+            sys.exit(128 + signum)
+
     def _automation_loop(self):
         """메인 자동화 루프"""
         logger.info("자동화 루프 시작")
@@ -143,8 +183,8 @@ class AutomationManager:
                     "error": str(e)
                 }, "CRITICAL")
             
-            # 다음 사이클까지 대기
-            time.sleep(self.config["automation_interval"])
+            # 다음 사이클까지 대기 (중단 요청 시 즉시 깨어남)
+            self._stop_event.wait(self.config["automation_interval"])
 
     def _collect_current_status(self) -> Dict[str, Any]:
         """현재 시스템 상태 수집"""
@@ -184,6 +224,8 @@ class AutomationManager:
             
             # 3. 의사결정 기록
             self.last_decisions[reservoir_id] = decision
+            urgency_value = decision.urgency.value
+            urgency_name = URGENCY_NAME[urgency_value]
             
             # 4. 의사결정 로깅
             self._log_event("DECISION", reservoir_id, {
@@ -191,15 +233,15 @@ class AutomationManager:
                     "action": decision.action.value,
                     "target_pumps": decision.target_pumps,
                     "confidence": decision.confidence,
-                    "urgency": decision.urgency.name,
+                    "urgency": urgency_name,
                     "reasoning": decision.reasoning
                 },
                 "current_level": reservoir_data.get('current_level'),
-                "predicted_outcome": decision.predicted_outcome
-            }, decision.urgency.name)
+                "predicted_outcome": decision.predicted_outcome.to_dict()
+            }, urgency_name)
             
             # 5. 자동 실행 여부 결정
-            should_auto_execute = self._should_auto_execute(decision)
+            should_auto_execute = self._should_auto_execute(decision, urgency_value)
             
             if should_auto_execute:
                 # 6. 자동 실행
@@ -218,14 +260,13 @@ class AutomationManager:
                 "error": str(e)
             }, "HIGH")
 
-    def _should_auto_execute(self, decision: Decision) -> bool:
+    def _should_auto_execute(self, decision: Decision, urgency_value: Optional[int] = None) -> bool:
         """자동 실행 여부 판단"""
-        # 안전 모드에서는 CRITICAL 이상만 자동 실행
-        if self.config["safety_mode"]:
-            return decision.urgency.value >= 4  # CRITICAL 이상
+        if urgency_value is None:
+            urgency_value = decision.urgency.value
         
-        # 일반 모드에서는 MEDIUM 이상 자동 실행
-        return decision.urgency.value >= 2
+        # 안전 모드에서는 CRITICAL 이상, 일반 모드에서는 MEDIUM 이상 자동 실행
+        return urgency_value >= AUTO_EXECUTE_MIN_URGENCY[bool(self.config["safety_mode"])]
 
     def _execute_decision(self, decision: Decision):
         """의사결정 실행"""
@@ -237,22 +278,16 @@ class AutomationManager:
             logger.info(f"[{reservoir_id}] 자동 실행: {action.value} - {target_pumps}")
             
             if action == ActionType.EMERGENCY_ALL_ON:
-                # 모든 펌프 긴급 가동
-                for pump_name in target_pumps:
-                    result = self.monitor.manual_override(reservoir_id, pump_name, "ON")
-                    self._log_action_result(reservoir_id, pump_name, "ON", result)
+                # 모든 펌프 긴급 가동 (일괄 제어로 아두이노 왕복 1회)
+                self._override_pumps(reservoir_id, target_pumps, "ON")
                     
             elif action == ActionType.PUMP_ON:
                 # 지정된 펌프 가동
-                for pump_name in target_pumps:
-                    result = self.monitor.manual_override(reservoir_id, pump_name, "ON")
-                    self._log_action_result(reservoir_id, pump_name, "ON", result)
+                self._override_pumps(reservoir_id, target_pumps, "ON")
                     
             elif action == ActionType.PUMP_OFF:
                 # 지정된 펌프 중단
-                for pump_name in target_pumps:
-                    result = self.monitor.manual_override(reservoir_id, pump_name, "OFF")
-                    self._log_action_result(reservoir_id, pump_name, "OFF", result)
+                self._override_pumps(reservoir_id, target_pumps, "OFF")
                     
             elif action == ActionType.MAINTAIN:
                 # 현상 유지
@@ -271,6 +306,15 @@ class AutomationManager:
                 "error": str(e)
             }, "HIGH")
 
+    def _override_pumps(self, reservoir_id: str, target_pumps: Sequence[str], state: str) -> List[Dict[str, Any]]:
+        """대상 펌프 일괄 제어 및 결과 로깅"""
+        results = self.monitor.manual_override_many(
+            reservoir_id, [(pump_name, state) for pump_name in target_pumps]
+        )
+        for pump_name, result in zip(target_pumps, results):
+            self._log_action_result(reservoir_id, pump_name, state, result)
+        return results
+
     def _request_manual_approval(self, decision: Decision):
         """수동 승인 요청"""
         logger.warning(f"[{decision.reservoir_id}] 수동 승인 필요: {decision.action.value}")
@@ -332,10 +376,10 @@ class AutomationManager:
         if reservoir_id not in self.historical_data:
             self.historical_data[reservoir_id] = []
         
-        # 타임스탬프 추가
+        # 의사결정 엔진이 사용하는 수위 값만 보관 (원본 dict 전체 복사 방지)
         data_with_timestamp = {
-            **reservoir_data,
-            "timestamp": datetime.now().isoformat()
+            "current_level": reservoir_data.get('current_level'),
+            "timestamp": time.time()
         }
         
         self.historical_data[reservoir_id].append(data_with_timestamp)
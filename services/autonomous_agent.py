@@ -1,22 +1,51 @@
 # services/autonomous_agent.py - LM Studio 기반 자율적 자동화 AI 에이전트
 
 import asyncio
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
-import json
+import hashlib
+import re
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Deque
 from dataclasses import dataclass
 
+import numpy as np
+import orjson
+
 from models.lm_studio import LMStudioClient
 from services.logging_system import get_automation_logger, LogLevel, EventType
 from services.database_connector import get_database_connector
 from utils.logger import setup_logger
 from enum import Enum
-from dataclasses import dataclass
 
 logger = setup_logger(__name__)
 
+# LLM 응답의 ```json ... ``` 코드 블록에서 JSON 객체 추출
+_FENCE = re.compile(rb"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+
+# AI 의사결정 요청 사용자 메시지 템플릿 (상태는 공백 없는 JSON으로 삽입)
+_USER_TMPL = "현재 시스템 상태:\n{}\n\n위 상태를 분석하고 필요한 조치를 JSON 형식으로 응답해주세요."
+_RESERVOIR_USER_TMPL = "현재 배수지 상태:\n{}\n\n위 상태를 분석하고 필요한 조치를 JSON 형식으로 응답해주세요."
+
+# 알림 ID 생성 시 타임스탬프에서 제거할 문자
+_ID_TRANS = str.maketrans('', '', ':- ')
+
+def _parse_log_timestamp(timestamp) -> datetime:
+    """로그 타임스탬프를 datetime으로 변환 (ISO 문자열이 아니면 현재 시간)"""
+    if isinstance(timestamp, str):
+        if 'T' in timestamp:
+            try:
+                return datetime.fromisoformat(timestamp)
+            except ValueError:
+                pass
+        return datetime.now()
+    if hasattr(timestamp, 'strftime'):
+        return timestamp
+    return datetime.now()
+
 class AlertLevel(Enum):
     """알림 레벨"""
     INFO = "info"
@@ -24,7 +53,7 @@ class AlertLevel(Enum):
     CRITICAL = "critical"
     EMERGENCY = "emergency"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserNotification:
     """사용자 알림"""
     id: str
@@ -38,7 +67,7 @@ class UserNotification:
 # 글로벌 상태는 utils/state_manager.py로 이관됨
 from utils.state_manager import get_state_manager
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemState:
     """시스템 현재 상태"""
     timestamp: datetime
@@ -48,6 +77,68 @@ class SystemState:
     system_health: str
     automation_active: bool
 
+# 배수지별 판단 병합 시 우선순위 (높을수록 심각)
+DECISION_SEVERITY = {"NORMAL": 0, "MAINTENANCE": 1, "CAUTION": 2, "EMERGENCY": 3}
+PRIORITY_ORDER = {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 3}
+
+# AI 액션 -> 펌프 상태
+PUMP_ACTION_STATUS = {"PUMP_ON": "ON", "PUMP_OFF": "OFF", "PUMP_AUTO": "AUTO"}
+
+# 펌프 제어 결과 (Arduino 성공, DB 성공) -> (콘솔 레벨, 자동화 로그 레벨, 이벤트 타입, 콘솔 메시지, 로그 메시지)
+PUMP_RESULT_LOG = {
+    (True, True): (logging.INFO, LogLevel.INFO, EventType.ACTION, "제어 완전 성공", "제어 완전 성공"),
+    (True, False): (logging.INFO, LogLevel.WARNING, EventType.ACTION, "하드웨어 제어 성공 (DB 실패)", "하드웨어 제어 성공 (DB 업데이트 실패)"),
+    (False, True): (logging.WARNING, LogLevel.WARNING, EventType.ACTION, "DB 업데이트만 성공 (하드웨어 실패)", "DB 업데이트만 성공 (Arduino 연결 없음)"),
+    (False, False): (logging.ERROR, LogLevel.ERROR, EventType.ERROR, "제어 완전 실패", "제어 완전 실패"),
+}
+
+# LM Studio(llama.cpp) 프롬프트 KV 캐시 재사용 힌트 (시스템 프롬프트는 매 호출 동일하게 유지)
+LLM_CACHE_HINTS = {"cache_prompt": True}
+
+# 자유 서술 필드 최대 길이 (한글은 토큰 소모가 커서 max_tokens 안에서 JSON이 잘리지 않도록 제한)
+DECISION_REASON_MAX_CHARS = 80
+DECISION_MESSAGE_MAX_CHARS = 120
+
+# AI 의사결정 응답 스키마 (LM Studio 구조화 출력으로 JSON 형식을 강제)
+DECISION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "agent_decision",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "decision": {"type": "string", "enum": ["NORMAL", "CAUTION", "EMERGENCY", "MAINTENANCE"]},
+                "actions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "reservoir_id": {"type": "string"},
+                            "action": {"type": "string", "enum": ["PUMP_ON", "PUMP_OFF", "PUMP_AUTO", "ALERT"]},
+                            "reason": {"type": "string", "maxLength": DECISION_REASON_MAX_CHARS}
+                        },
+                        "required": ["reservoir_id", "action", "reason"],
+                        "additionalProperties": False
+                    }
+                },
+                "message": {"type": "string", "maxLength": DECISION_MESSAGE_MAX_CHARS},
+                "priority": {"type": "string", "enum": ["LOW", "MEDIUM", "HIGH", "CRITICAL"]}
+            },
+            "required": ["decision", "actions", "message", "priority"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# 배수지 -> (아두이노 펌프 번호, ON 명령, OFF 명령)
+DEFAULT_PUMP_COMMANDS = (1, "pump1_on", "pump1_off")
+PUMP_COMMANDS = {
+    "automation": DEFAULT_PUMP_COMMANDS,
+    "reservoir_1": DEFAULT_PUMP_COMMANDS,
+    "reservoir_2": (2, "pump2_on", "pump2_off"),
+}
+
 class AutonomousAgent:
     """LM Studio 기반 자율적 AI 에이전트"""
     
@@ -55,14 +146,39 @@ class AutonomousAgent:
     DECISION_INTERVAL_SECONDS = 30  # 의사결정 주기 (초)
     ERROR_RETRY_DELAY_SECONDS = 10  # 오류 시 재시도 지연 시간 (초)
     MAX_RETRY_ATTEMPTS = 3  # 최대 재시도 횟수
+    RECENT_ALERTS_SIZE = 32  # 최근 알림 보관 개수
+    WARNING_LEVEL_RATIO = 0.8  # 경보 기준 대비 주의 수위 비율
+    STATE_SAVE_EVERY_CYCLES = 10  # 배수지 스냅샷 파일 저장 주기 (주기 수)
     
     def __init__(self, lm_client: LMStudioClient):
         self.lm_client = lm_client
         self.automation_logger = get_automation_logger()
+        self.state_manager = get_state_manager()
+        self._db = get_database_connector()
         self.is_running = False
         self.monitoring_thread = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        
+        # 블로킹 I/O 오프로드용 스레드 풀 (시리얼 포트는 스레드 안전하지 않으므로 아두이노는 전용 단일 스레드)
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent-io")
+        self._arduino_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-arduino")
+        
+        # 상태가 변하지 않았을 때 LLM 호출을 건너뛰기 위한 직전 결정 캐시
+        self._last_decision_key: Optional[bytes] = None
+        self._last_decision: Optional[Dict[str, Any]] = None
         self.decision_interval = self.DECISION_INTERVAL_SECONDS
         
+        # 최근 경고 이상 로그 (매 주기 로그 조회 대신 메모리 링 버퍼 사용)
+        self._recent_alerts: Deque[Dict[str, Any]] = deque(maxlen=self.RECENT_ALERTS_SIZE)
+        
+        # 최근 배수지 데이터 스냅샷 (상태 파일에는 STATE_SAVE_EVERY_CYCLES 주기마다 저장)
+        self._reservoir_snapshot: Dict[str, Dict[str, Any]] = {}
+        self._cycles_since_state_save = self.STATE_SAVE_EVERY_CYCLES
+        
+        # 결정 실행 중 발생한 로그를 모아 실행 끝에 한 번에 기록 (None이면 즉시 기록)
+        self._log_batch: Optional[List[tuple]] = None
+        
         # AI 에이전트 프롬프트
         self.system_prompt = """당신은 배수지 수위 관리 전문 AI 에이전트입니다.
 
@@ -85,15 +201,40 @@ class AutonomousAgent:
     {
       "reservoir_id": "대상 배수지",
       "action": "실행할 작업 (PUMP_ON/PUMP_OFF/PUMP_AUTO/ALERT)",
-      "reason": "판단 이유"
+      "reason": "판단 이유 (80자 이내)"
     }
   ],
-  "message": "상황 요약 메시지",
+  "message": "상황 요약 메시지 (120자 이내)",
   "priority": "우선순위 (LOW/MEDIUM/HIGH/CRITICAL)"
 }
 
 현재 시스템 상태를 분석하고 필요한 조치를 결정하세요."""
 
+        # 배수지별 병렬 판단용 프롬프트 (배수지 1곳만 분석)
+        self.reservoir_system_prompt = """당신은 배수지 수위 관리 전문 AI 에이전트입니다.
+
+주어진 배수지 1곳의 상태만 분석하고 필요한 조치를 결정하세요.
+
+판단 기준:
+- 수위 95% 이상: 긴급 상황 (즉시 펌프 ON)
+- 수위 80-95%: 주의 상황 (펌프 AUTO 또는 ON)
+- 수위 20% 미만: 점검 필요 (펌프 OFF)
+- 펌프 연속 실패: 알림 발송
+
+응답 형식: JSON만 출력
+{
+  "decision": "판단 결과 (NORMAL/CAUTION/EMERGENCY/MAINTENANCE)",
+  "actions": [
+    {
+      "reservoir_id": "대상 배수지 (주어진 배수지만)",
+      "action": "실행할 작업 (PUMP_ON/PUMP_OFF/PUMP_AUTO/ALERT)",
+      "reason": "판단 이유 (80자 이내)"
+    }
+  ],
+  "message": "상황 요약 메시지 (120자 이내)",
+  "priority": "우선순위 (LOW/MEDIUM/HIGH/CRITICAL)"
+}"""
+
     def start_monitoring(self):
         """자동화 모니터링 시작"""
         if self.is_running:
@@ -101,8 +242,25 @@ class AutonomousAgent:
             return False
         
         self.is_running = True
-        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitoring_thread.start()
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop is not None:
+            # 이미 실행 중인 이벤트 루프가 있으면 태스크로 등록
+            self._loop = loop
+            self._task = loop.create_task(self._amonitoring_loop())
+        else:
+            # 이벤트 루프가 없으면 전용 스레드에서 루프 실행
+            self.monitoring_thread = threading.Thread(
+                target=asyncio.run,
+                args=(self._amonitoring_loop(),),
+                daemon=True,
+                name="AutonomousAgentLoop"
+            )
+            self.monitoring_thread.start()
         
         self.automation_logger.info(EventType.SYSTEM, "system", "자율적 AI 에이전트 모니터링 시작")
         logger.info("자율적 AI 에이전트가 시작되었습니다")
@@ -115,80 +273,108 @@ class AutonomousAgent:
             return False
         
         self.is_running = False
-        if self.monitoring_thread:
+        if self._task and self._loop and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass  # 루프가 이미 종료됨
+        if self.monitoring_thread and self.monitoring_thread is not threading.current_thread():
             self.monitoring_thread.join(timeout=5)
         
         self.automation_logger.info(EventType.SYSTEM, "system", "자율적 AI 에이전트 모니터링 중지")
         logger.info("자율적 AI 에이전트가 중지되었습니다")
         return True
     
-    def _monitoring_loop(self):
-        """메인 모니터링 루프"""
+    async def _amonitoring_loop(self):
+        """메인 모니터링 루프 (asyncio 태스크)"""
         logger.info("AI 에이전트 모니터링 루프 시작")
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._task = asyncio.current_task()
         
-        while self.is_running:
+        # 주기 기준 시각 (LLM 호출 시간만큼 주기가 밀리지 않도록 단조 시계 기준으로 대기)
+        deadline = loop.time()
+        
+        try:
+            while self.is_running:
+                try:
+                    # 글로벌 상태는 주기당 한 번만 로드하여 하위 단계에 전달
+                    state = await loop.run_in_executor(self._io_pool, self.state_manager.load_state)
+                    
+                    # 현재 시스템 상태 수집
+                    system_state = await self._acollect_system_state(state)
+                    
+                    # AI에게 상황 분석 요청
+                    decision = await self._amake_ai_decision(system_state, state)
+                    
+                    # 재사용된 결정은 이미 실행했으므로 펌프 명령/알림을 반복하지 않음
+                    if decision and not decision.get('cached'):
+                        # AI 결정사항 실행
+                        await self._aexecute_decision(decision, state)
+                    
+                    # 다음 판단까지 대기 (주기를 넘겼으면 밀린 주기를 몰아서 돌지 않고 기준 재설정)
+                    deadline += self.decision_interval
+                    delay = deadline - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        deadline = loop.time()
+                    
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error("모니터링 루프 오류: %s", e)
+                    self._log_event(LogLevel.ERROR, EventType.ERROR, "system", f"모니터링 오류: {str(e)}")
+                    await asyncio.sleep(self.ERROR_RETRY_DELAY_SECONDS)  # 오류 시 재시도 지연
+                    deadline = loop.time()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            # 비동기 클라이언트의 커넥션은 현재 루프에 묶여 있으므로 루프 종료 전에 정리
             try:
-                # 현재 시스템 상태 수집
-                system_state = self._collect_system_state()
-                
-                # AI에게 상황 분석 요청
-                decision = self._make_ai_decision(system_state)
-                
-                if decision:
-                    # AI 결정사항 실행
-                    self._execute_decision(decision)
-                
-                # 다음 판단까지 대기
-                time.sleep(self.decision_interval)
-                
+                await self.lm_client.aclose()
             except Exception as e:
-                logger.error(f"모니터링 루프 오류: {e}")
-                self.automation_logger.error(EventType.ERROR, "system", f"모니터링 오류: {str(e)}")
-                time.sleep(self.ERROR_RETRY_DELAY_SECONDS)  # 오류 시 재시도 지연
+                logger.debug("비동기 LM 클라이언트 종료 오류: %s", e)
+            self._task = None
         
         logger.info("AI 에이전트 모니터링 루프 종료")
     
-    def _collect_system_state(self) -> SystemState:
+    async def _acollect_system_state(self, state: Optional[Dict[str, Any]] = None) -> SystemState:
+        """현재 시스템 상태 수집 (DB/파일 I/O는 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, self._collect_system_state, state)
+    
+    def _collect_system_state(self, state: Optional[Dict[str, Any]] = None) -> SystemState:
         """현재 시스템 상태 수집 - 실제 데이터베이스 기반"""
         try:
+            if state is None:
+                state = self.state_manager.load_state()
+            
             # 데이터베이스에서 실시간 데이터 수집
-            db_connector = get_database_connector()
-            reservoir_data = db_connector.get_latest_water_data()
+            reservoir_data = self._db.get_latest_water_data()
             
             if not reservoir_data:
-                # 데이터베이스에서 데이터를 가져올 수 없는 경우 글로벌 상태 사용
+                # 데이터베이스에서 데이터를 가져올 수 없는 경우 메모리 스냅샷 -> 글로벌 상태 순으로 사용
                 logger.warning("데이터베이스에서 데이터 조회 실패, 글로벌 상태 사용")
-                state_manager = get_state_manager()
-                state = state_manager.load_state()
-                reservoir_data = state.get('reservoir_data', {})
+                reservoir_data = self._reservoir_snapshot or state.get('reservoir_data', {})
             else:
-                # 성공적으로 데이터베이스에서 가져온 경우 글로벌 상태 업데이트
-                state_manager = get_state_manager()
-                state = state_manager.load_state()
-                state['reservoir_data'] = reservoir_data
-                state_manager.save_state(state)
-                logger.info(f"데이터베이스에서 {len(reservoir_data)}개 배수지 데이터 수집 완료")
-            
-            state_manager = get_state_manager()
-            state = state_manager.load_state()
+                # 성공적으로 데이터베이스에서 가져온 경우 메모리 스냅샷 갱신, 파일 저장은 N주기마다
+                self._reservoir_snapshot = reservoir_data
+                # 상태 파일은 json으로 저장하므로 스냅샷 객체를 딕셔너리로 변환
+                state['reservoir_data'] = {rid: data.to_dict() for rid, data in reservoir_data.items()}
+                if self._cycles_since_state_save >= self.STATE_SAVE_EVERY_CYCLES:
+                    self.state_manager.save_state(state)
+                    self._cycles_since_state_save = 0
+                self._cycles_since_state_save += 1
+                logger.info("데이터베이스에서 %d개 배수지 데이터 수집 완료", len(reservoir_data))
+            
             arduino_connected = state.get('arduino_connected', False)
             
             # 최근 알림 조회
-            recent_logs = self.automation_logger.get_recent_logs(limit=10)
-            recent_alerts = [log for log in recent_logs if log.get('level') in ['WARNING', 'ERROR', 'CRITICAL']]
+            recent_alerts = list(self._recent_alerts)
             
             # 시스템 건강 상태 판단
-            critical_reservoirs = [
-                res_id for res_id, data in reservoir_data.items() 
-                if data['water_level'] >= data['alert_level']
-            ]
-            
-            if critical_reservoirs:
-                system_health = "CRITICAL"
-            elif any(data['water_level'] >= data['alert_level'] * 0.8 for data in reservoir_data.values()):
-                system_health = "WARNING"
-            else:
-                system_health = "NORMAL"
+            system_health = self._classify_health(reservoir_data)
             
             return SystemState(
                 timestamp=datetime.now(),
@@ -200,7 +386,7 @@ class AutonomousAgent:
             )
             
         except Exception as e:
-            logger.error(f"시스템 상태 수집 오류: {e}")
+            logger.error("시스템 상태 수집 오류: %s", e)
             # 기본값 반환
             return SystemState(
                 timestamp=datetime.now(),
@@ -211,87 +397,231 @@ class AutonomousAgent:
                 automation_active=False
             )
     
-    def _make_ai_decision(self, system_state: SystemState) -> Optional[Dict[str, Any]]:
-        """AI에게 의사결정 요청"""
+    def _classify_health(self, reservoir_data: Dict[str, Any]) -> str:
+        """배수지 수위/경보 기준을 배열로 비교해 시스템 건강 상태 판단"""
+        count = len(reservoir_data)
+        if not count:
+            return "NORMAL"
+        
+        # 수위와 경보 기준을 한 번에 배열로 모아 벡터 비교
+        levels = np.fromiter((data['water_level'] for data in reservoir_data.values()), dtype=np.float64, count=count)
+        alert_levels = np.fromiter((data['alert_level'] for data in reservoir_data.values()), dtype=np.float64, count=count)
+        
+        if (levels >= alert_levels).any():
+            return "CRITICAL"
+        if (levels >= alert_levels * self.WARNING_LEVEL_RATIO).any():
+            return "WARNING"
+        return "NORMAL"
+    
+    def _build_state_summary(self, system_state: SystemState, global_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """시스템 상태를 AI가 이해할 수 있는 형태로 변환"""
+        # 글로벌 상태 가져오기 (주기 내에서 이미 로드한 상태가 있으면 재사용)
+        if global_state is None:
+            global_state = self.state_manager.load_state()
+        
+        return {
+            "timestamp": system_state.timestamp.isoformat(),
+            "reservoirs": system_state.reservoir_data,
+            "arduino_connected": system_state.arduino_connected,
+            "system_health": system_state.system_health,
+            "recent_alerts_count": len(system_state.recent_alerts),
+            "simulation_mode": global_state.get('simulation_mode', True)
+        }
+    
+    def _build_decision_messages(self, system_state: SystemState, global_state: Optional[Dict[str, Any]] = None):
+        """AI 의사결정 요청 메시지 구성 (state_summary, messages 반환)"""
+        state_summary = self._build_state_summary(system_state, global_state)
+        user_message = _USER_TMPL.format(orjson.dumps(state_summary).decode())
+        
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": user_message}
+        ]
+        return state_summary, messages
+    
+    def _parse_ai_response(self, response) -> Optional[Dict[str, Any]]:
+        """LM Studio 응답에서 의사결정 JSON 추출"""
         try:
-            # 글로벌 상태 가져오기
-            state_manager = get_state_manager()
-            global_state = state_manager.load_state()
-            
-            # 시스템 상태를 AI가 이해할 수 있는 형태로 변환
-            state_summary = {
-                "timestamp": system_state.timestamp.isoformat(),
-                "reservoirs": system_state.reservoir_data,
-                "arduino_connected": system_state.arduino_connected,
-                "system_health": system_state.system_health,
-                "recent_alerts_count": len(system_state.recent_alerts),
-                "simulation_mode": global_state.get('simulation_mode', True)
-            }
+            ai_response = response.choices[0].message.content
+        except (AttributeError, IndexError, TypeError):
+            return None
+        
+        # JSON 파싱 시도 (구조화 출력이면 원문 그대로 JSON)
+        buf = ai_response.encode()
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass
+        
+        try:
+            # 구조화 출력을 지원하지 않는 서버 대비: 코드 블록에서 JSON 부분만 추출
+            match = _FENCE.search(buf)
+            return orjson.loads(match.group(1) if match else buf.strip())
             
-            user_message = f"""현재 시스템 상태:
-{json.dumps(state_summary, indent=2, ensure_ascii=False)}
+        except orjson.JSONDecodeError as e:
+            logger.error("AI 응답 JSON 파싱 실패: %s", e)
+            logger.error("AI 원본 응답: %s", ai_response)
+            self._log_event(LogLevel.ERROR, EventType.ERROR, "system", f"AI 응답 파싱 실패: {str(e)}")
+            return None
+    
+    def _log_event(self, level: LogLevel, event_type: EventType, reservoir_id: str, message: str, details: Dict[str, Any] = None):
+        """자동화 로그 기록 + 경고 이상은 최근 알림 버퍼에 추가"""
+        batch = self._log_batch
+        if batch is not None:
+            batch.append((level, event_type, reservoir_id, message, details))
+        else:
+            self.automation_logger.log(level, event_type, reservoir_id, message, details)
+        if level.value >= LogLevel.WARNING.value:
+            self._recent_alerts.append({
+                "level": level.name,
+                "event_type": event_type.value,
+                "message": message,
+                "ts": time.time()
+            })
 
-위 상태를 분석하고 필요한 조치를 JSON 형식으로 응답해주세요."""
+    def _log_ai_decision(self, decision: Dict[str, Any], state_summary: Dict[str, Any]):
+        """의사결정 로그 기록"""
+        self._log_event(
+            LogLevel.INFO,
+            EventType.DECISION,
+            "system",
+            f"AI 판단: {decision.get('decision', 'UNKNOWN')} - {decision.get('message', '')}",
+            {"ai_decision": decision, "system_state": state_summary}
+        )
+    
+    def _make_ai_decision(self, system_state: SystemState, state: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """AI에게 의사결정 요청"""
+        try:
+            state_summary, messages = self._build_decision_messages(system_state, state)
             
             # LM Studio에 요청 (OpenAI 클라이언트 방식)
             try:
                 response = self.lm_client.client.chat.completions.create(
                     model=self.lm_client.model,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": user_message}
-                    ],
+                    messages=messages,
                     temperature=0.3,
-                    max_tokens=1000
+                    max_tokens=512,
+                    response_format=DECISION_RESPONSE_FORMAT,
+                    extra_body=LLM_CACHE_HINTS
                 )
             except Exception as api_error:
-                logger.error(f"LM Studio API 호출 오류: {api_error}")
+                logger.error("LM Studio API 호출 오류: %s", api_error)
                 return None
             
-            if response and hasattr(response, 'choices') and len(response.choices) > 0:
-                ai_response = response.choices[0].message.content
-                
-                # JSON 파싱 시도
-                try:
-                    # JSON 부분만 추출 (```json 코드 블록 처리)
-                    if "```json" in ai_response:
-                        json_start = ai_response.find("```json") + 7
-                        json_end = ai_response.find("```", json_start)
-                        ai_response = ai_response[json_start:json_end].strip()
-                    elif "```" in ai_response:
-                        json_start = ai_response.find("```") + 3
-                        json_end = ai_response.rfind("```")
-                        ai_response = ai_response[json_start:json_end].strip()
-                    
-                    decision = json.loads(ai_response)
-                    
-                    # 의사결정 로그 기록
-                    self.automation_logger.log(
-                        LogLevel.INFO,
-                        EventType.DECISION,
-                        "system",
-                        f"AI 판단: {decision.get('decision', 'UNKNOWN')} - {decision.get('message', '')}",
-                        {"ai_decision": decision, "system_state": state_summary}
-                    )
-                    
-                    return decision
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"AI 응답 JSON 파싱 실패: {e}")
-                    logger.error(f"AI 원본 응답: {ai_response}")
-                    self.automation_logger.error(EventType.ERROR, "system", f"AI 응답 파싱 실패: {str(e)}")
-                    return None
+            decision = self._parse_ai_response(response)
+            if decision:
+                self._log_ai_decision(decision, state_summary)
+            return decision
             
+        except Exception as e:
+            logger.error("AI 의사결정 요청 오류: %s", e)
+            self._log_event(LogLevel.ERROR, EventType.ERROR, "system", f"AI 의사결정 오류: {str(e)}")
             return None
+    
+    @staticmethod
+    def _decision_cache_key(system_state: SystemState) -> bytes:
+        """판단에 영향을 주는 상태 값(수위/경보 수위 0.1 단위, 아두이노 연결, 건강 상태)의 해시"""
+        levels = sorted(
+            (rid, round(data.get('water_level', 0), 1), round(data.get('alert_level', 0), 1))
+            for rid, data in system_state.reservoir_data.items()
+        )
+        material = repr((levels, system_state.arduino_connected, system_state.system_health))
+        return hashlib.blake2b(material.encode(), digest_size=16).digest()
+    
+    async def _amake_ai_decision(self, system_state: SystemState, state: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """AI에게 의사결정 요청 (배수지별 병렬 요청 후 병합)"""
+        try:
+            # 직전 주기와 상태가 같으면 LLM 호출 없이 이전 결정 재사용
+            key = self._decision_cache_key(system_state)
+            if key == self._last_decision_key and self._last_decision is not None:
+                logger.debug("시스템 상태 변화 없음 - 이전 AI 결정 재사용 (실행 생략)")
+                return {**self._last_decision, "cached": True}
+            
+            state_summary = self._build_state_summary(system_state, state)
+            
+            decision = await self._decide_all(state_summary)
+            if decision:
+                self._log_ai_decision(decision, state_summary)
+                self._last_decision_key = key
+                self._last_decision = decision
+            return decision
             
         except Exception as e:
-            logger.error(f"AI 의사결정 요청 오류: {e}")
-            self.automation_logger.error(EventType.ERROR, "system", f"AI 의사결정 오류: {str(e)}")
+            logger.error("AI 의사결정 요청 오류: %s", e)
+            self._log_event(LogLevel.ERROR, EventType.ERROR, "system", f"AI 의사결정 오류: {str(e)}")
             return None
     
-    def _execute_decision(self, decision: Dict[str, Any]):
+    async def _decide_all(self, state_summary: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """배수지별 LLM 요청을 동시에 보내고 결과를 하나의 결정으로 병합"""
+        reservoirs = state_summary.get("reservoirs") or {}
+        if not reservoirs:
+            return None
+        
+        shared_context = {key: value for key, value in state_summary.items() if key != "reservoirs"}
+        reservoir_ids = list(reservoirs)
+        results = await asyncio.gather(
+            *(self._decide_one(rid, reservoirs[rid], shared_context) for rid in reservoir_ids),
+            return_exceptions=True
+        )
+        
+        decisions = []
+        for rid, result in zip(reservoir_ids, results):
+            if isinstance(result, BaseException):
+                logger.error("[%s] AI 판단 요청 오류: %s", rid, result)
+            elif result:
+                decisions.append(result)
+        
+        if not decisions:
+            return None
+        return self._merge_decisions(decisions)
+    
+    async def _decide_one(self, reservoir_id: str, reservoir_data: Dict[str, Any], shared_context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """단일 배수지에 대한 AI 판단 요청"""
+        summary = {**shared_context, "reservoir_id": reservoir_id, "reservoir": reservoir_data}
+        user_message = _RESERVOIR_USER_TMPL.format(orjson.dumps(summary).decode())
+        
+        response = await self.lm_client.aclient.chat.completions.create(
+            model=self.lm_client.model,
+            messages=[
+                {"role": "system", "content": self.reservoir_system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.3,
+            max_tokens=512,
+            response_format=DECISION_RESPONSE_FORMAT,
+            extra_body=LLM_CACHE_HINTS
+        )
+        
+        decision = self._parse_ai_response(response)
+        if decision:
+            # 다른 배수지에 대한 조치가 섞여 들어오지 않도록 대상 고정
+            for action in decision.get('actions', []):
+                action['reservoir_id'] = reservoir_id
+        return decision
+    
+    def _merge_decisions(self, decisions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """배수지별 결정을 가장 심각한 판단/우선순위 기준으로 병합"""
+        return {
+            "decision": max(
+                (d.get('decision', 'NORMAL') for d in decisions),
+                key=lambda value: DECISION_SEVERITY.get(value, 0)
+            ),
+            "actions": [action for d in decisions for action in d.get('actions', [])],
+            "message": " / ".join(d['message'] for d in decisions if d.get('message')),
+            "priority": max(
+                (d.get('priority', 'LOW') for d in decisions),
+                key=lambda value: PRIORITY_ORDER.get(value, 0)
+            )
+        }
+    
+    def _execute_decision(self, decision: Dict[str, Any], state: Optional[Dict[str, Any]] = None):
         """AI 결정사항 실행"""
+        self._log_batch = []
         try:
+            if state is None:
+                state = self.state_manager.load_state()
+            pump_status_before = dict(state.get('pump_status', {}))
+            
             actions = decision.get('actions', [])
             priority = decision.get('priority', 'LOW')
             
@@ -302,16 +632,16 @@ class AutonomousAgent:
                 
                 # 액션 실행
                 if action_type == 'PUMP_ON':
-                    self._control_pump(reservoir_id, 'ON', reason)
+                    self._control_pump(reservoir_id, 'ON', reason, state)
                 elif action_type == 'PUMP_OFF':
-                    self._control_pump(reservoir_id, 'OFF', reason)
+                    self._control_pump(reservoir_id, 'OFF', reason, state)
                 elif action_type == 'PUMP_AUTO':
-                    self._control_pump(reservoir_id, 'AUTO', reason)
+                    self._control_pump(reservoir_id, 'AUTO', reason, state)
                 elif action_type == 'ALERT':
                     self._send_alert(reservoir_id, reason, priority)
                 
                 # 실행 로그
-                self.automation_logger.log(
+                self._log_event(
                     LogLevel.WARNING if priority in ['HIGH', 'CRITICAL'] else LogLevel.INFO,
                     EventType.ACTION,
                     reservoir_id,
@@ -319,107 +649,156 @@ class AutonomousAgent:
                     {"action": action, "priority": priority}
                 )
             
+            # 펌프 상태 변경분은 실행 끝에 한 번만 저장
+            if state.get('pump_status', {}) != pump_status_before:
+                self._save_state(state)
+            
+        except Exception as e:
+            logger.error("AI 결정사항 실행 오류: %s", e)
+            self._log_event(LogLevel.ERROR, EventType.ERROR, "system", f"액션 실행 오류: {str(e)}")
+        finally:
+            self._flush_log_batch()
+    
+    async def _aexecute_decision(self, decision: Dict[str, Any], state: Optional[Dict[str, Any]] = None):
+        """AI 결정사항 실행 (비동기 루프용, 펌프 제어는 동시에 진행)"""
+        loop = asyncio.get_running_loop()
+        self._log_batch = []
+        try:
+            if state is None:
+                state = await loop.run_in_executor(self._io_pool, self.state_manager.load_state)
+            pump_status_before = dict(state.get('pump_status', {}))
+            
+            actions = decision.get('actions', [])
+            priority = decision.get('priority', 'LOW')
+            
+            pump_tasks = []
+            for action in actions:
+                reservoir_id = action.get('reservoir_id', 'unknown')
+                action_type = action.get('action', 'NONE')
+                reason = action.get('reason', 'AI 판단')
+                
+                # 액션 실행
+                if action_type in PUMP_ACTION_STATUS:
+                    pump_tasks.append(self._acontrol_pump(reservoir_id, PUMP_ACTION_STATUS[action_type], reason, state))
+                elif action_type == 'ALERT':
+                    self._send_alert(reservoir_id, reason, priority)
+            
+            if pump_tasks:
+                await asyncio.gather(*pump_tasks, return_exceptions=True)
+            
+            for action in actions:
+                reservoir_id = action.get('reservoir_id', 'unknown')
+                # 실행 로그
+                self._log_event(
+                    LogLevel.WARNING if priority in ['HIGH', 'CRITICAL'] else LogLevel.INFO,
+                    EventType.ACTION,
+                    reservoir_id,
+                    f"AI 액션 실행: {action.get('action', 'NONE')} - {action.get('reason', 'AI 판단')}",
+                    {"action": action, "priority": priority}
+                )
+            
+            # 펌프 상태 변경분은 실행 끝에 한 번만 저장
+            if state.get('pump_status', {}) != pump_status_before:
+                await loop.run_in_executor(self._io_pool, self._save_state, state)
+            
         except Exception as e:
-            logger.error(f"AI 결정사항 실행 오류: {e}")
-            self.automation_logger.error(EventType.ERROR, "system", f"액션 실행 오류: {str(e)}")
+            logger.error("AI 결정사항 실행 오류: %s", e)
+            self._log_event(LogLevel.ERROR, EventType.ERROR, "system", f"액션 실행 오류: {str(e)}")
+        finally:
+            await loop.run_in_executor(self._io_pool, self._flush_log_batch)
+    
+    def _flush_log_batch(self):
+        """모아 둔 로그를 자동화 로거에 일괄 기록"""
+        batch, self._log_batch = self._log_batch, None
+        if batch:
+            try:
+                self.automation_logger.bulk_log(batch)
+            except Exception as e:
+                logger.error("로그 일괄 기록 오류: %s", e)
+    
+    def _save_state(self, state: Dict[str, Any]):
+        """글로벌 상태 저장"""
+        try:
+            self.state_manager.save_state(state)
+        except Exception as state_e:
+            logger.warning("글로벌 상태 업데이트 실패: %s", state_e)
     
-    def _control_pump(self, reservoir_id: str, status: str, reason: str):
+    async def _acontrol_pump(self, reservoir_id: str, status: str, reason: str, state: Dict[str, Any]):
+        """펌프 제어 (비동기 루프용) - Arduino/DB 호출을 각 스레드 풀에서 동시에 실행"""
+        loop = asyncio.get_running_loop()
+        try:
+            arduino_result, db_success = await asyncio.gather(
+                loop.run_in_executor(self._arduino_pool, self._control_arduino_pump, reservoir_id, status, reason),
+                loop.run_in_executor(self._io_pool, self._update_pump_db, reservoir_id, status)
+            )
+            self._finish_pump_control(reservoir_id, status, reason, arduino_result, db_success, state)
+            
+        except Exception as e:
+            logger.error("펌프 제어 전체 오류: %s", e)
+            self._log_event(
+                LogLevel.ERROR,
+                EventType.ERROR,
+                reservoir_id,
+                f"펌프 제어 예외 오류: {str(e)}",
+                {"reason": reason}
+            )
+    
+    def _control_pump(self, reservoir_id: str, status: str, reason: str, state: Dict[str, Any]):
         """펌프 제어 - Arduino 하드웨어 제어 + 데이터베이스 연동"""
-        arduino_success = False
-        db_success = False
-        
         try:
             # === 1. Arduino 하드웨어 펌프 제어 시도 ===
             arduino_result = self._control_arduino_pump(reservoir_id, status, reason)
-            arduino_success = arduino_result.get('success', False)
             
             # === 2. 데이터베이스에 펌프 상태 업데이트 ===
-            try:
-                db_connector = get_database_connector()
-                db_success = db_connector.update_pump_status(reservoir_id, status)
-            except Exception as db_e:
-                logger.warning(f"데이터베이스 업데이트 실패: {db_e}")
-                db_success = False
-            
-            # === 3. 글로벌 상태 업데이트 ===
-            if arduino_success or db_success:
-                try:
-                    state_manager = get_state_manager()
-                    state = state_manager.load_state()
-                    if 'pump_status' not in state:
-                        state['pump_status'] = {}
-                    state['pump_status'][reservoir_id] = status
-                    state_manager.save_state(state)
-                except Exception as state_e:
-                    logger.warning(f"글로벌 상태 업데이트 실패: {state_e}")
-            
-            # === 4. 결과에 따른 로깅 ===
-            if arduino_success and db_success:
-                logger.info(f"AI 펌프 제어 완전 성공: {reservoir_id} -> {status} (이유: {reason})")
-                self.automation_logger.info(
-                    EventType.ACTION,
-                    reservoir_id,
-                    f"AI 펌프 제어 완전 성공: {status}",
-                    {
-                        "pump_status": status,
-                        "reason": reason,
-                        "arduino_success": True,
-                        "database_updated": True,
-                        "arduino_details": arduino_result
-                    }
-                )
-            elif arduino_success:
-                logger.info(f"AI 펌프 하드웨어 제어 성공 (DB 실패): {reservoir_id} -> {status} (이유: {reason})")
-                self.automation_logger.warning(
-                    EventType.ACTION,
-                    reservoir_id,
-                    f"AI 펌프 하드웨어 제어 성공 (DB 업데이트 실패): {status}",
-                    {
-                        "pump_status": status,
-                        "reason": reason,
-                        "arduino_success": True,
-                        "database_updated": False,
-                        "arduino_details": arduino_result
-                    }
-                )
-            elif db_success:
-                logger.warning(f"AI 펌프 DB 업데이트만 성공 (하드웨어 실패): {reservoir_id} -> {status} (이유: {reason})")
-                self.automation_logger.warning(
-                    EventType.ACTION,
-                    reservoir_id,
-                    f"AI 펌프 DB 업데이트만 성공 (Arduino 연결 없음): {status}",
-                    {
-                        "pump_status": status,
-                        "reason": reason,
-                        "arduino_success": False,
-                        "database_updated": True,
-                        "arduino_error": arduino_result.get('error', 'Arduino 연결 실패')
-                    }
-                )
-            else:
-                logger.error(f"AI 펌프 제어 완전 실패: {reservoir_id} -> {status} (이유: {reason})")
-                self.automation_logger.error(
-                    EventType.ERROR,
-                    reservoir_id,
-                    f"AI 펌프 제어 완전 실패: {status}",
-                    {
-                        "pump_status": status,
-                        "reason": reason,
-                        "arduino_success": False,
-                        "database_updated": False,
-                        "arduino_error": arduino_result.get('error', 'Arduino 연결 실패')
-                    }
-                )
+            db_success = self._update_pump_db(reservoir_id, status)
+            
+            self._finish_pump_control(reservoir_id, status, reason, arduino_result, db_success, state)
             
         except Exception as e:
-            logger.error(f"펌프 제어 전체 오류: {e}")
-            self.automation_logger.error(
+            logger.error("펌프 제어 전체 오류: %s", e)
+            self._log_event(
+                LogLevel.ERROR,
                 EventType.ERROR,
                 reservoir_id,
                 f"펌프 제어 예외 오류: {str(e)}",
                 {"reason": reason}
             )
     
+    def _update_pump_db(self, reservoir_id: str, status: str) -> bool:
+        """데이터베이스에 펌프 상태 업데이트"""
+        try:
+            return self._db.update_pump_status(reservoir_id, status)
+        except Exception as db_e:
+            logger.warning("데이터베이스 업데이트 실패: %s", db_e)
+            return False
+    
+    def _finish_pump_control(self, reservoir_id: str, status: str, reason: str,
+                             arduino_result: Dict[str, Any], db_success: bool, state: Dict[str, Any]):
+        """펌프 제어 결과를 글로벌 상태에 반영하고 로깅 (저장은 호출 측에서 일괄 처리)"""
+        arduino_success = bool(arduino_result.get('success', False))
+        db_success = bool(db_success)
+        
+        # === 3. 글로벌 상태 업데이트 ===
+        if arduino_success or db_success:
+            state.setdefault('pump_status', {})[reservoir_id] = status
+        
+        # === 4. 결과에 따른 로깅 ===
+        console_level, log_level, event_type, console_msg, log_msg = PUMP_RESULT_LOG[(arduino_success, db_success)]
+        logger.log(console_level, "AI 펌프 %s: %s -> %s (이유: %s)", console_msg, reservoir_id, status, reason)
+        
+        details = {
+            "pump_status": status,
+            "reason": reason,
+            "arduino_success": arduino_success,
+            "database_updated": db_success
+        }
+        if arduino_success:
+            details["arduino_details"] = arduino_result
+        else:
+            details["arduino_error"] = arduino_result.get('error', 'Arduino 연결 실패')
+        
+        self._log_event(log_level, event_type, reservoir_id, f"AI 펌프 {log_msg}: {status}", details)
+    
     def _control_arduino_pump(self, reservoir_id: str, status: str, reason: str) -> Dict[str, Any]:
         """Arduino 하드웨어 펌프 제어 시도"""
         try:
@@ -436,14 +815,16 @@ class AutonomousAgent:
             
             # Arduino 연결 상태 확인
             if not arduino_tool._is_connected():
-                self.automation_logger.warning(
+                arduino_port = arduino_tool.arduino_port
+                self._log_event(
+                    LogLevel.WARNING,
                     EventType.ERROR,
                     reservoir_id,
                     f"Arduino 연결되지 않음 - 펌프 제어 불가: {status}",
                     {
                         "requested_status": status,
                         "reason": reason,
-                        "arduino_port": getattr(arduino_tool, 'arduino_port', 'Unknown'),
+                        "arduino_port": arduino_port or 'Unknown',
                         "connection_attempt": False
                     }
                 )
@@ -452,22 +833,18 @@ class AutonomousAgent:
                     "success": False,
                     "error": "Arduino가 연결되지 않았습니다",
                     "connection_status": "disconnected",
-                    "port": getattr(arduino_tool, 'arduino_port', None),
+                    "port": arduino_port,
                     "suggestion": "시스템 제어판에서 '시스템 초기화'를 다시 실행하거나 Arduino 연결을 확인하세요"
                 }
             
-            # 실제 펌프 명령 매핑 (reservoir_id에서 펌프 번호 추출)
-            if reservoir_id.endswith('_1') or '1' in reservoir_id:
-                pump_action = f"pump1_{'on' if status == 'ON' else 'off'}"
-                pump_id = 1
-            elif reservoir_id.endswith('_2') or '2' in reservoir_id:
-                pump_action = f"pump2_{'on' if status == 'ON' else 'off'}"
-                pump_id = 2
-            else:
+            # 실제 펌프 명령 매핑 (배수지별 펌프 번호 조회)
+            pump_commands = PUMP_COMMANDS.get(reservoir_id)
+            if pump_commands is None:
                 # 기본값으로 펌프1 사용
-                pump_action = f"pump1_{'on' if status == 'ON' else 'off'}"
-                pump_id = 1
-                logger.warning(f"reservoir_id '{reservoir_id}'에서 펌프 번호를 확인할 수 없어 펌프1을 기본값으로 사용합니다")
+                pump_commands = DEFAULT_PUMP_COMMANDS
+                logger.warning("reservoir_id '%s'에서 펌프 번호를 확인할 수 없어 펌프1을 기본값으로 사용합니다", reservoir_id)
+            pump_id, on_action, off_action = pump_commands
+            pump_action = on_action if status == 'ON' else off_action
             
             # Arduino 펌프 제어 실행
             result = arduino_tool.execute(
@@ -476,7 +853,8 @@ class AutonomousAgent:
             )
             
             if result.get('success'):
-                self.automation_logger.info(
+                self._log_event(
+                    LogLevel.INFO,
                     EventType.ACTION,
                     reservoir_id,
                     f"Arduino 펌프{pump_id} 제어 성공: {status}",
@@ -499,7 +877,8 @@ class AutonomousAgent:
                 }
             else:
                 error_msg = result.get('error', '알 수 없는 오류')
-                self.automation_logger.error(
+                self._log_event(
+                    LogLevel.ERROR,
                     EventType.ERROR,
                     reservoir_id,
                     f"Arduino 펌프{pump_id} 제어 실패: {error_msg}",
@@ -522,7 +901,8 @@ class AutonomousAgent:
         except Exception as e:
             error_details = f"Arduino 펌프 제어 예외: {str(e)}"
             logger.error(error_details)
-            self.automation_logger.error(
+            self._log_event(
+                LogLevel.ERROR,
                 EventType.ERROR,
                 reservoir_id,
                 error_details,
@@ -545,7 +925,7 @@ class AutonomousAgent:
         try:
             alert_message = f"🚨 {priority} 알림: {reservoir_id} - {reason}"
             
-            self.automation_logger.log(
+            self._log_event(
                 LogLevel.CRITICAL if priority == 'CRITICAL' else LogLevel.WARNING,
                 EventType.ALERT,
                 reservoir_id,
@@ -563,7 +943,10 @@ class AutonomousAgent:
         return {
             "is_running": self.is_running,
             "decision_interval": self.decision_interval,
-            "thread_active": self.monitoring_thread.is_alive() if self.monitoring_thread else False
+            "thread_active": (
+                (self.monitoring_thread.is_alive() if self.monitoring_thread else False)
+                or (self._task is not None and not self._task.done())
+            )
         }
     
     def get_notifications(self, limit: int = 10, unread_only: bool = False):
@@ -572,34 +955,8 @@ class AutonomousAgent:
             # 자동화 로거에서 최근 로그 가져오기
             recent_logs = self.automation_logger.get_recent_logs(limit=limit)
             
-            notifications = []
-            for log in recent_logs:
-                # 타임스탬프 처리 (문자열을 datetime으로 변환)
-                timestamp = log.get('timestamp', '')
-                if isinstance(timestamp, str):
-                    try:
-                        from datetime import datetime
-                        if timestamp:
-                            # ISO 형식 문자열을 datetime으로 변환
-                            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        else:
-                            timestamp = datetime.now()
-                    except (ValueError, AttributeError):
-                        timestamp = datetime.now()
-                elif not hasattr(timestamp, 'strftime'):
-                    # datetime이 아닌 경우 현재 시간으로 설정
-                    timestamp = datetime.now()
-                
-                # 로그를 알림 형태로 변환
-                notification = {
-                    'id': f"log_{str(timestamp).replace(':', '').replace('-', '').replace(' ', '')}",
-                    'timestamp': timestamp,
-                    'level': log.get('level', 'INFO').lower(),
-                    'title': f"{log.get('event_type', 'System')} Alert",
-                    'message': log.get('message', ''),
-                    'read': False
-                }
-                notifications.append(notification)
+            # 로그를 알림 형태로 변환
+            notifications = [self._log_to_notification(log) for log in recent_logs]
             
             return notifications[:limit]
             
@@ -607,14 +964,27 @@ class AutonomousAgent:
             logger.error(f"알림 조회 오류: {e}")
             return []
     
+    @staticmethod
+    def _log_to_notification(log: Dict[str, Any]) -> Dict[str, Any]:
+        """로그 레코드를 알림 딕셔너리로 변환"""
+        timestamp = _parse_log_timestamp(log.get('timestamp'))
+        return {
+            'id': f"log_{str(timestamp).translate(_ID_TRANS)}",
+            'timestamp': timestamp,
+            'level': log.get('level', 'INFO').lower(),
+            'title': f"{log.get('event_type', 'System')} Alert",
+            'message': log.get('message', ''),
+            'read': False
+        }
+    
     def add_notification(self, message: str, level: str = "info", data: Dict = None):
         """알림 추가 - 로깅 시스템 활용"""
         try:
             # 로그 레벨에 따라 적절한 로깅
             if level == "critical" or level == "emergency":
-                self.automation_logger.critical(EventType.ALERT, "system", message, data or {})
+                self._log_event(LogLevel.CRITICAL, EventType.ALERT, "system", message, data or {})
             elif level == "warning":
-                self.automation_logger.warning(EventType.ALERT, "system", message, data or {})
+                self._log_event(LogLevel.WARNING, EventType.ALERT, "system", message, data or {})
             else:
                 self.automation_logger.info(EventType.ALERT, "system", message, data or {})
                 
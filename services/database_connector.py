@@ -1,18 +1,112 @@
 # services/database_connector.py - 실시간 데이터베이스 연동 서비스
 
+import asyncio
+import atexit
+import queue
+import select
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from operator import itemgetter
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional
+import numpy as np
 
 from config import PG_DB_HOST, PG_DB_PORT, PG_DB_NAME, PG_DB_USER, PG_DB_PASSWORD
+try:
+    from numba import njit  # 선택 의존성 - 없으면 NumPy 벡터 연산으로 분류
+except ImportError:
+    njit = None
+
 from services.logging_system import get_automation_logger, EventType, LogLevel
 from utils.logger import setup_logger
 
+# psycopg2는 실제 DB 작업 시점에 임포트 (커넥터를 쓰지 않는 경로의 시작 시간 단축)
+if TYPE_CHECKING:
+    import psycopg2.pool
+
 logger = setup_logger(__name__)
 
+# water 테이블 INSERT 알림 채널 (LISTEN/NOTIFY로 캐시 무효화, 트리거는 docker/postgres/init.sql에서 생성)
+# init.sql은 새 데이터 볼륨에서만 실행되므로 기존 DB에는 트리거가 없을 수 있음 - 수신 시작 전에 존재 여부 확인
+WATER_NOTIFY_CHANNEL = "water_insert"
+WATER_NOTIFY_TRIGGER_CHECK_SQL = """
+    SELECT 1 FROM pg_trigger
+    WHERE tgname = 'water_notify' AND tgrelid = 'water'::regclass AND NOT tgisinternal
+"""
+PUMP_STATUS_LABELS = ("OFF", "AUTO", "ON")  # 가동 펌프 없음 / 일부 / 전부
+PUMP_STATUS_NAMES = np.array(PUMP_STATUS_LABELS)
+HEALTH_STATUS_NAMES = np.array(["NORMAL", "WARNING", "CRITICAL"])  # _classify 결과 코드 순서
+WARNING_LEVEL_RATIO = 0.8  # 경고 임계값 대비 주의 구간 시작 비율
+CACHE_TTL_SECONDS = 10  # 캐시 유효 시간 (알림 수신 중에도 놓친 알림에 대비한 상한으로 적용)
+LISTEN_POLL_SECONDS = 5  # 알림 대기 주기 (종료 확인 간격)
+LISTEN_RETRY_SECONDS = 30  # 알림 연결 실패 시 재시도 지연
+POOL_MIN_CONNECTIONS = 2
+POOL_MAX_CONNECTIONS = 16
+# 풀 연결마다 적용할 세션 설정 (비트맵 힙 스캔 프리페치 깊이 확대, 연결 시작 옵션으로 전달해 추가 왕복 없음)
+# io_method(PG18 비동기 I/O)는 서버 시작 설정이라 세션에서 바꿀 수 없음
+IO_CONCURRENCY = 200
+POOL_SESSION_OPTIONS = f"-c effective_io_concurrency={IO_CONCURRENCY} -c maintenance_io_concurrency={IO_CONCURRENCY}"
+INFLIGHT_WAIT_SECONDS = 5  # 동시 조회 시 선행 조회 결과 대기 시간
+HISTORY_FETCH_SIZE = 2000  # 과거 데이터 서버 측 커서에서 한 번에 가져올 행 수
+PUMP_WRITE_BATCH_MAX = 100  # 한 트랜잭션으로 묶어 커밋할 펌프 상태 쓰기 최대 개수
+PUMP_WRITE_TIMEOUT_SECONDS = 30  # 동기 호출자의 쓰기 완료 대기 시간
+
+def _classify_numpy(levels: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """수위 상태 코드 계산 (0=정상, 1=주의, 2=위험)"""
+    return np.where(
+        levels >= thresholds, 2, np.where(levels >= thresholds * WARNING_LEVEL_RATIO, 1, 0)
+    ).astype(np.int8)
+
+if njit is not None:
+    @njit(cache=True)
+    def _classify_flat(levels, thresholds, warning_ratio):
+        out = np.empty(levels.size, np.int8)
+        for i in range(levels.size):
+            level = levels[i]
+            threshold = thresholds[i]
+            out[i] = 2 if level >= threshold else (1 if level >= warning_ratio * threshold else 0)
+        return out
+else:
+    _classify_flat = None
+
+def _classify(levels: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """수위/임계값 배열(브로드캐스트 가능)을 상태 코드 배열로 분류"""
+    levels, thresholds = np.broadcast_arrays(
+        np.asarray(levels, dtype=np.float64), np.asarray(thresholds, dtype=np.float64)
+    )
+    if _classify_flat is None:
+        return _classify_numpy(levels, thresholds)
+    return _classify_flat(levels.ravel(), thresholds.ravel(), WARNING_LEVEL_RATIO).reshape(levels.shape)
+
+@dataclass(slots=True, frozen=True)
+class ReservoirSnapshot:
+    """배수지 하나의 수위/펌프 상태 스냅샷"""
+    water_level: float
+    pump_status: str
+    alert_level: float
+    active_pumps: int
+    total_pumps: int
+    pump_details: tuple  # (펌프 이름, 가동 여부) 쌍
+    measured_at: datetime  # 직렬화 시점에 변환 (to_dict)
+    reservoir_name: str
+    
+    # 기존 딕셔너리 방식 접근(data['water_level'], data.get(...)) 호환
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 저장/API 응답용 딕셔너리 변환"""
+        data = asdict(self)
+        data['pump_details'] = dict(self.pump_details)
+        data['measured_at'] = self.measured_at.isoformat() if hasattr(self.measured_at, 'isoformat') else str(self.measured_at)
+        return data
+
 class DatabaseConnector:
     """실시간 데이터베이스 연동 클래스"""
     
@@ -47,37 +141,280 @@ class DatabaseConnector:
             }
         }
         
+        # water 테이블에서 실제로 사용하는 컬럼만 조회 (SELECT * 대신)
+        self._all_columns = ('measured_at',) + tuple(
+            col
+            for config in self.reservoirs.values()
+            for col in (config['level_col'], *config['pumps'])
+        )
+        column_list = ', '.join(self._all_columns)
+        
+        # 과거 데이터 일괄 변환용 배수지별 계획 (값 배열에서의 컬럼 위치는 measured_at 제외 기준)
+        value_index = {col: i - 1 for i, col in enumerate(self._all_columns) if i > 0}
+        self._reservoir_plan = [
+            (
+                reservoir_id,
+                value_index[config['level_col']],
+                [value_index[col] for col in config['pumps']],
+                tuple(col.replace(f'{reservoir_id}_', '') for col in config['pumps']),
+                config['alert_threshold'],
+                config['name']
+            )
+            for reservoir_id, config in self.reservoirs.items()
+        ]
+        # 단일 행 변환 함수 (배수지 설정은 실행 중 바뀌지 않으므로 배수지별로 미리 특화)
+        self._converters = {
+            reservoir_id: self._build_converter(reservoir_id, config)
+            for reservoir_id, config in self.reservoirs.items()
+        }
+        self._select_latest_sql = f"SELECT {column_list} FROM water ORDER BY measured_at DESC LIMIT 1;"
+        self._select_since_sql = f"SELECT {column_list} FROM water WHERE measured_at >= %s ORDER BY measured_at DESC;"
+        
+        # 최신 행의 배수지별 상태 분류를 서버에서 수행 (수위 컬럼만 읽고 배수지당 작은 행 하나 반환)
+        health_values = ', '.join(
+            f"('{reservoir_id}', COALESCE(latest.{config['level_col']}, 0.0), {float(config['alert_threshold'])}::float8)"
+            for reservoir_id, config in self.reservoirs.items()
+        )
+        level_columns = ', '.join(config['level_col'] for config in self.reservoirs.values())
+        self._health_sql = (
+            f"SELECT t.reservoir_id, ROUND(t.water_level::numeric, 2)::float8 AS water_level, t.threshold, "
+            f"CASE WHEN t.water_level >= t.threshold THEN 'CRITICAL' "
+            f"WHEN t.water_level >= t.threshold * {WARNING_LEVEL_RATIO} THEN 'WARNING' ELSE 'NORMAL' END AS status "
+            f"FROM (SELECT {level_columns} FROM water ORDER BY measured_at DESC LIMIT 1) AS latest "
+            f"CROSS JOIN LATERAL (VALUES {health_values}) AS t(reservoir_id, water_level, threshold);"
+        )
+        
+        # 펌프 상태 업데이트 SQL (배수지 x 동작별로 미리 생성, 최신 행 복사 + 펌프 컬럼 변경을 서버에서 한 번에 처리)
+        self._pump_sql = {
+            reservoir_id: {
+                action: self._build_pump_update_sql(config, action)
+                for action in ("ON", "OFF", "AUTO", None)
+            }
+            for reservoir_id, config in self.reservoirs.items()
+        }
+        
+        # 연결 풀 (첫 사용 시 생성 - DB가 내려가 있어도 커넥터 생성은 가능하도록)
+        self._pool: Optional["psycopg2.pool.ThreadedConnectionPool"] = None
+        self._pool_lock = threading.Lock()
+        self._scan_plan_checked = False  # 과거 데이터 조회 실행 계획은 최초 1회만 점검
+        
         self.automation_logger = get_automation_logger()
-        self._lock = threading.Lock()
-        self._cached_data = {}
-        self._last_update = None
+        # 캐시 스냅샷 (데이터, 갱신 시각(time.monotonic), 세대) - 불변 튜플을 통째로 교체하므로 읽기는 락 없이 수행
+        # 세대는 무효화될 때마다 증가 (조회 중 무효화된 결과는 캐시하지 않음)
+        self._snapshot = (None, None, 0)
+        self._last_update_wall: Optional[datetime] = None  # 상태 보고용 마지막 갱신 시각
+        self._health_snapshot = (None, None, -1)  # SQL 집계 건강 상태 캐시 (결과, 갱신 시각(time.monotonic), 세대)
+        self._lock = threading.Lock()  # 스냅샷 교체(쓰기) 전용
+        
+        # 캐시 미스 동시 조회 합치기 (키별 진행 중 이벤트와 결과)
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_result: Dict[str, Any] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # water INSERT 알림 수신 (새 데이터가 들어오면 TTL 전이라도 바로 무효화)
+        self._listening = False
+        self._trigger_missing_warned = False
+        self._listener_stop = threading.Event()
+        self._listener_thread = threading.Thread(
+            target=self._listen_for_changes,
+            daemon=True,
+            name="WaterChangeListener"
+        )
+        self._listener_thread.start()
+        
+        # 펌프 상태 쓰기 대기열 (쓰기 스레드가 쌓인 요청을 한 트랜잭션으로 묶어 커밋)
+        self._pending_writes: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(
+            target=self._write_pending_loop,
+            daemon=True,
+            name="PumpStatusWriter"
+        )
+        self._writer_thread.start()
         
         logger.info("데이터베이스 커넥터 초기화 완료")
     
+    def _listen_for_changes(self):
+        """water 테이블 INSERT 알림을 받아 캐시 무효화 (전용 연결)"""
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+        
+        while not self._listener_stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(**self.db_config)
+                conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cur:
+                    # 알림을 보낼 트리거가 없으면 수신해도 무효화되지 않으므로 TTL 캐시만 사용 (재시도 주기마다 다시 확인)
+                    cur.execute(WATER_NOTIFY_TRIGGER_CHECK_SQL)
+                    has_trigger = cur.fetchone() is not None
+                    if has_trigger:
+                        cur.execute(f"LISTEN {WATER_NOTIFY_CHANNEL};")
+                
+                if not has_trigger:
+                    if not self._trigger_missing_warned:
+                        logger.warning("water_notify 트리거가 없어 변경 알림 없이 TTL 캐시만 사용합니다 "
+                                       "(docker/postgres/init.sql의 notify_water_insert/water_notify 적용 필요)")
+                        self._trigger_missing_warned = True
+                else:
+                    # 수신 시작 전에 캐시된 데이터는 놓친 알림이 있을 수 있으므로 무효화
+                    self._invalidate_cache()
+                    self._listening = True
+                    logger.info("water 테이블 변경 알림 수신 시작")
+                    
+                    while not self._listener_stop.is_set():
+                        if select.select([conn], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                            continue
+                        conn.poll()
+                        if conn.notifies:
+                            conn.notifies.clear()
+                            self._invalidate_cache()
+                        
+            except Exception as e:
+                logger.warning(f"water 변경 알림 수신 오류 (TTL 캐시로 대체): {e}")
+            finally:
+                self._listening = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            
+            self._listener_stop.wait(LISTEN_RETRY_SECONDS)
+    
+    def _invalidate_cache(self):
+        """최신 데이터 캐시 무효화"""
+        with self._lock:
+            self._snapshot = (None, None, self._snapshot[2] + 1)
+    
+    def _build_pump_update_sql(self, config: Dict[str, Any], action: Optional[str]) -> str:
+        """최신 행을 복사해 펌프 컬럼만 바꾼 새 행을 삽입하는 INSERT ... SELECT 문 생성"""
+        level_col = config['level_col']
+        expressions = []
+        for col in self._all_columns:
+            if col == 'measured_at':
+                expressions.append('%s')
+            elif col in config['pumps'] and action == "ON":
+                expressions.append('1.0')
+            elif col in config['pumps'] and action == "OFF":
+                expressions.append('0.0')
+            elif col in config['pumps'] and action == "AUTO":
+                # AUTO 모드는 일부만 켬 (수위가 높을수록 더 많은 펌프 가동)
+                i = config['pumps'].index(col)
+                expressions.append(f'CASE WHEN {i} < COALESCE({level_col}, 0.0) / 30 THEN 1.0 ELSE 0.0 END')
+            else:
+                expressions.append(col)
+        
+        return (
+            f"INSERT INTO water ({', '.join(self._all_columns)}) "
+            f"SELECT {', '.join(expressions)} "
+            f"FROM (SELECT * FROM water ORDER BY measured_at DESC LIMIT 1) AS latest "
+            f"RETURNING {level_col};"
+        )
+    
     def get_connection(self):
         """데이터베이스 연결 반환"""
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+        
         try:
             return psycopg2.connect(**self.db_config, cursor_factory=RealDictCursor)
         except Exception as e:
             logger.error(f"데이터베이스 연결 오류: {e}")
             raise
     
-    def get_latest_water_data(self, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+    def _get_pool(self) -> "psycopg2.pool.ThreadedConnectionPool":
+        """연결 풀 반환 (없으면 생성)"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    import psycopg2.pool
+                    from psycopg2.extras import RealDictCursor
+                    
+                    try:
+                        self._pool = psycopg2.pool.ThreadedConnectionPool(
+                            POOL_MIN_CONNECTIONS,
+                            POOL_MAX_CONNECTIONS,
+                            cursor_factory=RealDictCursor,
+                            options=POOL_SESSION_OPTIONS,
+                            **self.db_config
+                        )
+                    except Exception as e:
+                        logger.error(f"데이터베이스 연결 풀 생성 오류: {e}")
+                        raise
+                    atexit.register(self._pool.closeall)
+                    self._verify_water_columns(self._pool)
+        return self._pool
+    
+    def _verify_water_columns(self, pool: "psycopg2.pool.ThreadedConnectionPool"):
+        """미리 만들어 둔 SQL이 가정하는 water 컬럼이 실제 스키마에 모두 있는지 확인 (풀 생성 시 1회)"""
+        conn = pool.getconn()
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute("SELECT column_name FROM information_schema.columns WHERE table_name = 'water';")
+                existing = {row['column_name'] for row in cur.fetchall()}
+        except Exception as e:
+            logger.warning(f"water 테이블 스키마 확인 실패: {e}")
+            return
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+        
+        missing = [col for col in self._all_columns if col not in existing]
+        if missing:
+            logger.error(f"water 테이블에 필요한 컬럼이 없습니다 (스키마 변경 후 재시작 필요): {missing}")
+    
+    @contextmanager
+    def _borrow(self):
+        """풀에서 연결을 빌려 트랜잭션 단위로 사용 후 반납"""
+        pool = self._get_pool()
+        conn = pool.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            # 끊어진 연결은 풀에 되돌리지 않고 닫음
+            pool.putconn(conn, close=bool(conn.closed))
+    
+    def get_latest_water_data(self, use_cache: bool = True) -> Optional[Dict[str, ReservoirSnapshot]]:
         """최신 수위 데이터 조회"""
+        # 캐시 확인 (TTL 이내만 사용, 변경 알림을 받으면 TTL 전이라도 무효화됨)
+        cached_data, last_update, generation = self._snapshot
+        if use_cache and cached_data:
+            if time.monotonic() - last_update < CACHE_TTL_SECONDS:
+                return cached_data
+        
+        if not use_cache:
+            return self._query_latest_water_data(generation)
+        
+        # 캐시 미스가 동시에 몰리면 첫 스레드만 조회하고 나머지는 그 결과를 기다림
+        with self._inflight_lock:
+            event = self._inflight.get('latest')
+            is_leader = event is None
+            if is_leader:
+                event = self._inflight['latest'] = threading.Event()
+        
+        if not is_leader:
+            if event.wait(timeout=INFLIGHT_WAIT_SECONDS):
+                return self._inflight_result.get('latest')
+            # 선행 조회가 늦어지면 결과 없이 돌려보내지 않고 직접 조회
+            logger.warning("최신 수위 데이터 동시 조회 대기 시간 초과 - 직접 조회")
+            return self._query_latest_water_data(generation)
+        
         try:
-            # 캐시 확인 (10초 이내는 캐시 사용)
-            if use_cache and self._cached_data and self._last_update:
-                if datetime.now() - self._last_update < timedelta(seconds=10):
-                    return self._cached_data
-            
-            with self.get_connection() as conn:
+            water_data = self._query_latest_water_data(generation)
+            self._inflight_result['latest'] = water_data
+            return water_data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop('latest', None)
+            event.set()
+    
+    def _query_latest_water_data(self, generation: int) -> Optional[Dict[str, ReservoirSnapshot]]:
+        """데이터베이스에서 최신 수위 데이터를 조회하고 캐시 갱신"""
+        try:
+            with self._borrow() as conn:
                 with conn.cursor() as cur:
-                    # 최신 데이터 조회
-                    cur.execute("""
-                        SELECT * FROM water 
-                        ORDER BY measured_at DESC 
-                        LIMIT 1;
-                    """)
+                    # 최신 데이터 조회 (measured_at 인덱스 역방향 스캔)
+                    cur.execute(self._select_latest_sql)
                     
                     result = cur.fetchone()
                     
@@ -88,10 +425,11 @@ class DatabaseConnector:
                     # 데이터 변환
                     water_data = self._convert_to_reservoir_format(result)
                     
-                    # 캐시 업데이트
+                    # 캐시 업데이트 (조회 중 새 데이터 알림이 왔으면 캐시하지 않음)
                     with self._lock:
-                        self._cached_data = water_data
-                        self._last_update = datetime.now()
+                        if self._snapshot[2] == generation:
+                            self._snapshot = (water_data, time.monotonic(), generation)
+                            self._last_update_wall = datetime.now()
                     
                     return water_data
                     
@@ -99,159 +437,231 @@ class DatabaseConnector:
             logger.error(f"수위 데이터 조회 오류: {e}")
             return None
     
-    def _convert_to_reservoir_format(self, db_result: Dict[str, Any]) -> Dict[str, Any]:
-        """데이터베이스 결과를 배수지 형식으로 변환"""
-        reservoir_data = {}
-        measured_at = db_result.get('measured_at', datetime.now())
+    def _build_converter(self, reservoir_id: str, config: Dict[str, Any]):
+        """배수지 하나의 컬럼/임계값을 고정한 단일 행 변환 함수 생성"""
+        level_col = config['level_col']
+        pumps = config['pumps']
+        pump_values = itemgetter(*pumps) if len(pumps) > 1 else (lambda row: (row[pumps[0]],))
+        pump_names = tuple(col.replace(f'{reservoir_id}_', '') for col in pumps)
+        bits = tuple(1 << i for i in range(len(pumps)))
+        full_mask = (1 << len(pumps)) - 1
+        total_pumps = len(pumps)
+        alert_level = config['alert_threshold']
+        reservoir_name = config['name']
         
-        for reservoir_id, config in self.reservoirs.items():
-            # 수위 데이터
-            water_level = float(db_result.get(config['level_col'], 0.0))
-            
-            # 펌프 상태 확인
-            pump_status = "OFF"
-            active_pumps = 0
-            pump_details = {}
+        def convert(row: Dict[str, Any], measured_at: datetime) -> ReservoirSnapshot:
+            # 펌프 상태를 비트 마스크로 모음 (double precision 값이 1.0 이상이면 가동, NULL은 0.0)
+            mask = 0
+            for bit, value in zip(bits, pump_values(row)):
+                if (value or 0.0) >= 1.0:
+                    mask |= bit
             
-            for pump_col in config['pumps']:
-                # double precision 값을 boolean으로 변환 (1.0이면 True, 0.0이면 False)
-                pump_value = float(db_result.get(pump_col, 0.0))
-                pump_active = pump_value >= 1.0
-                pump_name = pump_col.replace(f'{reservoir_id}_', '')
-                pump_details[pump_name] = pump_active
-                if pump_active:
-                    active_pumps += 1
-            
-            # 펌프 상태 결정
-            if active_pumps == 0:
-                pump_status = "OFF"
-            elif active_pumps == len(config['pumps']):
-                pump_status = "ON"
-            else:
-                pump_status = "AUTO"
+            return ReservoirSnapshot(
+                water_level=round(float(row[level_col] or 0.0), 2),
+                pump_status=PUMP_STATUS_LABELS[2 if mask == full_mask else (1 if mask else 0)],
+                alert_level=alert_level,
+                active_pumps=mask.bit_count(),
+                total_pumps=total_pumps,
+                pump_details=tuple((name, bool(mask & bit)) for name, bit in zip(pump_names, bits)),
+                measured_at=measured_at,
+                reservoir_name=reservoir_name
+            )
+        
+        return convert
+    
+    def _convert_to_reservoir_format(self, db_result: Dict[str, Any]) -> Dict[str, ReservoirSnapshot]:
+        """데이터베이스 결과를 배수지 형식으로 변환"""
+        measured_at = db_result.get('measured_at') or datetime.now()
+        return {reservoir_id: convert(db_result, measured_at) for reservoir_id, convert in self._converters.items()}
+    
+    def _convert_rows_to_reservoir_format(self, rows: List[tuple]) -> List[Dict[str, ReservoirSnapshot]]:
+        """여러 행을 배열 연산으로 한 번에 배수지 형식으로 변환 (행은 self._all_columns 순서의 튜플)"""
+        if not rows:
+            return []
+        
+        measured_ats = [row[0] for row in rows]
+        # NULL 값은 0.0으로 처리
+        values = np.nan_to_num(np.array([row[1:] for row in rows], dtype=np.float64), nan=0.0)
+        
+        converted = [{} for _ in rows]
+        for reservoir_id, level_idx, pump_idx, pump_names, alert_level, name in self._reservoir_plan:
+            levels = values[:, level_idx].round(2).tolist()
+            active = values[:, pump_idx] >= 1.0
+            counts = active.sum(axis=1)
+            total_pumps = len(pump_idx)
+            statuses = PUMP_STATUS_NAMES[np.where(counts == 0, 0, np.where(counts == total_pumps, 2, 1))].tolist()
             
-            reservoir_data[reservoir_id] = {
-                'water_level': round(water_level, 2),
-                'pump_status': pump_status,
-                'alert_level': config['alert_threshold'],
-                'active_pumps': active_pumps,
-                'total_pumps': len(config['pumps']),
-                'pump_details': pump_details,
-                'measured_at': measured_at.isoformat() if hasattr(measured_at, 'isoformat') else str(measured_at),
-                'reservoir_name': config['name']
-            }
+            for reservoir_data, level, status, count, flags, measured_at in zip(
+                converted, levels, statuses, counts.tolist(), active.tolist(), measured_ats
+            ):
+                reservoir_data[reservoir_id] = ReservoirSnapshot(
+                    water_level=level,
+                    pump_status=status,
+                    alert_level=alert_level,
+                    active_pumps=count,
+                    total_pumps=total_pumps,
+                    pump_details=tuple(zip(pump_names, flags)),
+                    measured_at=measured_at,
+                    reservoir_name=name
+                )
         
-        return reservoir_data
+        return converted
     
     def update_pump_status(self, reservoir_id: str, pump_action: str) -> bool:
-        """펌프 상태 업데이트 (실제 데이터베이스에 반영)"""
+        """펌프 상태 업데이트 (실제 데이터베이스에 반영, 커밋될 때까지 대기)"""
+        future = self.submit_pump_status(reservoir_id, pump_action)
+        if future is None:
+            return False
+        
         try:
-            if reservoir_id not in self.reservoirs:
-                logger.error(f"잘못된 배수지 ID: {reservoir_id}")
-                return False
-            
-            config = self.reservoirs[reservoir_id]
+            return future.result(timeout=PUMP_WRITE_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.error(f"펌프 상태 업데이트 대기 오류: {e}")
+            return False
+    
+    def submit_pump_status(self, reservoir_id: str, pump_action: str) -> Optional[Future]:
+        """펌프 상태 업데이트 요청을 쓰기 대기열에 넣고 완료 여부 Future 반환"""
+        if reservoir_id not in self.reservoirs:
+            logger.error(f"잘못된 배수지 ID: {reservoir_id}")
+            return None
+        
+        pump_sql = self._pump_sql[reservoir_id]
+        insert_sql = pump_sql.get(pump_action.upper(), pump_sql[None])
+        future = Future()
+        self._pending_writes.put((reservoir_id, pump_action, insert_sql, datetime.now(), future))
+        return future
+    
+    def _write_pending_loop(self):
+        """쓰기 대기열 처리 (대기 중인 요청을 모두 모아 한 번에 커밋)"""
+        while True:
+            batch = [self._pending_writes.get()]
+            while len(batch) < PUMP_WRITE_BATCH_MAX:
+                try:
+                    batch.append(self._pending_writes.get_nowait())
+                except queue.Empty:
+                    break
             
-            with self.get_connection() as conn:
+            try:
+                self._flush_pump_writes(batch)
+            except Exception as e:
+                logger.error(f"펌프 상태 쓰기 처리 오류: {e}")
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_result(False)
+    
+    def _flush_pump_writes(self, batch: List[tuple]):
+        """펌프 상태 쓰기 묶음을 한 트랜잭션으로 반영 (요청마다 SAVEPOINT로 감싸 실패한 요청만 취소)"""
+        import psycopg2
+        
+        try:
+            with self._borrow() as conn:
                 with conn.cursor() as cur:
-                    # 현재 시간으로 새 레코드 삽입
-                    current_time = datetime.now()
-                    
-                    # 기존 최신 데이터 조회
-                    cur.execute("""
-                        SELECT * FROM water 
-                        ORDER BY measured_at DESC 
-                        LIMIT 1;
-                    """)
-                    latest_data = cur.fetchone()
-                    
-                    if not latest_data:
-                        logger.error("기존 데이터를 찾을 수 없어 펌프 상태를 업데이트할 수 없습니다")
-                        return False
-                    
-                    # 새 레코드 데이터 준비
-                    new_data = dict(latest_data)
-                    new_data['measured_at'] = current_time
-                    
-                    # 펌프 상태 업데이트 (double precision 컬럼에 맞게 1.0/0.0 사용)
-                    if pump_action.upper() == "ON":
-                        for pump_col in config['pumps']:
-                            new_data[pump_col] = 1.0
-                    elif pump_action.upper() == "OFF":
-                        for pump_col in config['pumps']:
-                            new_data[pump_col] = 0.0
-                    elif pump_action.upper() == "AUTO":
-                        # AUTO 모드는 일부만 켬 (임계치 기반)
-                        water_level = new_data.get(config['level_col'], 0.0)
-                        for i, pump_col in enumerate(config['pumps']):
-                            # 수위가 높을수록 더 많은 펌프 가동
-                            new_data[pump_col] = 1.0 if i < (water_level / 30) else 0.0
-                    
-                    # 새 레코드 삽입
-                    columns = list(new_data.keys())
-                    values = list(new_data.values())
-                    placeholders = ', '.join(['%s'] * len(values))
-                    
-                    insert_sql = f"""
-                        INSERT INTO water ({', '.join(columns)})
-                        VALUES ({placeholders})
-                    """
+                    # 요청 순서대로 실행해야 각 INSERT가 앞선 요청이 만든 최신 행을 복사함
+                    inserted_rows = []
+                    for _, _, insert_sql, current_time, _ in batch:
+                        cur.execute("SAVEPOINT pump_write")
+                        try:
+                            cur.execute(insert_sql, (current_time,))
+                            inserted = cur.fetchone()
+                        except psycopg2.Error as e:
+                            # 연결이 끊긴 경우에는 여기서 다시 예외가 나 묶음 전체가 실패 처리됨
+                            cur.execute("ROLLBACK TO SAVEPOINT pump_write")
+                            inserted_rows.append(e)
+                        else:
+                            cur.execute("RELEASE SAVEPOINT pump_write")
+                            inserted_rows.append(inserted)
                     
-                    cur.execute(insert_sql, values)
                     conn.commit()
                     
-                    # 로그 기록
-                    self.automation_logger.info(
-                        EventType.ACTION,
-                        reservoir_id,
-                        f"펌프 상태 업데이트: {pump_action}",
-                        {
-                            "pump_action": pump_action,
-                            "water_level": new_data.get(config['level_col'], 0.0),
-                            "timestamp": current_time.isoformat()
-                        }
-                    )
-                    
-                    # 캐시 무효화
-                    with self._lock:
-                        self._cached_data = {}
-                        self._last_update = None
-                    
-                    logger.info(f"펌프 상태 업데이트 성공: {reservoir_id} -> {pump_action}")
-                    return True
-                    
         except Exception as e:
             logger.error(f"펌프 상태 업데이트 오류: {e}")
-            self.automation_logger.error(
-                EventType.ERROR,
+            for reservoir_id, _, _, _, future in batch:
+                self.automation_logger.error(
+                    EventType.ERROR,
+                    reservoir_id,
+                    f"펌프 상태 업데이트 실패: {str(e)}"
+                )
+                future.set_result(False)
+            return
+        
+        # 캐시 무효화
+        if any(inserted and not isinstance(inserted, Exception) for inserted in inserted_rows):
+            self._invalidate_cache()
+        
+        for (reservoir_id, pump_action, _, current_time, future), inserted in zip(batch, inserted_rows):
+            if isinstance(inserted, Exception):
+                logger.error(f"펌프 상태 업데이트 오류: {inserted}")
+                self.automation_logger.error(
+                    EventType.ERROR,
+                    reservoir_id,
+                    f"펌프 상태 업데이트 실패: {str(inserted)}"
+                )
+                future.set_result(False)
+                continue
+            
+            if not inserted:
+                logger.error("기존 데이터를 찾을 수 없어 펌프 상태를 업데이트할 수 없습니다")
+                future.set_result(False)
+                continue
+            
+            # 로그 기록
+            self.automation_logger.info(
+                EventType.ACTION,
                 reservoir_id,
-                f"펌프 상태 업데이트 실패: {str(e)}"
+                f"펌프 상태 업데이트: {pump_action}",
+                {
+                    "pump_action": pump_action,
+                    "water_level": inserted[self.reservoirs[reservoir_id]['level_col']],
+                    "timestamp": current_time.isoformat()
+                }
             )
-            return False
+            
+            logger.info(f"펌프 상태 업데이트 성공: {reservoir_id} -> {pump_action}")
+            future.set_result(True)
     
-    def get_historical_data(self, hours: int = 24) -> List[Dict[str, Any]]:
+    def get_historical_data(self, hours: int = 24) -> List[Dict[str, ReservoirSnapshot]]:
         """과거 데이터 조회"""
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT * FROM water 
-                        WHERE measured_at >= %s
-                        ORDER BY measured_at DESC;
-                    """, (datetime.now() - timedelta(hours=hours),))
-                    
-                    results = cur.fetchall()
-                    
-                    historical_data = []
-                    for row in results:
-                        historical_data.append(self._convert_to_reservoir_format(row))
-                    
-                    return historical_data
-                    
+            return list(self.iter_historical_data(hours))
         except Exception as e:
             logger.error(f"과거 데이터 조회 오류: {e}")
             return []
     
+    def iter_historical_data(self, hours: int = 24) -> Iterator[Dict[str, ReservoirSnapshot]]:
+        """과거 데이터를 서버 측 커서로 나눠 받아 순차 반환 (전체 결과를 메모리에 올리지 않음)"""
+        from psycopg2.extensions import cursor as TupleCursor
+        
+        since = datetime.now() - timedelta(hours=hours)
+        with self._borrow() as conn:
+            if not self._scan_plan_checked:
+                with conn.cursor(cursor_factory=TupleCursor) as cur:
+                    self._check_historical_scan_plan(cur, since)
+            
+            # 배열 변환을 위해 딕셔너리 대신 튜플 행으로 조회
+            with conn.cursor(name='hist_stream', cursor_factory=TupleCursor) as cur:
+                cur.execute(self._select_since_sql, (since,))
+                while True:
+                    rows = cur.fetchmany(HISTORY_FETCH_SIZE)
+                    if not rows:
+                        break
+                    yield from self._convert_rows_to_reservoir_format(rows)
+    
+    def _check_historical_scan_plan(self, cur, since: datetime):
+        """과거 데이터 조회가 순차 스캔으로 계획되는지 점검 (테이블이 커지면 파티셔닝 권고)"""
+        self._scan_plan_checked = True
+        try:
+            cur.execute(f"EXPLAIN {self._select_since_sql}", (since,))
+            plan = '\n'.join(row[0] for row in cur.fetchall())
+            if 'Seq Scan on water' in plan:
+                logger.warning(
+                    "과거 데이터 조회가 water 테이블 순차 스캔으로 실행됩니다. "
+                    "데이터가 많다면 measured_at 기준 일 단위 파티셔닝을 검토하세요"
+                )
+        except Exception as e:
+            # 실패한 트랜잭션을 되돌려 이어지는 본 조회는 그대로 실행되도록 함
+            cur.connection.rollback()
+            logger.warning(f"과거 데이터 조회 실행 계획 점검 실패: {e}")
+    
     def get_system_health(self) -> Dict[str, Any]:
         """시스템 건강 상태 분석"""
         try:
@@ -259,43 +669,26 @@ class DatabaseConnector:
             if not latest_data:
                 return {"status": "ERROR", "message": "데이터를 조회할 수 없습니다"}
             
-            critical_reservoirs = []
-            warning_reservoirs = []
-            normal_reservoirs = []
+            reservoir_ids = list(latest_data)
+            snapshots = list(latest_data.values())
+            codes = _classify(
+                np.fromiter((data.water_level for data in snapshots), dtype=np.float64, count=len(snapshots)),
+                np.fromiter((data.alert_level for data in snapshots), dtype=np.float64, count=len(snapshots))
+            )
             
-            for reservoir_id, data in latest_data.items():
-                water_level = data['water_level']
-                alert_level = data['alert_level']
-                
-                if water_level >= alert_level:
-                    critical_reservoirs.append({
-                        'id': reservoir_id,
-                        'name': data['reservoir_name'],
-                        'level': water_level,
-                        'threshold': alert_level
-                    })
-                elif water_level >= alert_level * 0.8:
-                    warning_reservoirs.append({
-                        'id': reservoir_id,
-                        'name': data['reservoir_name'],
-                        'level': water_level,
-                        'threshold': alert_level
-                    })
-                else:
-                    normal_reservoirs.append({
-                        'id': reservoir_id,
-                        'name': data['reservoir_name'],
-                        'level': water_level,
-                        'threshold': alert_level
-                    })
+            # 상태 코드 순서대로 정상 / 주의 / 위험 목록
+            grouped = ([], [], [])
+            for reservoir_id, data, code in zip(reservoir_ids, snapshots, codes.tolist()):
+                grouped[code].append({
+                    'id': reservoir_id,
+                    'name': data.reservoir_name,
+                    'level': data.water_level,
+                    'threshold': data.alert_level
+                })
+            normal_reservoirs, warning_reservoirs, critical_reservoirs = grouped
             
-            # 전체 상태 결정
-            if critical_reservoirs:
-                overall_status = "CRITICAL"
-            elif warning_reservoirs:
-                overall_status = "WARNING"
-            else:
-                overall_status = "NORMAL"
+            # 전체 상태 결정 (가장 나쁜 배수지 기준)
+            overall_status = str(HEALTH_STATUS_NAMES[codes.max()])
             
             return {
                 "status": overall_status,
@@ -303,19 +696,118 @@ class DatabaseConnector:
                 "warning_reservoirs": warning_reservoirs,
                 "normal_reservoirs": normal_reservoirs,
                 "total_reservoirs": len(latest_data),
-                "last_update": self._last_update.isoformat() if self._last_update else None
+                "last_update": self._last_update_wall.isoformat() if self._last_update_wall else None
+            }
+            
+        except Exception as e:
+            logger.error(f"시스템 건강 상태 분석 오류: {e}")
+            return {"status": "ERROR", "message": str(e)}
+
+    def get_system_health_sql(self) -> Dict[str, Any]:
+        """시스템 건강 상태 분석 (분류를 SQL에서 수행, 최신 수위 데이터와 같은 캐시 정책)"""
+        cached, last_update, generation = self._health_snapshot
+        current_generation = self._snapshot[2]
+        if cached and generation == current_generation:
+            if time.monotonic() - last_update < CACHE_TTL_SECONDS:
+                return cached
+        
+        try:
+            with self._borrow() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(self._health_sql)
+                    rows = cur.fetchall()
+            
+            if not rows:
+                return {"status": "ERROR", "message": "데이터를 조회할 수 없습니다"}
+            
+            grouped = {"CRITICAL": [], "WARNING": [], "NORMAL": []}
+            for row in rows:
+                grouped[row['status']].append({
+                    'id': row['reservoir_id'],
+                    'name': self.reservoirs[row['reservoir_id']]['name'],
+                    'level': row['water_level'],
+                    'threshold': row['threshold']
+                })
+            
+            # 전체 상태 결정
+            if grouped["CRITICAL"]:
+                overall_status = "CRITICAL"
+            elif grouped["WARNING"]:
+                overall_status = "WARNING"
+            else:
+                overall_status = "NORMAL"
+            
+            health = {
+                "status": overall_status,
+                "critical_reservoirs": grouped["CRITICAL"],
+                "warning_reservoirs": grouped["WARNING"],
+                "normal_reservoirs": grouped["NORMAL"],
+                "total_reservoirs": len(rows),
+                "last_update": datetime.now().isoformat()
             }
+            self._health_snapshot = (health, time.monotonic(), current_generation)
+            return health
             
         except Exception as e:
             logger.error(f"시스템 건강 상태 분석 오류: {e}")
             return {"status": "ERROR", "message": str(e)}
+    
+    def get_health_history(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """과거 데이터 전체 행의 건강 상태 추이 (행 x 배수지 배열로 한 번에 분류)"""
+        history = self.get_historical_data(hours)
+        if not history:
+            return []
+        
+        reservoir_ids = [plan[0] for plan in self._reservoir_plan]
+        thresholds = np.array([plan[4] for plan in self._reservoir_plan], dtype=np.float64)
+        levels = np.array(
+            [[row[reservoir_id].water_level for reservoir_id in reservoir_ids] for row in history],
+            dtype=np.float64
+        )
+        codes = _classify(levels, thresholds)
+        overall = HEALTH_STATUS_NAMES[codes.max(axis=1)].tolist()
+        names = HEALTH_STATUS_NAMES[codes].tolist()
+        
+        return [
+            {
+                'measured_at': row[reservoir_ids[0]].measured_at,
+                'status': status,
+                'reservoirs': dict(zip(reservoir_ids, row_names))
+            }
+            for row, status, row_names in zip(history, overall, names)
+        ]
+
+    # === 비동기 인터페이스 (이벤트 루프를 막지 않도록 워커 스레드에서 실행) ===
+    
+    async def aget_latest_water_data(self, use_cache: bool = True) -> Optional[Dict[str, ReservoirSnapshot]]:
+        """최신 수위 데이터 조회 (비동기)"""
+        return await asyncio.to_thread(self.get_latest_water_data, use_cache)
+    
+    async def aupdate_pump_status(self, reservoir_id: str, pump_action: str) -> bool:
+        """펌프 상태 업데이트 (비동기, 쓰기 Future를 직접 대기)"""
+        future = self.submit_pump_status(reservoir_id, pump_action)
+        if future is None:
+            return False
+        
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), PUMP_WRITE_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.error(f"펌프 상태 업데이트 대기 오류: {e}")
+            return False
+    
+    async def aget_historical_data(self, hours: int = 24) -> List[Dict[str, ReservoirSnapshot]]:
+        """과거 데이터 조회 (비동기)"""
+        return await asyncio.to_thread(self.get_historical_data, hours)
 
 # 전역 커넥터 인스턴스
 _global_db_connector = None
+_global_db_connector_lock = threading.Lock()
 
 def get_database_connector() -> DatabaseConnector:
     """전역 데이터베이스 커넥터 인스턴스 반환"""
     global _global_db_connector
     if _global_db_connector is None:
-        _global_db_connector = DatabaseConnector()
+        with _global_db_connector_lock:
+            if _global_db_connector is None:
+                _global_db_connector = DatabaseConnector()
     return _global_db_connector
\ No newline at end of file
@@ -1,55 +1,138 @@
 # services/decision_engine.py - AI 기반 의사결정 엔진
 
+import asyncio
+import time
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List
-from dataclasses import dataclass
-from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, fields
+from enum import Enum, IntEnum
+from types import MappingProxyType
+import numpy as np
 
-from tools.water_level_monitoring_tool import WaterLevelMonitor
+from services._decision_kernels import TREND_NAMES, batch_trend_kernel, trend_kernel
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from tools.water_level_monitoring_tool import WaterLevelMonitor
+
 logger = setup_logger(__name__)
 
-class ActionType(Enum):
+# 위험도 구간 (수위 cm 하한) - 구간 번호 0~4가 RISK_LEVELS/RISK_SCORES 순서와 대응
+RISK_BINS = np.array([60.0, 80.0, 100.0, 120.0])
+RISK_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL", "EMERGENCY")
+RISK_SCORES = np.array([0.2, 0.4, 0.6, 0.8, 1.0])
+
+# 시간대 조정 전 기준 임계값
+BASE_THRESHOLDS = (("emergency", 120.0), ("critical", 100.0), ("warning", 80.0), ("normal", 60.0))
+
+# 행동 결정 표의 트렌드 코드 (앞 3개는 trend_kernel 결과 코드와 같음)
+TREND_CODES = {name: code for code, name in enumerate(TREND_NAMES + ("unknown",))}
+
+TREND_WINDOW = 5  # 트렌드 분석에 쓰는 최근 데이터 포인트 수
+
+_NO_PUMPS = MappingProxyType({})  # pump_statuses가 없을 때 쓰는 빈 읽기 전용 dict
+
+LEARNING_HISTORY_SIZE = 100  # 배수지별 학습 기록 보관 개수 (오래된 기록부터 자동 제거)
+
+class ActionType(str, Enum):
     PUMP_ON = "PUMP_ON"
     PUMP_OFF = "PUMP_OFF"
     MAINTAIN = "MAINTAIN"
     EMERGENCY_ALL_ON = "EMERGENCY_ALL_ON"
     ALERT_ONLY = "ALERT_ONLY"
 
-class UrgencyLevel(Enum):
+class UrgencyLevel(IntEnum):
     LOW = 1
     MEDIUM = 2
     HIGH = 3
     CRITICAL = 4
     EMERGENCY = 5
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class PredictedOutcome:
+    expected_level_reduction: float = 0.0
+    time_to_safe_level: int = 0  # seconds
+    energy_saved: bool = False
+    maintained_safe_level: bool = False
+    status: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """로그/JSON용 딕셔너리 변환 (기본값이 아닌 항목만 포함)"""
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if getattr(self, field.name) != field.default
+        }
+
+# 분기별 예상 결과 (불변 객체라 모든 결정이 공유)
+_EMERGENCY_OUTCOME = PredictedOutcome(expected_level_reduction=15, time_to_safe_level=900)
+_CRITICAL_OUTCOME = PredictedOutcome(expected_level_reduction=10, time_to_safe_level=1200)
+_PREEMPTIVE_OUTCOME = PredictedOutcome(expected_level_reduction=8, time_to_safe_level=1500)
+_STABILIZE_OUTCOME = PredictedOutcome(expected_level_reduction=5, time_to_safe_level=1800)
+_ENERGY_SAVE_OUTCOME = PredictedOutcome(energy_saved=True, maintained_safe_level=True)
+_OPTIMAL_OUTCOME = PredictedOutcome(status="optimal")
+_MAINTAIN_OUTCOME = PredictedOutcome(status="maintain")
+_EMPTY_OUTCOME = PredictedOutcome()
+
+@dataclass(slots=True)
 class Decision:
     reservoir_id: str
     action: ActionType
-    target_pumps: List[str]
+    target_pumps: Tuple[str, ...]
     confidence: float  # 0-1
     urgency: UrgencyLevel
     reasoning: str
-    predicted_outcome: Dict[str, Any]
+    predicted_outcome: PredictedOutcome
     estimated_time_to_effect: int  # seconds
 
-@dataclass
+@dataclass(slots=True)
 class PredictionData:
     current_trend: str  # "rising", "falling", "stable"
     predicted_level_30min: float
     predicted_level_1hour: float
     confidence: float
 
+@dataclass(slots=True)
+class RiskInfo:
+    level: str
+    score: float
+    description: str
+
+@dataclass(slots=True)
+class PumpAnalysis:
+    available_pumps: Tuple[str, ...]
+    active_pumps: Tuple[str, ...]
+    active_count: int
+    total_count: int
+    utilization_rate: float
+    can_increase: bool
+    can_decrease: bool
+
+@dataclass(slots=True)
+class TrendAnalysis:
+    trend: str  # "rising", "falling", "stable", "unknown"
+    rate_of_change: float
+    confidence: float
+
+@dataclass(slots=True)
+class SituationAnalysis:
+    current_risk_level: RiskInfo
+    time_adjusted_threshold: Mapping[str, float]
+    pump_status_analysis: PumpAnalysis
+    trend_analysis: TrendAnalysis
+    efficiency_score: float
+
 class IntelligentDecisionEngine:
     """AI 기반 지능형 의사결정 엔진"""
     
     def __init__(self):
-        self.water_monitor = WaterLevelMonitor()
+        # 수위 모니터는 처음 접근할 때 생성 (판단 로직만 쓰는 경우 도구 모듈 로딩 생략)
+        self._water_monitor: Optional["WaterLevelMonitor"] = None
         
-        # 학습 데이터 저장소
-        self.historical_patterns = {}
+        # 학습 데이터 저장소 (배수지별 최근 기록 deque)
+        self.historical_patterns: Dict[str, deque] = {}
         self.pump_efficiency_data = {}
         
         # 고급 규칙 설정
@@ -77,61 +160,168 @@ class IntelligentDecisionEngine:
                 "cooldown_between_cycles": 180  # 3분 쿨다운
             }
         }
+        
+        # 시간(0~23시)별 임계값 배수 (사용량 적은 시간대가 피크 시간대보다 우선)
+        time_rules = self.advanced_rules["time_based_thresholds"]
+        hour_multiplier = [1.0] * 24
+        for rule_name in ("peak_hours", "low_usage"):
+            multiplier = time_rules[rule_name]["threshold_multiplier"]
+            for start_hour, end_hour in time_rules[rule_name]["times"]:
+                hour_multiplier[start_hour:end_hour + 1] = [multiplier] * (end_hour - start_hour + 1)
+        self._hour_multiplier = tuple(hour_multiplier)
+        
+        # 시간별 조정 임계값은 시각에만 의존하므로 24개를 미리 만들어 공유 (읽기 전용)
+        self._hour_thresholds = tuple(
+            MappingProxyType({key: value * multiplier for key, value in BASE_THRESHOLDS})
+            for multiplier in self._hour_multiplier
+        )
+        
+        self._action_table = self._build_action_table()
+
+    @property
+    def water_monitor(self) -> "WaterLevelMonitor":
+        """수위 모니터 (최초 접근 시 생성)"""
+        if self._water_monitor is None:
+            from tools.water_level_monitoring_tool import WaterLevelMonitor
+            self._water_monitor = WaterLevelMonitor()
+        return self._water_monitor
 
+    @classmethod
+    def batch_classify(cls, levels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """여러 수위의 위험도 구간 번호와 점수를 한 번에 계산"""
+        risk_codes = np.searchsorted(RISK_BINS, levels, side='right')
+        return risk_codes, RISK_SCORES[risk_codes]
+    
+    def make_decisions_batch(self, items: List[Tuple[Dict[str, Any], Optional[List[Dict]]]]) -> List[Decision]:
+        """여러 배수지 의사결정 일괄 수행 (위험도/임계값 계산을 배열 연산으로 한 번에 처리)"""
+        if not items:
+            return []
+        
+        levels = np.fromiter(
+            (reservoir_data.get('current_level') or 0 for reservoir_data, _ in items),
+            dtype=np.float64,
+            count=len(items)
+        )
+        risk_codes, risk_scores = self.batch_classify(levels)
+        
+        # 같은 시각에 판단하므로 시간대 조정 임계값은 모든 배수지가 공유
+        thresholds = self._get_time_adjusted_threshold(datetime.now().hour)
+        
+        # 최근 수위를 (배수지 수, TREND_WINDOW) 행렬로 모아 트렌드를 한 번에 계산
+        trend_levels = np.zeros((len(items), TREND_WINDOW))
+        trend_counts = np.zeros(len(items), dtype=np.int64)
+        for row, (_, historical_context) in enumerate(items):
+            if not historical_context or len(historical_context) < 2:
+                continue
+            recent = historical_context[-TREND_WINDOW:]
+            try:
+                trend_levels[row, :len(recent)] = np.fromiter(
+                    (point.get('current_level', 0) for point in recent),
+                    dtype=np.float64,
+                    count=len(recent)
+                )
+            except (AttributeError, TypeError, ValueError):
+                continue  # 변환할 수 없는 데이터는 개별 판단 경로에서 처리
+            trend_counts[row] = len(recent)
+        trend_codes, trend_rates, trend_confidences = batch_trend_kernel(trend_levels, trend_counts)
+        
+        decisions = []
+        for row, (reservoir_data, historical_context) in enumerate(items):
+            code = int(risk_codes[row])
+            risk_info = RiskInfo(
+                level=RISK_LEVELS[code],
+                score=float(risk_scores[row]),
+                description=f"수위 {reservoir_data.get('current_level', 0)}cm - {RISK_LEVELS[code]} 위험도"
+            )
+            trend_analysis = None
+            if trend_counts[row]:
+                trend_analysis = TrendAnalysis(
+                    trend=TREND_NAMES[trend_codes[row]],
+                    rate_of_change=float(trend_rates[row]),
+                    confidence=float(trend_confidences[row])
+                )
+            decisions.append(
+                self._make_decision(reservoir_data, historical_context, risk_info, thresholds, trend_analysis)
+            )
+        
+        return decisions
+    
     def make_decision(self, reservoir_data: Dict[str, Any], historical_context: List[Dict] = None) -> Decision:
         """종합적인 의사결정 수행"""
+        return self._make_decision(reservoir_data, historical_context)
+    
+    async def amake_decision(self, reservoir_data: Dict[str, Any], historical_context: List[Dict] = None) -> Decision:
+        """종합적인 의사결정 수행 (비동기, 워커 스레드에서 실행)"""
+        return await asyncio.to_thread(self.make_decision, reservoir_data, historical_context)
+    
+    async def amake_decisions(self, items: List[Tuple[Dict[str, Any], Optional[List[Dict]]]]) -> List[Decision]:
+        """여러 배수지 동시 의사결정 (비동기, 두 곳 이상이면 make_decisions_batch로 일괄 처리)"""
+        if len(items) == 1:
+            return [await self.amake_decision(*items[0])]
+        return await asyncio.to_thread(self.make_decisions_batch, items)
+    
+    def _make_decision(self, reservoir_data: Dict[str, Any], historical_context: List[Dict] = None,
+                       risk_info: Optional[RiskInfo] = None, thresholds: Optional[Mapping[str, float]] = None,
+                       trend_analysis: Optional[TrendAnalysis] = None) -> Decision:
+        """의사결정 수행 (일괄 경로에서 미리 계산한 위험도/임계값/트렌드가 있으면 재사용)"""
         try:
             reservoir_id = reservoir_data.get('reservoir_id', '')
             current_level = reservoir_data.get('current_level', 0)
-            pump_statuses = reservoir_data.get('pump_statuses', {})
+            pump_statuses = reservoir_data.get('pump_statuses') or _NO_PUMPS
+            
+            # 시간대 조정 임계값 (판단 1회당 현재 시각을 한 번만 읽음)
+            if thresholds is None:
+                thresholds = self._get_time_adjusted_threshold(datetime.now().hour)
             
             # 1. 현재 상황 분석
-            situation_analysis = self._analyze_situation(reservoir_data, historical_context)
+            situation_analysis = self._analyze_situation(
+                reservoir_id, current_level, pump_statuses, historical_context, risk_info, thresholds, trend_analysis
+            )
             
             # 2. 미래 예측
-            prediction = self._predict_water_level(reservoir_id, current_level, historical_context)
+            prediction = self._predict_water_level(
+                reservoir_id, current_level, historical_context,
+                trend_analysis=situation_analysis.trend_analysis
+            )
             
             # 3. 최적 행동 결정
             decision = self._determine_optimal_action(
-                reservoir_data, situation_analysis, prediction
+                reservoir_id, current_level, pump_statuses, situation_analysis, prediction
             )
             
-            logger.info(f"[{reservoir_id}] 의사결정 완료: {decision.action.value} "
-                       f"(신뢰도: {decision.confidence:.2f}, 긴급도: {decision.urgency.name})")
+            logger.info("[%s] 의사결정 완료: %s (신뢰도: %.2f, 긴급도: %s)",
+                        reservoir_id, decision.action.value, decision.confidence, decision.urgency.name)
             
             return decision
             
         except Exception as e:
-            logger.error(f"의사결정 중 오류: {e}")
+            logger.error("의사결정 중 오류: %s", e)
             # 안전한 기본 결정 반환
             return Decision(
                 reservoir_id=reservoir_data.get('reservoir_id', 'unknown'),
                 action=ActionType.MAINTAIN,
-                target_pumps=[],
+                target_pumps=(),
                 confidence=0.5,
                 urgency=UrgencyLevel.LOW,
                 reasoning="오류로 인한 기본 결정",
-                predicted_outcome={},
+                predicted_outcome=_EMPTY_OUTCOME,
                 estimated_time_to_effect=0
             )
 
-    def _analyze_situation(self, reservoir_data: Dict[str, Any], historical_context: List[Dict] = None) -> Dict[str, Any]:
+    def _analyze_situation(self, reservoir_id: str, current_level: float, pump_statuses: Mapping[str, bool],
+                           historical_context: List[Dict], risk_info: Optional[RiskInfo],
+                           thresholds: Mapping[str, float],
+                           trend_analysis: Optional[TrendAnalysis] = None) -> SituationAnalysis:
         """현재 상황 종합 분석"""
-        reservoir_id = reservoir_data.get('reservoir_id', '')
-        current_level = reservoir_data.get('current_level', 0)
-        pump_statuses = reservoir_data.get('pump_statuses', {})
-        
-        analysis = {
-            "current_risk_level": self._calculate_risk_level(current_level),
-            "time_adjusted_threshold": self._get_time_adjusted_threshold(current_level),
-            "pump_status_analysis": self._analyze_pump_status(pump_statuses),
-            "trend_analysis": self._analyze_trend(reservoir_id, historical_context),
-            "efficiency_score": self._calculate_system_efficiency(reservoir_id)
-        }
-        
-        return analysis
+        return SituationAnalysis(
+            current_risk_level=risk_info or self._calculate_risk_level(current_level),
+            time_adjusted_threshold=thresholds,
+            pump_status_analysis=self._analyze_pump_status(pump_statuses),
+            trend_analysis=trend_analysis or self._analyze_trend(reservoir_id, historical_context),
+            efficiency_score=self._calculate_system_efficiency(reservoir_id)
+        )
 
-    def _calculate_risk_level(self, water_level: float) -> Dict[str, Any]:
+    def _calculate_risk_level(self, water_level: float) -> RiskInfo:
         """위험도 계산"""
         if water_level >= 120:
             risk_level = "EMERGENCY"
@@ -149,99 +339,53 @@ class IntelligentDecisionEngine:
             risk_level = "LOW"
             risk_score = 0.2
             
-        return {
-            "level": risk_level,
-            "score": risk_score,
-            "description": f"수위 {water_level}cm - {risk_level} 위험도"
-        }
+        return RiskInfo(
+            level=risk_level,
+            score=risk_score,
+            description=f"수위 {water_level}cm - {risk_level} 위험도"
+        )
 
-    def _get_time_adjusted_threshold(self, current_level: float) -> Dict[str, float]:
+    def _get_time_adjusted_threshold(self, current_hour: int) -> Mapping[str, float]:
         """시간대별 임계값 조정"""
-        current_hour = datetime.now().hour
-        base_thresholds = {
-            "emergency": 120,
-            "critical": 100,
-            "warning": 80,
-            "normal": 60
-        }
-        
-        multiplier = 1.0
-        
-        # 피크 시간대 조정
-        for start_hour, end_hour in self.advanced_rules["time_based_thresholds"]["peak_hours"]["times"]:
-            if start_hour <= current_hour <= end_hour:
-                multiplier = self.advanced_rules["time_based_thresholds"]["peak_hours"]["threshold_multiplier"]
-                break
-        
-        # 사용량 적은 시간대 조정
-        for start_hour, end_hour in self.advanced_rules["time_based_thresholds"]["low_usage"]["times"]:
-            if start_hour <= current_hour <= end_hour:
-                multiplier = self.advanced_rules["time_based_thresholds"]["low_usage"]["threshold_multiplier"]
-                break
-        
-        adjusted_thresholds = {
-            key: value * multiplier 
-            for key, value in base_thresholds.items()
-        }
-        
-        return adjusted_thresholds
+        return self._hour_thresholds[current_hour]
 
-    def _analyze_pump_status(self, pump_statuses: Dict[str, bool]) -> Dict[str, Any]:
+    def _analyze_pump_status(self, pump_statuses: Mapping[str, bool]) -> PumpAnalysis:
         """펌프 상태 분석"""
-        active_pumps = [name for name, active in pump_statuses.items() if active]
-        total_pumps = len(pump_statuses)
-        active_count = len(active_pumps)
+        # 펌프 목록은 불변 튜플로 보관 (결정의 target_pumps가 복사 없이 그대로 공유)
+        available_pumps = tuple(pump_statuses)
+        active_pumps = tuple([name for name, active in pump_statuses.items() if active])
         
+        total_pumps = len(available_pumps)
+        active_count = len(active_pumps)
         utilization_rate = active_count / total_pumps if total_pumps > 0 else 0
         
-        return {
-            "active_pumps": active_pumps,
-            "active_count": active_count,
-            "total_count": total_pumps,
-            "utilization_rate": utilization_rate,
-            "can_increase": active_count < total_pumps,
-            "can_decrease": active_count > 0
-        }
+        return PumpAnalysis(
+            available_pumps=available_pumps,
+            active_pumps=active_pumps,
+            active_count=active_count,
+            total_count=total_pumps,
+            utilization_rate=utilization_rate,
+            can_increase=active_count < total_pumps,
+            can_decrease=active_count > 0
+        )
 
-    def _analyze_trend(self, reservoir_id: str, historical_context: List[Dict] = None) -> Dict[str, Any]:
+    def _analyze_trend(self, reservoir_id: str, historical_context: List[Dict] = None) -> TrendAnalysis:
         """수위 변화 트렌드 분석"""
         if not historical_context or len(historical_context) < 2:
-            return {
-                "trend": "unknown",
-                "rate_of_change": 0,
-                "confidence": 0.0
-            }
-        
-        # 최근 데이터 포인트들의 수위 변화 분석
-        recent_levels = [point.get('current_level', 0) for point in historical_context[-5:]]
+            return TrendAnalysis(trend="unknown", rate_of_change=0, confidence=0.0)
         
-        if len(recent_levels) >= 2:
-            # 간단한 차이 기반 트렌드 계산
-            first_level = recent_levels[0]
-            last_level = recent_levels[-1]
-            diff = last_level - first_level
-            rate_of_change = diff / len(recent_levels)
-                
-            if abs(rate_of_change) < 0.5:
-                trend = "stable"
-            elif rate_of_change > 0:
-                trend = "rising"
-            else:
-                trend = "falling"
-            
-            confidence = min(1.0, abs(rate_of_change) / 10.0)  # 기울기에 따른 신뢰도
-            
-            return {
-                "trend": trend,
-                "rate_of_change": rate_of_change,
-                "confidence": confidence
-            }
+        # 최근 데이터 포인트들의 수위 변화 분석 (수치 계산은 커널에서 수행)
+        recent_levels = np.fromiter(
+            (point.get('current_level', 0) for point in historical_context[-TREND_WINDOW:]),
+            dtype=np.float64
+        )
+        trend, rate_of_change, confidence = trend_kernel(recent_levels)
         
-        return {
-            "trend": "unknown",
-            "rate_of_change": 0,
-            "confidence": 0.0
-        }
+        return TrendAnalysis(
+            trend=TREND_NAMES[trend],
+            rate_of_change=float(rate_of_change),
+            confidence=float(confidence)
+        )
 
     def _calculate_system_efficiency(self, reservoir_id: str) -> float:
         """시스템 효율성 점수"""
@@ -249,7 +393,8 @@ class IntelligentDecisionEngine:
         # 실제로는 과거 펌프 가동 이력과 수위 변화 데이터를 분석하여 계산
         return 0.8  # 임시 값
 
-    def _predict_water_level(self, reservoir_id: str, current_level: float, historical_context: List[Dict] = None) -> PredictionData:
+    def _predict_water_level(self, reservoir_id: str, current_level: float, historical_context: List[Dict] = None,
+                             trend_analysis: Optional[TrendAnalysis] = None) -> PredictionData:
         """수위 변화 예측"""
         if not historical_context:
             # 기본 예측 (변화 없음)
@@ -260,136 +405,170 @@ class IntelligentDecisionEngine:
                 confidence=0.5
             )
         
-        trend_analysis = self._analyze_trend(reservoir_id, historical_context)
-        rate_of_change = trend_analysis.get("rate_of_change", 0)
+        # 상황 분석에서 이미 계산한 트렌드가 있으면 재사용
+        if trend_analysis is None:
+            trend_analysis = self._analyze_trend(reservoir_id, historical_context)
+        rate_of_change = trend_analysis.rate_of_change
         
         # 30분, 1시간 후 예측 (단순 선형 외삽)
         predicted_30min = current_level + (rate_of_change * 6)  # 5분 간격 * 6 = 30분
         predicted_1hour = current_level + (rate_of_change * 12)  # 5분 간격 * 12 = 1시간
         
         return PredictionData(
-            current_trend=trend_analysis.get("trend", "unknown"),
+            current_trend=trend_analysis.trend,
             predicted_level_30min=max(0, predicted_30min),
             predicted_level_1hour=max(0, predicted_1hour),
-            confidence=trend_analysis.get("confidence", 0.5)
+            confidence=trend_analysis.confidence
         )
 
-    def _determine_optimal_action(self, reservoir_data: Dict[str, Any], situation_analysis: Dict, prediction: PredictionData) -> Decision:
+    def _build_action_table(self) -> Dict[Tuple[int, int], Callable[..., Decision]]:
+        """(수위 구간, 트렌드 코드) -> 행동 결정 함수 표"""
+        table = {}
+        for trend in TREND_CODES.values():
+            table[(0, trend)] = self._act_normal
+            table[(1, trend)] = self._act_default
+            table[(3, trend)] = self._act_critical_rising if trend == TREND_CODES["rising"] else self._act_critical_steady
+            table[(4, trend)] = self._act_emergency
+        table[(2, TREND_CODES["rising"])] = self._act_warning_rising
+        table[(2, TREND_CODES["stable"])] = self._act_warning_steady
+        table[(2, TREND_CODES["falling"])] = self._act_warning_steady
+        table[(2, TREND_CODES["unknown"])] = self._act_default
+        return table
+
+    def _determine_optimal_action(self, reservoir_id: str, current_level: float, pump_statuses: Mapping[str, bool],
+                                  situation_analysis: SituationAnalysis, prediction: PredictionData) -> Decision:
         """최적 행동 결정"""
-        reservoir_id = reservoir_data.get('reservoir_id', '')
-        current_level = reservoir_data.get('current_level', 0)
-        pump_statuses = reservoir_data.get('pump_statuses', {})
+        thresholds = situation_analysis.time_adjusted_threshold
         
-        risk_info = situation_analysis["current_risk_level"]
-        thresholds = situation_analysis["time_adjusted_threshold"]
-        pump_analysis = situation_analysis["pump_status_analysis"]
+        # 펌프 목록 (상황 분석에서 수집한 목록 재사용)
+        pump_analysis = situation_analysis.pump_status_analysis
+        available_pumps = pump_analysis.available_pumps
+        active_pumps = pump_analysis.active_pumps
         
-        # 펌프 목록
-        available_pumps = list(pump_statuses.keys())
-        active_pumps = pump_analysis["active_pumps"]
-        
-        # 긴급 상황 처리
-        if current_level >= thresholds["emergency"] or prediction.predicted_level_30min >= thresholds["emergency"]:
-            return Decision(
-                reservoir_id=reservoir_id,
-                action=ActionType.EMERGENCY_ALL_ON,
-                target_pumps=available_pumps,
-                confidence=0.95,
-                urgency=UrgencyLevel.EMERGENCY,
-                reasoning=f"긴급 상황: 현재 {current_level}cm, 30분 후 예상 {prediction.predicted_level_30min:.1f}cm",
-                predicted_outcome={"expected_level_reduction": 15, "time_to_safe_level": 900},
-                estimated_time_to_effect=60
+        # 수위 구간: 0=정상 미만, 1=정상~주의, 2=주의~위험, 3=위험~긴급, 4=긴급 (30분 후 예상이 긴급이어도 4)
+        if prediction.predicted_level_30min >= thresholds["emergency"]:
+            bucket = 4
+        else:
+            bucket = bisect_right(
+                (thresholds["normal"], thresholds["warning"], thresholds["critical"], thresholds["emergency"]),
+                current_level
             )
         
-        # 위험 상황
-        if current_level >= thresholds["critical"]:
-            confidence = 0.85
-            if prediction.current_trend == "rising":
-                # 상승 중이면 더 많은 펌프 가동
-                target_pumps = available_pumps[:min(2, len(available_pumps))]
-                reasoning = f"위험 상황에서 수위 상승 중: {current_level}cm → {prediction.predicted_level_30min:.1f}cm"
-            else:
-                # 안정/하강이면 1-2개 펌프로 충분
-                needed_pumps = 1 if len(active_pumps) == 0 else min(2, len(available_pumps))
-                target_pumps = available_pumps[:needed_pumps]
-                reasoning = f"위험 상황이지만 수위 안정화 중: {current_level}cm"
-            
+        handler = self._action_table[(bucket, TREND_CODES.get(prediction.current_trend, TREND_CODES["unknown"]))]
+        return handler(reservoir_id, current_level, available_pumps, active_pumps, prediction, thresholds)
+
+    def _act_emergency(self, reservoir_id: str, current_level: float, available_pumps: Tuple[str, ...], active_pumps: Tuple[str, ...],
+                    prediction: PredictionData, thresholds: Mapping[str, float]) -> Decision:
+        """긴급 상황 처리"""
+        return Decision(
+            reservoir_id=reservoir_id,
+            action=ActionType.EMERGENCY_ALL_ON,
+            target_pumps=available_pumps,
+            confidence=0.95,
+            urgency=UrgencyLevel.EMERGENCY,
+            reasoning=f"긴급 상황: 현재 {current_level}cm, 30분 후 예상 {prediction.predicted_level_30min:.1f}cm",
+            predicted_outcome=_EMERGENCY_OUTCOME,
+            estimated_time_to_effect=60
+        )
+
+    def _act_critical_rising(self, reservoir_id: str, current_level: float, available_pumps: Tuple[str, ...], active_pumps: Tuple[str, ...],
+                    prediction: PredictionData, thresholds: Mapping[str, float]) -> Decision:
+        """위험 상황 - 상승 중이면 더 많은 펌프 가동"""
+        return Decision(
+            reservoir_id=reservoir_id,
+            action=ActionType.PUMP_ON,
+            target_pumps=available_pumps[:min(2, len(available_pumps))],
+            confidence=0.85,
+            urgency=UrgencyLevel.CRITICAL,
+            reasoning=f"위험 상황에서 수위 상승 중: {current_level}cm → {prediction.predicted_level_30min:.1f}cm",
+            predicted_outcome=_CRITICAL_OUTCOME,
+            estimated_time_to_effect=120
+        )
+
+    def _act_critical_steady(self, reservoir_id: str, current_level: float, available_pumps: Tuple[str, ...], active_pumps: Tuple[str, ...],
+                    prediction: PredictionData, thresholds: Mapping[str, float]) -> Decision:
+        """위험 상황 - 안정/하강이면 1-2개 펌프로 충분"""
+        needed_pumps = 1 if len(active_pumps) == 0 else min(2, len(available_pumps))
+        return Decision(
+            reservoir_id=reservoir_id,
+            action=ActionType.PUMP_ON,
+            target_pumps=available_pumps[:needed_pumps],
+            confidence=0.85,
+            urgency=UrgencyLevel.CRITICAL,
+            reasoning=f"위험 상황이지만 수위 안정화 중: {current_level}cm",
+            predicted_outcome=_CRITICAL_OUTCOME,
+            estimated_time_to_effect=120
+        )
+
+    def _act_warning_rising(self, reservoir_id: str, current_level: float, available_pumps: Tuple[str, ...], active_pumps: Tuple[str, ...],
+                    prediction: PredictionData, thresholds: Mapping[str, float]) -> Decision:
+        """주의 상황 - 곧 위험해질 것으로 예상되면 선제적 대응"""
+        if prediction.predicted_level_30min < thresholds["critical"]:
+            return self._act_default(reservoir_id, current_level, available_pumps, active_pumps, prediction, thresholds)
+        
+        return Decision(
+            reservoir_id=reservoir_id,
+            action=ActionType.PUMP_ON,
+            target_pumps=available_pumps[:2],
+            confidence=0.8,
+            urgency=UrgencyLevel.HIGH,
+            reasoning=f"선제적 대응: 30분 후 위험 수위 예상 ({prediction.predicted_level_30min:.1f}cm)",
+            predicted_outcome=_PREEMPTIVE_OUTCOME,
+            estimated_time_to_effect=180
+        )
+
+    def _act_warning_steady(self, reservoir_id: str, current_level: float, available_pumps: Tuple[str, ...], active_pumps: Tuple[str, ...],
+                    prediction: PredictionData, thresholds: Mapping[str, float]) -> Decision:
+        """주의 상황 - 안정적이면 최소한의 펌프만 가동"""
+        return Decision(
+            reservoir_id=reservoir_id,
+            action=ActionType.PUMP_ON,
+            target_pumps=available_pumps[:1],
+            confidence=0.7,
+            urgency=UrgencyLevel.MEDIUM,
+            reasoning=f"주의 수위에서 안정화 제어: {current_level}cm",
+            predicted_outcome=_STABILIZE_OUTCOME,
+            estimated_time_to_effect=240
+        )
+
+    def _act_normal(self, reservoir_id: str, current_level: float, available_pumps: Tuple[str, ...], active_pumps: Tuple[str, ...],
+                    prediction: PredictionData, thresholds: Mapping[str, float]) -> Decision:
+        """정상 범위 - 가동 중인 펌프가 있으면 중단, 없으면 현상 유지"""
+        if len(active_pumps) > 0:
+            # 불필요한 펌프 중단
             return Decision(
                 reservoir_id=reservoir_id,
-                action=ActionType.PUMP_ON,
-                target_pumps=target_pumps,
-                confidence=confidence,
-                urgency=UrgencyLevel.CRITICAL,
-                reasoning=reasoning,
-                predicted_outcome={"expected_level_reduction": 10, "time_to_safe_level": 1200},
-                estimated_time_to_effect=120
+                action=ActionType.PUMP_OFF,
+                target_pumps=active_pumps,
+                confidence=0.9,
+                urgency=UrgencyLevel.LOW,
+                reasoning=f"정상 수위로 펌프 중단: {current_level}cm < {thresholds['normal']}cm",
+                predicted_outcome=_ENERGY_SAVE_OUTCOME,
+                estimated_time_to_effect=30
             )
         
-        # 주의 상황
-        if current_level >= thresholds["warning"]:
-            # 예측을 고려한 정교한 제어
-            if prediction.current_trend == "rising" and prediction.predicted_level_30min >= thresholds["critical"]:
-                # 곧 위험해질 것으로 예상되면 선제적 대응
-                return Decision(
-                    reservoir_id=reservoir_id,
-                    action=ActionType.PUMP_ON,
-                    target_pumps=available_pumps[:2],
-                    confidence=0.8,
-                    urgency=UrgencyLevel.HIGH,
-                    reasoning=f"선제적 대응: 30분 후 위험 수위 예상 ({prediction.predicted_level_30min:.1f}cm)",
-                    predicted_outcome={"expected_level_reduction": 8, "time_to_safe_level": 1500},
-                    estimated_time_to_effect=180
-                )
-            elif prediction.current_trend == "stable" or prediction.current_trend == "falling":
-                # 안정적이면 최소한의 펌프만 가동
-                target_pump = available_pumps[:1]
-                return Decision(
-                    reservoir_id=reservoir_id,
-                    action=ActionType.PUMP_ON,
-                    target_pumps=target_pump,
-                    confidence=0.7,
-                    urgency=UrgencyLevel.MEDIUM,
-                    reasoning=f"주의 수위에서 안정화 제어: {current_level}cm",
-                    predicted_outcome={"expected_level_reduction": 5, "time_to_safe_level": 1800},
-                    estimated_time_to_effect=240
-                )
-        
-        # 정상 범위
-        if current_level < thresholds["normal"]:
-            if len(active_pumps) > 0:
-                # 불필요한 펌프 중단
-                return Decision(
-                    reservoir_id=reservoir_id,
-                    action=ActionType.PUMP_OFF,
-                    target_pumps=active_pumps,
-                    confidence=0.9,
-                    urgency=UrgencyLevel.LOW,
-                    reasoning=f"정상 수위로 펌프 중단: {current_level}cm < {thresholds['normal']}cm",
-                    predicted_outcome={"energy_saved": True, "maintained_safe_level": True},
-                    estimated_time_to_effect=30
-                )
-            else:
-                # 현상 유지
-                return Decision(
-                    reservoir_id=reservoir_id,
-                    action=ActionType.MAINTAIN,
-                    target_pumps=[],
-                    confidence=0.95,
-                    urgency=UrgencyLevel.LOW,
-                    reasoning=f"정상 수위 유지: {current_level}cm",
-                    predicted_outcome={"status": "optimal"},
-                    estimated_time_to_effect=0
-                )
-        
-        # 기본 현상 유지
         return Decision(
             reservoir_id=reservoir_id,
             action=ActionType.MAINTAIN,
-            target_pumps=[],
+            target_pumps=(),
+            confidence=0.95,
+            urgency=UrgencyLevel.LOW,
+            reasoning=f"정상 수위 유지: {current_level}cm",
+            predicted_outcome=_OPTIMAL_OUTCOME,
+            estimated_time_to_effect=0
+        )
+
+    def _act_default(self, reservoir_id: str, current_level: float, available_pumps: Tuple[str, ...], active_pumps: Tuple[str, ...],
+                    prediction: PredictionData, thresholds: Mapping[str, float]) -> Decision:
+        """기본 현상 유지"""
+        return Decision(
+            reservoir_id=reservoir_id,
+            action=ActionType.MAINTAIN,
+            target_pumps=(),
             confidence=0.6,
             urgency=UrgencyLevel.LOW,
             reasoning="현상 유지",
-            predicted_outcome={"status": "maintain"},
+            predicted_outcome=_MAINTAIN_OUTCOME,
             estimated_time_to_effect=0
         )
 
@@ -413,10 +592,10 @@ class IntelligentDecisionEngine:
             return evaluation
             
         except Exception as e:
-            logger.error(f"의사결정 평가 중 오류: {e}")
+            logger.error("의사결정 평가 중 오류: %s", e)
             return {"error": str(e)}
 
-    def _calculate_accuracy(self, predicted: Dict, actual: Dict) -> float:
+    def _calculate_accuracy(self, predicted: PredictedOutcome, actual: Dict) -> float:
         """예측 정확도 계산"""
         # 간단한 정확도 계산 로직
         return 0.8  # 임시값
@@ -431,10 +610,10 @@ class IntelligentDecisionEngine:
         reservoir_id = decision.reservoir_id
         
         if reservoir_id not in self.historical_patterns:
-            self.historical_patterns[reservoir_id] = []
+            self.historical_patterns[reservoir_id] = deque(maxlen=LEARNING_HISTORY_SIZE)
         
         learning_record = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),  # 요약 조회 시점에 문자열로 변환
             "decision": {
                 "action": decision.action.value,
                 "confidence": decision.confidence,
@@ -444,33 +623,34 @@ class IntelligentDecisionEngine:
             "evaluation": evaluation
         }
         
+        # 최근 LEARNING_HISTORY_SIZE개 기록만 유지 (deque가 가장 오래된 기록을 버림)
         self.historical_patterns[reservoir_id].append(learning_record)
-        
-        # 최근 100개 기록만 유지
-        if len(self.historical_patterns[reservoir_id]) > 100:
-            self.historical_patterns[reservoir_id] = self.historical_patterns[reservoir_id][-100:]
 
     def get_learning_summary(self, reservoir_id: str = None) -> Dict[str, Any]:
         """학습 현황 요약"""
         if reservoir_id:
-            patterns = self.historical_patterns.get(reservoir_id, [])
+            sources = (self.historical_patterns.get(reservoir_id, ()),)
         else:
-            patterns = []
-            for reservoir_patterns in self.historical_patterns.values():
-                patterns.extend(reservoir_patterns)
+            sources = self.historical_patterns.values()
         
-        if not patterns:
-            return {"message": "학습 데이터 없음"}
+        # 기록을 모으지 않고 한 번에 훑으며 집계 (마지막으로 본 기록이 최신)
+        total_decisions = 0
+        successful_decisions = 0
+        latest_update = None
+        for patterns in sources:
+            for pattern in patterns:
+                total_decisions += 1
+                if pattern.get("evaluation", {}).get("effectiveness_score", 0) > 0.7:
+                    successful_decisions += 1
+                latest_update = pattern["timestamp"]
         
-        # 기본 통계
-        total_decisions = len(patterns)
-        successful_decisions = len([p for p in patterns if p.get("evaluation", {}).get("effectiveness_score", 0) > 0.7])
-        success_rate = successful_decisions / total_decisions if total_decisions > 0 else 0
+        if not total_decisions:
+            return {"message": "학습 데이터 없음"}
         
         return {
             "total_decisions": total_decisions,
             "successful_decisions": successful_decisions,
-            "success_rate": success_rate,
+            "success_rate": successful_decisions / total_decisions,
             "learning_period": f"{len(self.historical_patterns)} 배수지",
-            "latest_update": patterns[-1]["timestamp"] if patterns else "없음"
-        }
\ No newline at end of file
+            "latest_update": datetime.fromtimestamp(latest_update).isoformat()
+        }
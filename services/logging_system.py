@@ -1,20 +1,89 @@
 # services/logging_system.py - 자동화 전용 로깅 및 알림 시스템
 
-import json
+import atexit
 import csv
+import gzip
 import os
+import shutil
+import time
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import threading
 from pathlib import Path
 
+import orjson
+
+from config import AUTOMATION_LOG_CONSOLE_LEVEL, AUTOMATION_LOG_DB_LEVEL, AUTOMATION_LOG_FILE_LEVEL
 from storage.postgresql_storage import PostgreSQLStorage
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# 로그 파일 설정
+FILE_BUFFER_SIZE = 1 << 16  # 로그 파일 쓰기 버퍼 크기 (64KiB, 메인 로그는 이만큼 모이면 바로 기록)
+FILE_FLUSH_INTERVAL_SECONDS = 1.0  # 파일 버퍼를 디스크로 내보내는 주기
+MAIN_LOG_ROTATE_BYTES = 16 << 20  # 메인 로그가 이 크기를 넘으면 회전 후 gzip 압축 (16MiB)
+
+DECISION_HISTORY_SIZE = 100  # 의사결정 JSONL 파일에 유지할 최근 기록 수
+DECISION_COMPACT_THRESHOLD = 200  # 이 줄 수를 넘으면 최근 DECISION_HISTORY_SIZE개로 압축
+
+# 알림 조건 키 -> 조건 판단에 쓰는 details 키 (해당 키가 있는 로그만 규칙 확인)
+ALERT_CONDITION_DETAIL_KEYS = {
+    "water_level_above": "current_level",
+    "pump_control_failure": "result",
+    "arduino_connected": "arduino_connected",
+    "failed_pumps_count_above": "failed_pumps_count"
+}
+
+RESERVOIR_LOG_BUFFER_SIZE = 200  # 배수지별 최근 로그 보관 개수 (get_logs_by_reservoir용)
+
+CSV_HEADER = ["timestamp", "session_id", "level", "event_type", "reservoir_id", "message", "details"]
+CSV_LINE_END = "\r\n"  # csv.writer 기본 줄바꿈과 동일
+
+# 문자열이 아닌 키(int 등)와 NumPy 값도 허용, 그 외 타입은 str()로 변환
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _to_json(payload: Any) -> str:
+    """로그 데이터를 압축 JSON 문자열로 직렬화 (한글 그대로 유지)"""
+    return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode()
+
+def _compress_log_file(path: Path):
+    """회전된 로그 파일을 gzip으로 압축하고 원본 삭제"""
+    try:
+        with open(path, "rb") as src, gzip.open(path.with_name(path.name + ".gz"), "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        path.unlink()
+    except Exception as e:
+        logger.error(f"로그 파일 압축 오류: {e}")
+
+def _csv_field(value: Any) -> str:
+    """CSV 필드 변환 (쉼표/따옴표/줄바꿈이 있을 때만 따옴표로 감쌈 - csv.QUOTE_MINIMAL과 동일)"""
+    text = "" if value is None else str(value)
+    if '"' in text or "," in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+# 로그 처리 스레드 설정
+LOG_QUEUE_SIZE = 10000  # 처리 대기 로그 최대 개수 (링 버퍼 - 가득 차면 가장 오래된 로그부터 버림)
+LOG_DRAIN_BATCH_SIZE = 256  # 처리 스레드가 한 번에 꺼내는 로그 수
+
+# DB 로그 일괄 저장 설정
+DB_FLUSH_BATCH_SIZE = 500  # 대기 중인 로그가 이 개수에 도달하면 즉시 저장
+DB_FLUSH_INTERVAL_SECONDS = 2.0  # 마지막 저장 후 이 시간이 지나면 저장
+DB_INSERT_PAGE_SIZE = 1000  # execute_values 한 문장당 행 수
+
+# 로그 행은 일부 유실돼도 치명적이지 않으므로 이 트랜잭션만 WAL flush를 기다리지 않고 커밋
+# (details는 텍스트로 보내 서버에서 한 번만 jsonb로 변환)
+_DB_INSERT_SQL = """
+SET LOCAL synchronous_commit TO OFF;
+INSERT INTO automation_logs (timestamp, session_id, level, event_type, reservoir_id, message, details)
+VALUES %s
+"""
+_DB_INSERT_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s::jsonb)"
+
 class LogLevel(Enum):
     DEBUG = 0
     INFO = 1
@@ -31,7 +100,12 @@ class EventType(Enum):
     MANUAL = "MANUAL"
     EVALUATION = "EVALUATION"
 
-@dataclass
+# 문자열/정수 입력을 enum으로 바꾸는 조회 표
+_LEVEL_BY_NAME = {member.name: member for member in LogLevel}
+_LEVEL_BY_VALUE = {member.value: member for member in LogLevel}
+_EVENT_TYPE_BY_NAME = {member.name: member for member in EventType}
+
+@dataclass(slots=True)
 class LogEntry:
     timestamp: datetime
     level: LogLevel
@@ -40,6 +114,12 @@ class LogEntry:
     message: str
     details: Dict[str, Any]
     session_id: Optional[str] = None
+    formatted_time: str = field(default="", repr=False)  # '%Y-%m-%d %H:%M:%S' (생성 시 한 번만 포맷)
+    details_json: str = field(default="", repr=False)  # details 직렬화 결과 (처리 스레드에서 한 번만 생성, CSV/DB 공용)
+    # enum 속성 조회를 줄이기 위해 생성 시 한 번만 꺼내 둔 값
+    level_value: int = field(default=0, repr=False)
+    level_name: str = field(default="", repr=False)
+    event_type_value: str = field(default="", repr=False)
 
 @dataclass
 class AlertRule:
@@ -47,8 +127,10 @@ class AlertRule:
     conditions: Dict[str, Any]  # {"water_level": {"min": 0, "max": 120}, "pump_failures": 3}
     actions: List[str]  # ["log", "console", "file", "database"]
     enabled: bool = True
-    last_triggered: Optional[datetime] = None
+    last_triggered: Optional[datetime] = None  # 표시용 (쿨다운 판단은 cooldown_until 사용)
     cooldown_minutes: int = 5
+    cooldown_until: float = field(default=0.0, repr=False)  # time.monotonic() 기준 쿨다운 종료 시각
+    predicate: Optional[Callable[[Dict[str, Any]], bool]] = field(default=None, repr=False)  # 등록 시 컴파일된 조건 함수
 
 class AutomationLogger:
     """자동화 시스템 전용 로거"""
@@ -57,21 +139,46 @@ class AutomationLogger:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         
-        # 로그 파일 설정
+        # 로그 파일 설정 (날짜가 바뀌면 처리 스레드가 새 파일로 교체)
         self.current_session = self._generate_session_id()
-        self.log_files = {
-            "main": self.log_dir / f"automation_{datetime.now().strftime('%Y%m%d')}.log",
-            "events": self.log_dir / f"events_{datetime.now().strftime('%Y%m%d')}.csv",
-            "decisions": self.log_dir / f"decisions_{datetime.now().strftime('%Y%m%d')}.json",
-            "alerts": self.log_dir / f"alerts_{datetime.now().strftime('%Y%m%d')}.log"
-        }
+        self.log_files = self._build_log_paths()
         
-        # 메모리 내 로그 버퍼
-        self.log_buffer = []
+        # 메모리 내 로그 버퍼 (최대 크기를 넘으면 오래된 로그부터 자동 제거)
         self.max_buffer_size = 1000
+        self.log_buffer: deque = deque(maxlen=self.max_buffer_size)
+        self._by_reservoir: Dict[str, deque] = defaultdict(lambda: deque(maxlen=RESERVOIR_LOG_BUFFER_SIZE))
+        
+        # 출력별 최소 로그 레벨 (모든 출력의 최소값보다 낮은 로그는 엔트리를 만들지 않음)
+        self.file_min_level = _LEVEL_BY_NAME.get(AUTOMATION_LOG_FILE_LEVEL, LogLevel.DEBUG).value
+        self.console_min_level = _LEVEL_BY_NAME.get(AUTOMATION_LOG_CONSOLE_LEVEL, LogLevel.INFO).value
+        self.db_min_level = _LEVEL_BY_NAME.get(AUTOMATION_LOG_DB_LEVEL, LogLevel.INFO).value
+        self.min_level = min(self.file_min_level, self.console_min_level, self.db_min_level)
         
         # 알림 규칙
         self.alert_rules = self._setup_default_alert_rules()
+        self._rules_by_key: Dict[str, List[AlertRule]] = {}
+        for rule in self.alert_rules:
+            self._index_alert_rule(rule)
+        
+        # 스레드 안전성 (처리 스레드와 조회 메서드 사이에서만 사용)
+        self.lock = threading.Lock()
+        
+        # 로그 처리 대기열 (log()는 넣기만 하고 파일/콘솔/DB 기록은 처리 스레드가 수행)
+        # deque의 append/popleft는 GIL 아래에서 원자적이므로 생산자끼리 락 없이 넣을 수 있음
+        self._log_queue: deque = deque(maxlen=LOG_QUEUE_SIZE)
+        self._log_ready = threading.Event()  # 대기 중인 처리 스레드를 깨우는 신호
+        self._dropped_count = 0  # 대략적인 버린 로그 수 (생산자 간 경쟁 시 일부 누락 가능)
+        
+        # 로그 파일은 한 번만 열어 두고 버퍼링해서 기록
+        self._open_log_files()
+        
+        # DB 저장 대기열 (일정 개수/시간마다 한 번에 INSERT)
+        self._db_queue: List[tuple] = []
+        self._db_last_flush = time.monotonic()
+        
+        # 알림 파일 기록 대기분 ((규칙 이름, 초) -> [시각, 횟수, 메시지]) - 처리 주기마다 한 번에 기록
+        self._pending_alert_lines: Dict[Tuple[str, int], List[Any]] = {}
+        self._stop_event = threading.Event()
         
         # PostgreSQL 연결
         try:
@@ -81,11 +188,117 @@ class AutomationLogger:
             logger.error(f"PostgreSQL 연결 실패 (로깅): {e}")
             self.storage = None
         
-        # 스레드 안전성
-        self.lock = threading.Lock()
+        # 로그 처리 스레드 (일괄 기록, 파일 버퍼 flush, 로그가 뜸할 때도 대기 중인 DB 로그 저장)
+        self._drain_thread = threading.Thread(target=self._drain_loop, name="AutomationLogWriter", daemon=True)
+        self._drain_thread.start()
+        atexit.register(self.shutdown)
         
         logger.info(f"자동화 로거 초기화 완료 - 세션: {self.current_session}")
 
+    def _build_log_paths(self) -> Dict[str, Path]:
+        """오늘 날짜 로그 파일 경로 생성 및 다음 자정(교체 시각) 설정"""
+        now = datetime.now()
+        today = now.strftime('%Y%m%d')
+        self._rollover_at = datetime.combine(now.date() + timedelta(days=1), datetime.min.time()).timestamp()
+        log_files = {
+            "main": self.log_dir / f"automation_{today}.log",
+            "events": self.log_dir / f"events_{today}.csv",
+            "decisions": self.log_dir / f"decisions_{today}.jsonl",
+            "alerts": self.log_dir / f"alerts_{today}.log"
+        }
+        
+        # 파일 열기/조회 시 딕셔너리 조회와 Path 변환을 반복하지 않도록 문자열 경로 캐시
+        self._main_path = str(log_files["main"])
+        self._events_path = str(log_files["events"])
+        self._decisions_path = str(log_files["decisions"])
+        self._alerts_path = str(log_files["alerts"])
+        return log_files
+
+    def _rollover_log_files(self):
+        """자정이 지나면 기존 로그 파일을 닫고 새 날짜 파일 열기 (self.lock 보유 상태에서 호출)"""
+        try:
+            self._close_files()
+            self.log_files = self._build_log_paths()
+            self._open_log_files()
+        except Exception as e:
+            logger.error(f"로그 파일 교체 오류: {e}")
+
+    def _open_log_files(self):
+        """메인/CSV/알림/의사결정 로그 파일 열기 (CSV는 새 파일이면 헤더 기록)"""
+        # 메인 로그는 가장 자주 쓰이므로 파일 객체 대신 fd에 직접 기록 (바이트 버퍼에 모아 한 번에 write)
+        self._main_fd = os.open(self._main_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._main_buf = bytearray()
+        self._main_bytes_written = os.fstat(self._main_fd).st_size
+        self._alerts_fp = open(self._alerts_path, "a", encoding="utf-8", buffering=FILE_BUFFER_SIZE)
+        self._csv_fp = open(self._events_path, "a", newline="", encoding="utf-8-sig", buffering=FILE_BUFFER_SIZE)
+        if self._csv_fp.tell() == 0:
+            self._csv_fp.write(",".join(CSV_HEADER) + CSV_LINE_END)
+        
+        self._decision_lines = 0
+        if os.path.exists(self._decisions_path):
+            with open(self._decisions_path, "r", encoding="utf-8") as f:
+                self._decision_lines = sum(1 for _ in f)
+        self._decisions_fp = open(self._decisions_path, "a", encoding="utf-8", buffering=FILE_BUFFER_SIZE)
+
+    def _flush_files(self):
+        """로그 파일 버퍼를 디스크로 내보내기"""
+        try:
+            self._write_main_buffer()
+        except Exception as e:
+            logger.error(f"로그 파일 flush 오류: {e}")
+        for fp in (self._csv_fp, self._alerts_fp, self._decisions_fp):
+            try:
+                if not fp.closed:
+                    fp.flush()
+            except Exception as e:
+                logger.error(f"로그 파일 flush 오류: {e}")
+
+    def _close_files(self):
+        """로그 파일 flush 후 닫기 (메인 로그는 닫기 전에 한 번만 디스크 동기화)"""
+        self._flush_files()
+        if self._main_fd >= 0:
+            try:
+                getattr(os, "fdatasync", os.fsync)(self._main_fd)
+            except OSError as e:
+                logger.debug(f"메인 로그 동기화 오류: {e}")
+            os.close(self._main_fd)
+            self._main_fd = -1
+        for fp in (self._csv_fp, self._alerts_fp, self._decisions_fp):
+            fp.close()
+
+    def _write_main_buffer(self):
+        """메인 로그 바이트 버퍼를 fd에 기록"""
+        while self._main_buf and self._main_fd >= 0:
+            written = os.write(self._main_fd, self._main_buf)
+            del self._main_buf[:written]
+            self._main_bytes_written += written
+
+    def _rotate_main_log(self):
+        """메인 로그를 시각이 붙은 이름으로 바꾸고 새 파일 열기, 이전 파일은 백그라운드에서 압축 (self.lock 보유 상태에서 호출)"""
+        path = self.log_files["main"]
+        rotated_path = None
+        try:
+            self._write_main_buffer()
+            os.close(self._main_fd)
+            self._main_fd = -1
+            rotated_name = f"{path.stem}_{datetime.now().strftime('%H%M%S')}"
+            rotated_path = path.with_name(rotated_name + path.suffix)
+            sequence = 1
+            while rotated_path.exists() or rotated_path.with_name(rotated_path.name + ".gz").exists():
+                rotated_path = path.with_name(f"{rotated_name}_{sequence}{path.suffix}")
+                sequence += 1
+            os.replace(path, rotated_path)
+        except Exception as e:
+            logger.error(f"메인 로그 회전 오류: {e}")
+            rotated_path = None
+        finally:
+            if self._main_fd < 0:
+                self._main_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._main_bytes_written = os.fstat(self._main_fd).st_size
+        
+        if rotated_path:
+            threading.Thread(target=_compress_log_file, args=(rotated_path,), name="AutomationLogCompressor", daemon=True).start()
+
     def _generate_session_id(self) -> str:
         """세션 ID 생성"""
         return f"AUTO_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -125,6 +338,15 @@ class AutomationLogger:
             )
         ]
 
+    def _index_alert_rule(self, rule: AlertRule):
+        """규칙 조건을 컴파일하고 참조하는 details 키별로 규칙 색인"""
+        rule.predicate = self._compile_alert_conditions(rule.conditions)
+        for condition in rule.conditions:
+            detail_key = ALERT_CONDITION_DETAIL_KEYS.get(condition, condition)
+            rules = self._rules_by_key.setdefault(detail_key, [])
+            if rule not in rules:
+                rules.append(rule)
+
     def _setup_database_tables(self):
         """데이터베이스 테이블 설정"""
         if not self.storage:
@@ -156,232 +378,336 @@ class AutomationLogger:
         except Exception as e:
             logger.error(f"데이터베이스 테이블 설정 오류: {e}")
 
+    @staticmethod
+    def _normalize_level(level) -> LogLevel:
+        """로그 레벨 정규화 (문자열/정수 입력 허용)"""
+        if type(level) is LogLevel:
+            return level
+        if isinstance(level, str):
+            return _LEVEL_BY_NAME.get(level.upper(), LogLevel.INFO)
+        if isinstance(level, int):
+            return _LEVEL_BY_VALUE.get(level, LogLevel.INFO)
+        return LogLevel.INFO
+
+    @staticmethod
+    def _normalize_event_type(event_type) -> EventType:
+        """이벤트 타입 정규화 (문자열 입력 허용)"""
+        if type(event_type) is EventType:
+            return event_type
+        if isinstance(event_type, str):
+            return _EVENT_TYPE_BY_NAME.get(event_type.upper(), EventType.SYSTEM)
+        return EventType.SYSTEM
+
+    def _build_entry(self, level: LogLevel, event_type: EventType, reservoir_id: str, message: str, details: Dict[str, Any] = None) -> LogEntry:
+        """로그 엔트리 생성"""
+        level_enum = self._normalize_level(level)
+        event_enum = self._normalize_event_type(event_type)
+        timestamp = datetime.now()
+        return LogEntry(
+            timestamp=timestamp,
+            level=level_enum,
+            event_type=event_enum,
+            reservoir_id=reservoir_id,
+            message=message,
+            details=details or {},
+            session_id=self.current_session,
+            formatted_time=timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+            level_value=level_enum.value,
+            level_name=level_enum.name,
+            event_type_value=event_enum.value
+        )
+
     def log(self, level: LogLevel, event_type: EventType, reservoir_id: str, message: str, details: Dict[str, Any] = None):
-        """로그 기록"""
-        with self.lock:
-            # 안전한 enum 정규화 (문자열/정수 입력 허용)
-            try:
-                if isinstance(level, str):
-                    level_enum = getattr(LogLevel, level.upper(), LogLevel.INFO)
-                elif isinstance(level, int):
-                    level_enum = LogLevel(level) if level in [e.value for e in LogLevel] else LogLevel.INFO
-                elif isinstance(level, LogLevel):
-                    level_enum = level
-                else:
-                    level_enum = LogLevel.INFO
-            except Exception:
-                level_enum = LogLevel.INFO
+        """로그 기록 (처리 대기열에 넣고 바로 반환)"""
+        level_enum = self._normalize_level(level)
+        if level_enum.value < self.min_level:
+            return
+        self._enqueue(self._build_entry(level_enum, event_type, reservoir_id, message, details))
 
-            try:
-                if isinstance(event_type, str):
-                    event_enum = getattr(EventType, event_type.upper(), EventType.SYSTEM)
-                elif isinstance(event_type, EventType):
-                    event_enum = event_type
-                else:
-                    event_enum = EventType.SYSTEM
-            except Exception:
-                event_enum = EventType.SYSTEM
-
-            entry = LogEntry(
-                timestamp=datetime.now(),
-                level=level_enum,
-                event_type=event_enum,
-                reservoir_id=reservoir_id,
-                message=message,
-                details=details or {},
-                session_id=self.current_session
-            )
-            
-            # 버퍼에 추가
-            self.log_buffer.append(entry)
-            
-            # 버퍼 크기 제한
-            if len(self.log_buffer) > self.max_buffer_size:
-                self.log_buffer = self.log_buffer[-self.max_buffer_size:]
-            
-            # 다양한 출력 수행
-            self._write_to_file(entry)
+    def bulk_log(self, records: List[Tuple[LogLevel, EventType, str, str, Optional[Dict[str, Any]]]]):
+        """로그 일괄 기록 - (level, event_type, reservoir_id, message, details) 목록을 처리 대기열에 추가"""
+        for level, *rest in records:
+            level_enum = self._normalize_level(level)
+            if level_enum.value >= self.min_level:
+                self._enqueue(self._build_entry(level_enum, *rest))
+
+    def _enqueue(self, entry: LogEntry):
+        """처리 대기열에 로그 추가 (가득 차면 가장 오래된 로그를 버림)"""
+        if len(self._log_queue) == LOG_QUEUE_SIZE:
+            self._dropped_count += 1
+        self._log_queue.append(entry)
+        if not self._log_ready.is_set():
+            self._log_ready.set()
+
+    def _take_batch(self) -> List[LogEntry]:
+        """대기열에서 최대 LOG_DRAIN_BATCH_SIZE개 꺼내기"""
+        batch = []
+        popleft = self._log_queue.popleft
+        try:
+            while len(batch) < LOG_DRAIN_BATCH_SIZE:
+                batch.append(popleft())
+        except IndexError:
+            pass
+        return batch
+
+    def _drain_loop(self):
+        """로그 처리 스레드 - 대기열을 일괄로 꺼내 기록하고 주기적으로 파일/DB 저장"""
+        last_file_flush = time.monotonic()
+        while True:
+            if not self._log_queue:
+                self._log_ready.wait(FILE_FLUSH_INTERVAL_SECONDS)
+            self._log_ready.clear()
+            batch = self._take_batch()
+            
+            with self.lock:
+                if time.time() >= self._rollover_at:
+                    self._rollover_log_files()
+                if batch:
+                    try:
+                        self._process_batch(batch)
+                    except Exception as e:
+                        logger.error(f"로그 일괄 처리 오류: {e}")
+                
+                now = time.monotonic()
+                if now - last_file_flush >= FILE_FLUSH_INTERVAL_SECONDS:
+                    self._flush_files()
+                    last_file_flush = now
+                if self._db_queue and now - self._db_last_flush >= DB_FLUSH_INTERVAL_SECONDS:
+                    self._flush_db_batch()
+                if self._main_bytes_written >= MAIN_LOG_ROTATE_BYTES:
+                    self._rotate_main_log()
+            
+            if self._stop_event.is_set() and not self._log_queue:
+                return
+
+    def _process_batch(self, entries: List[LogEntry]):
+        """꺼낸 로그 묶음을 버퍼/파일/콘솔/CSV/DB에 기록하고 알림 규칙 확인 (self.lock 보유 상태에서 호출)"""
+        if self._dropped_count:
+            logger.warning(f"로그 대기열이 가득 차 {self._dropped_count}건을 버렸습니다")
+            self._dropped_count = 0
+        
+        # details는 CSV/DB가 함께 쓰도록 한 번만 직렬화
+        for entry in entries:
+            entry.details_json = _to_json(entry.details)
+        
+        # 버퍼에 추가
+        self.log_buffer.extend(entries)
+        for entry in entries:
+            self._by_reservoir[str(entry.reservoir_id)].append(entry)
+        
+        # 파일/CSV는 한 번의 쓰기로 처리
+        file_entries = entries
+        if self.file_min_level > self.min_level:
+            file_entries = [entry for entry in entries if entry.level_value >= self.file_min_level]
+        if file_entries:
+            self._write_to_file(file_entries)
+            self._write_to_csv(file_entries)
+        for entry in entries:
             self._write_to_console(entry)
-            self._write_to_csv(entry)
-            
-            # 특별한 이벤트는 JSON으로 별도 저장
-            if event_type == EventType.DECISION:
+        
+        # 특별한 이벤트는 JSON으로 별도 저장
+        for entry in entries:
+            if entry.event_type is EventType.DECISION:
                 self._write_decision_to_json(entry)
-            
-            # 데이터베이스 저장
-            if self.storage and level.value >= LogLevel.INFO.value:
-                self._write_to_database(entry)
-            
-            # 알림 규칙 확인
+        
+        # 데이터베이스 저장 대기열에 한 번에 추가
+        if self.storage:
+            self._write_to_database([entry for entry in entries if entry.level_value >= self.db_min_level])
+        
+        # 알림 규칙 확인
+        for entry in entries:
             self._check_alert_rules(entry)
+        self._write_alert_lines()
 
-    def _write_to_file(self, entry: LogEntry):
+    def _write_to_file(self, entries: List[LogEntry]):
         """메인 로그 파일에 기록"""
         try:
-            log_line = f"[{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] [{entry.level.name}] [{entry.event_type.value}] [{entry.reservoir_id}] {entry.message}\n"
+            log_lines = "".join(
+                f"[{entry.formatted_time}] [{entry.level_name}] [{entry.event_type_value}] [{entry.reservoir_id}] {entry.message}\n"
+                for entry in entries
+            )
             
-            with open(self.log_files["main"], "a", encoding="utf-8") as f:
-                f.write(log_line)
+            self._main_buf += log_lines.encode("utf-8")
+            if len(self._main_buf) >= FILE_BUFFER_SIZE:
+                self._write_main_buffer()
                 
         except Exception as e:
             logger.error(f"파일 로그 쓰기 오류: {e}")
 
     def _write_to_console(self, entry: LogEntry):
         """콘솔에 출력 - 중복 방지를 위해 직접 print 사용"""
-        if entry.level.value >= LogLevel.INFO.value:
-            timestamp = entry.timestamp.strftime('%H:%M:%S')
+        if entry.level_value >= self.console_min_level:
+            timestamp = entry.formatted_time[11:]
             prefix = "🤖 [AUTO]"
-            message = f"[{timestamp}] {prefix} [{entry.event_type.value}] {entry.reservoir_id}: {entry.message}"
+            message = f"[{timestamp}] {prefix} [{entry.event_type_value}] {entry.reservoir_id}: {entry.message}"
             
             # 직접 출력하여 중복 로그 방지
             print(message)
 
-    def _write_to_csv(self, entry: LogEntry):
+    def _write_to_csv(self, entries: List[LogEntry]):
         """CSV 파일에 이벤트 기록"""
         try:
-            file_exists = self.log_files["events"].exists()
+            self._csv_fp.write("".join(
+                f"{entry.timestamp.isoformat()},{_csv_field(entry.session_id)},{entry.level_name},"
+                f"{entry.event_type_value},{_csv_field(entry.reservoir_id)},{_csv_field(entry.message)},"
+                f"{_csv_field(entry.details_json)}{CSV_LINE_END}"
+                for entry in entries
+            ))
             
-            with open(self.log_files["events"], "a", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                
-                # 헤더 추가 (파일이 새로 생성된 경우)
-                if not file_exists:
-                    writer.writerow([
-                        "timestamp", "session_id", "level", "event_type", 
-                        "reservoir_id", "message", "details"
-                    ])
-                
-                writer.writerow([
-                    entry.timestamp.isoformat(),
-                    entry.session_id,
-                    entry.level.name,
-                    entry.event_type.value,
-                    entry.reservoir_id,
-                    entry.message,
-                    json.dumps(entry.details, ensure_ascii=False, separators=(',', ':'))
-                ])
-                
         except Exception as e:
             logger.error(f"CSV 로그 쓰기 오류: {e}")
 
     def _write_decision_to_json(self, entry: LogEntry):
-        """의사결정 로그를 JSON 파일에 저장"""
+        """의사결정 로그를 JSONL 파일에 한 줄로 추가"""
         try:
             decision_data = {
-                "timestamp": entry.timestamp.isoformat(),
+                "timestamp": entry.timestamp,
                 "session_id": entry.session_id,
                 "reservoir_id": entry.reservoir_id,
                 "message": entry.message,
                 "details": entry.details
             }
             
-            # 기존 데이터 로드
-            decisions = []
-            if self.log_files["decisions"].exists():
-                try:
-                    with open(self.log_files["decisions"], "r", encoding="utf-8") as f:
-                        decisions = json.load(f)
-                except:
-                    decisions = []
-            
-            decisions.append(decision_data)
+            self._decisions_fp.write(_to_json(decision_data) + "\n")
+            self._decision_lines += 1
             
-            # 최근 100개만 유지
-            if len(decisions) > 100:
-                decisions = decisions[-100:]
-            
-            with open(self.log_files["decisions"], "w", encoding="utf-8") as f:
-                json.dump(decisions, f, ensure_ascii=False, indent=2)
+            # 파일이 커지면 최근 기록만 남기도록 압축
+            if self._decision_lines > DECISION_COMPACT_THRESHOLD:
+                self._compact_decisions()
                 
         except Exception as e:
             logger.error(f"의사결정 JSON 로그 쓰기 오류: {e}")
 
-    def _write_to_database(self, entry: LogEntry):
-        """데이터베이스에 로그 저장"""
+    def _compact_decisions(self):
+        """의사결정 JSONL 파일을 최근 DECISION_HISTORY_SIZE개로 줄이기 (임시 파일 작성 후 교체)"""
+        path = self._decisions_path
+        self._decisions_fp.close()
         try:
-            if not self.storage:
-                return
+            with open(path, "r", encoding="utf-8") as f:
+                recent = deque(f, maxlen=DECISION_HISTORY_SIZE)
             
-            insert_sql = """
-            INSERT INTO automation_logs (timestamp, session_id, level, event_type, reservoir_id, message, details)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """
+            temp_path = path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.writelines(recent)
+            os.replace(temp_path, path)
+            self._decision_lines = len(recent)
             
-            self.storage.execute_query(
-                insert_sql,
-                params=(
-                    entry.timestamp,
-                    entry.session_id,
-                    entry.level.name,
-                    entry.event_type.value,
-                    entry.reservoir_id,
-                    entry.message,
-                    json.dumps(entry.details)
-                ),
-                commit=True
+        except Exception as e:
+            logger.error(f"의사결정 로그 압축 오류: {e}")
+        finally:
+            self._decisions_fp = open(path, "a", encoding="utf-8", buffering=FILE_BUFFER_SIZE)
+
+    def _write_to_database(self, entries: List[LogEntry]):
+        """데이터베이스 저장 대기열에 로그 추가 (개수/시간 조건을 만족하면 일괄 저장)"""
+        if not self.storage or not entries:
+            return
+        
+        self._db_queue.extend(
+            (
+                entry.timestamp,
+                entry.session_id,
+                entry.level_name,
+                entry.event_type_value,
+                entry.reservoir_id,
+                entry.message,
+                entry.details_json
             )
-            
+            for entry in entries
+        )
+        
+        if (len(self._db_queue) >= DB_FLUSH_BATCH_SIZE or
+                time.monotonic() - self._db_last_flush >= DB_FLUSH_INTERVAL_SECONDS):
+            self._flush_db_batch()
+
+    def _flush_db_batch(self):
+        """대기 중인 로그를 execute_values 한 번과 커밋 한 번으로 저장 (self.lock 보유 상태에서 호출)"""
+        rows, self._db_queue = self._db_queue, []
+        self._db_last_flush = time.monotonic()
+        if not rows or not self.storage:
+            return
+        
+        try:
+            self.storage.execute_values(_DB_INSERT_SQL, rows, template=_DB_INSERT_TEMPLATE, page_size=DB_INSERT_PAGE_SIZE)
         except Exception as e:
             logger.debug(f"데이터베이스 로그 저장 오류: {e}")
 
+    def shutdown(self):
+        """로그 처리 스레드 중지, 대기 중인 로그 저장 및 파일 닫기"""
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        self._log_ready.set()
+        self._drain_thread.join(timeout=10)
+        with self.lock:
+            self._flush_db_batch()
+            self._close_files()
+
     def _check_alert_rules(self, entry: LogEntry):
-        """알림 규칙 확인 및 실행"""
+        """알림 규칙 확인 및 실행 (로그 details에 있는 키를 참조하는 규칙만 확인)"""
         try:
-            current_time = datetime.now()
+            details = entry.details
+            candidates = []
+            for key in details:
+                for rule in self._rules_by_key.get(key, ()):
+                    if rule not in candidates:
+                        candidates.append(rule)
+            if not candidates:
+                return
+            
+            now = time.monotonic()
             
-            for rule in self.alert_rules:
+            for rule in candidates:
                 if not rule.enabled:
                     continue
                 
                 # 쿨다운 확인
-                if (rule.last_triggered and 
-                    current_time - rule.last_triggered < timedelta(minutes=rule.cooldown_minutes)):
+                if now < rule.cooldown_until:
                     continue
                 
                 # 조건 확인
-                if self._match_alert_conditions(entry, rule.conditions):
+                try:
+                    matched = rule.predicate(details)
+                except Exception as e:
+                    logger.error(f"알림 조건 매칭 중 오류: {e}")
+                    matched = False
+                
+                if matched:
                     self._trigger_alert(entry, rule)
-                    rule.last_triggered = current_time
+                    rule.cooldown_until = now + rule.cooldown_minutes * 60
+                    rule.last_triggered = datetime.now()
                     
         except Exception as e:
             logger.error(f"알림 규칙 확인 중 오류: {e}")
 
-    def _match_alert_conditions(self, entry: LogEntry, conditions: Dict[str, Any]) -> bool:
-        """알림 조건 매칭"""
-        try:
-            details = entry.details
-            
-            # 수위 기반 조건
-            if "water_level_above" in conditions:
-                water_level = details.get("current_level", 0)
-                if water_level > conditions["water_level_above"]:
-                    return True
-            
-            # 펌프 실패 조건
-            if "pump_control_failure" in conditions:
-                pump_success = details.get("result", {}).get("success", True)
-                if not pump_success and conditions["pump_control_failure"]:
-                    return True
-            
-            # 아두이노 연결 조건 (명시적으로 연결 상태가 제공된 경우만)
-            if "arduino_connected" in conditions:
-                # details에 arduino_connected가 명시적으로 있을 때만 확인
-                if "arduino_connected" in details:
-                    arduino_connected = details.get("arduino_connected")
-                    if arduino_connected != conditions["arduino_connected"]:
-                        return True
-            
-            # 다중 펌프 실패 조건
-            if "failed_pumps_count_above" in conditions:
-                failed_pumps = details.get("failed_pumps_count", 0)
-                if failed_pumps > conditions["failed_pumps_count_above"]:
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"알림 조건 매칭 중 오류: {e}")
-            return False
+    @staticmethod
+    def _compile_alert_conditions(conditions: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+        """알림 조건을 details 딕셔너리를 받는 단일 판정 함수로 컴파일 (등록 이후 conditions 변경은 반영되지 않음)"""
+        preds = []
+        
+        # 수위 기반 조건
+        if "water_level_above" in conditions:
+            threshold = conditions["water_level_above"]
+            preds.append(lambda d, t=threshold: d.get("current_level", 0) > t)
+        
+        # 펌프 실패 조건 (조건 값이 거짓이면 절대 매칭되지 않으므로 생략)
+        if "pump_control_failure" in conditions and conditions["pump_control_failure"]:
+            preds.append(lambda d: not d.get("result", {}).get("success", True))
+        
+        # 아두이노 연결 조건 (details에 연결 상태가 명시적으로 있을 때만 확인)
+        if "arduino_connected" in conditions:
+            expected = conditions["arduino_connected"]
+            preds.append(lambda d, e=expected: "arduino_connected" in d and d["arduino_connected"] != e)
+        
+        # 다중 펌프 실패 조건
+        if "failed_pumps_count_above" in conditions:
+            threshold = conditions["failed_pumps_count_above"]
+            preds.append(lambda d, t=threshold: d.get("failed_pumps_count", 0) > t)
+        
+        if not preds:
+            return lambda d: False
+        if len(preds) == 1:
+            return preds[0]
+        return lambda d, preds=tuple(preds): any(p(d) for p in preds)
 
     def _trigger_alert(self, entry: LogEntry, rule: AlertRule):
         """알림 실행"""
@@ -390,41 +716,50 @@ class AutomationLogger:
         try:
             # 콘솔 출력 (중복 방지를 위해 직접 print 사용)
             if "console" in rule.actions:
-                timestamp = entry.timestamp.strftime('%H:%M:%S')
+                timestamp = entry.formatted_time[11:]
                 print(f"[{timestamp}] 🤖 [AUTO] [ALERT] {entry.reservoir_id}: {alert_message}")
             
-            # 파일 기록
+            # 파일 기록 (같은 초에 같은 규칙이 반복되면 한 줄로 합침)
             if "file" in rule.actions:
-                with open(self.log_files["alerts"], "a", encoding="utf-8") as f:
-                    f.write(f"[{entry.timestamp.isoformat()}] {alert_message}\n")
+                key = (rule.name, int(entry.timestamp.timestamp()))
+                pending = self._pending_alert_lines.get(key)
+                if pending:
+                    pending[1] += 1
+                else:
+                    self._pending_alert_lines[key] = [entry.timestamp.isoformat(), 1, entry.message]
             
-            # 데이터베이스 기록 (재귀 호출 방지)
+            # 데이터베이스 기록 (로그와 같은 저장 대기열 사용 - 재귀 호출 없음)
             if "database" in rule.actions and self.storage:
-                try:
-                    insert_sql = """
-                    INSERT INTO automation_logs (timestamp, session_id, level, event_type, reservoir_id, message, details)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """
-                    
-                    self.storage.execute_query(
-                        insert_sql,
-                        params=(
-                            entry.timestamp,
-                            entry.session_id,
-                            'CRITICAL',
-                            'ALERT',
-                            entry.reservoir_id,
-                            f"Alert triggered: {rule.name}",
-                            json.dumps({"rule": rule.name, "original_message": entry.message})
-                        ),
-                        commit=True
-                    )
-                except Exception as db_e:
-                    print(f"데이터베이스 알림 저장 오류: {db_e}")
+                self._db_queue.append((
+                    entry.timestamp,
+                    entry.session_id,
+                    'CRITICAL',
+                    'ALERT',
+                    entry.reservoir_id,
+                    f"Alert triggered: {rule.name}",
+                    _to_json({"rule": rule.name, "original_message": entry.message})
+                ))
             
         except Exception as e:
             print(f"알림 실행 중 오류: {e}")
 
+    def _write_alert_lines(self):
+        """대기 중인 알림 줄을 알림 파일에 한 번에 기록"""
+        if not self._pending_alert_lines:
+            return
+        
+        lines = []
+        for (rule_name, _), (timestamp, count, message) in self._pending_alert_lines.items():
+            label = "🚨 ALERT" if count == 1 else f"🚨 ALERT x{count}"
+            lines.append(f"[{timestamp}] {label}: {rule_name} - {message}\n")
+        self._pending_alert_lines.clear()
+        
+        try:
+            self._alerts_fp.write("".join(lines))
+            self._alerts_fp.flush()
+        except Exception as e:
+            logger.error(f"알림 로그 쓰기 오류: {e}")
+
     # 편의 메서드들
     def info(self, event_type: EventType, reservoir_id: str, message: str, details: Dict[str, Any] = None):
         self.log(LogLevel.INFO, event_type, reservoir_id, message, details)
@@ -445,7 +780,7 @@ class AutomationLogger:
                 # level 파라미터가 LogLevel enum인지 확인하고 안전하게 처리
                 if isinstance(level, str):
                     # 문자열인 경우 LogLevel로 변환
-                    level_value = getattr(LogLevel, level.upper(), LogLevel.DEBUG).value
+                    level_value = _LEVEL_BY_NAME.get(level.upper(), LogLevel.DEBUG).value
                 elif isinstance(level, LogLevel):
                     level_value = level.value
                 else:
@@ -453,14 +788,14 @@ class AutomationLogger:
                 
                 filtered_logs = [
                     entry for entry in self.log_buffer 
-                    if hasattr(entry.level, 'value') and entry.level.value >= level_value
+                    if entry.level_value >= level_value
                 ]
                 
                 return [
                     {
                         "timestamp": entry.timestamp.isoformat() if hasattr(entry.timestamp, 'isoformat') else str(entry.timestamp),
-                        "level": entry.level.name if hasattr(entry.level, 'name') else str(entry.level),
-                        "event_type": entry.event_type.value if hasattr(entry.event_type, 'value') else str(entry.event_type),
+                        "level": entry.level_name,
+                        "event_type": entry.event_type_value,
                         "reservoir_id": str(entry.reservoir_id),
                         "message": str(entry.message),
                         "details": entry.details if entry.details else {}
@@ -473,19 +808,16 @@ class AutomationLogger:
                 return []
 
     def get_logs_by_reservoir(self, reservoir_id: str, limit: int = 30) -> List[Dict[str, Any]]:
-        """특정 배수지 로그 조회"""
+        """특정 배수지 로그 조회 (배수지별 최근 로그 색인 사용)"""
         with self.lock:
             try:
-                reservoir_logs = [
-                    entry for entry in self.log_buffer 
-                    if str(entry.reservoir_id) == str(reservoir_id)
-                ]
+                reservoir_logs = list(self._by_reservoir.get(str(reservoir_id), ()))
                 
                 return [
                     {
                         "timestamp": entry.timestamp.isoformat() if hasattr(entry.timestamp, 'isoformat') else str(entry.timestamp),
-                        "level": entry.level.name if hasattr(entry.level, 'name') else str(entry.level),
-                        "event_type": entry.event_type.value if hasattr(entry.event_type, 'value') else str(entry.event_type),
+                        "level": entry.level_name,
+                        "event_type": entry.event_type_value,
                         "reservoir_id": str(entry.reservoir_id),
                         "message": str(entry.message),
                         "details": entry.details if entry.details else {}
@@ -497,14 +829,18 @@ class AutomationLogger:
                 return []
 
     def get_decision_history(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """의사결정 이력 조회"""
+        """의사결정 이력 조회 (JSONL 파일의 마지막 limit줄만 파싱)"""
         try:
-            if not self.log_files["decisions"].exists():
-                return []
+            with self.lock:
+                if not os.path.exists(self._decisions_path):
+                    return []
+                
+                if not self._decisions_fp.closed:
+                    self._decisions_fp.flush()
+                with open(self._decisions_path, "r", encoding="utf-8") as f:
+                    recent_lines = deque(f, maxlen=limit)
             
-            with open(self.log_files["decisions"], "r", encoding="utf-8") as f:
-                decisions = json.load(f)
-                return decisions[-limit:] if decisions else []
+            return [orjson.loads(line) for line in recent_lines if line.strip()]
                 
         except Exception as e:
             logger.error(f"의사결정 이력 조회 오류: {e}")
@@ -532,11 +868,11 @@ class AutomationLogger:
                     for entry in filtered_logs:
                         writer.writerow([
                             entry.timestamp.isoformat(),
-                            entry.level.name,
-                            entry.event_type.value,
+                            entry.level_name,
+                            entry.event_type_value,
                             entry.reservoir_id,
                             entry.message,
-                            json.dumps(entry.details, ensure_ascii=False, separators=(',', ':'))
+                            entry.details_json
                         ])
                         
             elif format.lower() == "json":
@@ -544,9 +880,9 @@ class AutomationLogger:
                 
                 export_data = [
                     {
-                        "timestamp": entry.timestamp.isoformat(),
-                        "level": entry.level.name,
-                        "event_type": entry.event_type.value,
+                        "timestamp": entry.timestamp,
+                        "level": entry.level_name,
+                        "event_type": entry.event_type_value,
                         "reservoir_id": entry.reservoir_id,
                         "message": entry.message,
                         "details": entry.details
@@ -554,8 +890,8 @@ class AutomationLogger:
                     for entry in filtered_logs
                 ]
                 
-                with open(export_file, "w", encoding="utf-8") as f:
-                    json.dump(export_data, f, ensure_ascii=False, indent=2)
+                with open(export_file, "wb") as f:
+                    f.write(orjson.dumps(export_data, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2))
             
             return str(export_file)
             
@@ -566,7 +902,9 @@ class AutomationLogger:
     def add_alert_rule(self, rule: AlertRule) -> bool:
         """알림 규칙 추가"""
         try:
-            self.alert_rules.append(rule)
+            with self.lock:
+                self.alert_rules.append(rule)
+                self._index_alert_rule(rule)
             self.info(EventType.SYSTEM, "system", f"알림 규칙 추가: {rule.name}")
             return True
             
@@ -584,6 +922,11 @@ class AutomationLogger:
                     log_file.unlink()
                     logger.info(f"오래된 로그 파일 삭제: {log_file}")
             
+            for archive_file in self.log_dir.glob("*.log.gz"):
+                if archive_file.stat().st_mtime < cutoff_date.timestamp():
+                    archive_file.unlink()
+                    logger.info(f"오래된 압축 로그 파일 삭제: {archive_file}")
+            
             for csv_file in self.log_dir.glob("*.csv"):
                 if csv_file.stat().st_mtime < cutoff_date.timestamp():
                     csv_file.unlink()
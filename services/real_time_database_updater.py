@@ -1,30 +1,85 @@
 # services/real_time_database_updater.py - 실시간 데이터베이스 업데이트 서비스
 
+import os
 import threading
 import time
 import signal
 import sys
+import weakref
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import psycopg2
 import psycopg2.extras
+from psycopg2.pool import ThreadedConnectionPool
 from dataclasses import dataclass
-import random
+from enum import Enum
 import numpy as np
 
-from config import PG_DB_HOST, PG_DB_PORT, PG_DB_NAME, PG_DB_USER, PG_DB_PASSWORD
+from config import PG_DB_HOST, PG_DB_PORT, PG_DB_NAME, PG_DB_USER, PG_DB_PASSWORD, ARDUINO_LEVEL_CHANNELS
 from utils.arduino_direct import DirectArduinoComm
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-@dataclass
+# 연결 풀 크기 (수동 수집 호출이 주기 업데이트와 겹쳐도 새 연결을 맺지 않도록 코어 수 기준으로 여유 있게)
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = max(4, (os.cpu_count() or 2) * 2 + 1)
+POOL_CONNECT_RETRIES = 3  # 풀에서 연결을 얻지 못했을 때 재시도 횟수
+POOL_RETRY_DELAY_SECONDS = 0.5
+
+# 측정값 일괄 저장 (건수 또는 시간 기준으로 모아서 한 번의 왕복/커밋으로 기록)
+# INSERT는 연결마다 서버에 한 번만 PREPARE 해두고 이후에는 컬럼별 배열만 보내 EXECUTE (매번 파싱/계획 생략)
+# 페이지 하나가 한 문장이므로 rowcount가 실제 추가된 행 수 (ON CONFLICT로 버려진 중복 제외)
+WATER_PREPARED_NAME = "water_ins"
+WATER_PREPARE_SQL = f"""
+    PREPARE {WATER_PREPARED_NAME} (timestamp[], float8[], float8[], float8[], float8[], float8[], float8[], float8[], float8[], float8[], float8[]) AS
+    INSERT INTO water 
+    (measured_at, 
+     gagok_water_level, gagok_pump_a, gagok_pump_b,
+     haeryong_water_level, haeryong_pump_a, haeryong_pump_b,
+     sangsa_water_level, sangsa_pump_a, sangsa_pump_b, sangsa_pump_c)
+    SELECT * FROM unnest($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+    ON CONFLICT (measured_at) DO NOTHING
+"""
+WATER_EXECUTE_SQL = f"EXECUTE {WATER_PREPARED_NAME} (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+PENDING_READINGS_LIMIT = 10000  # DB 장애 시 보관할 최대 측정값 수 (초과 시 오래된 것부터 버림)
+DB_FLUSH_THRESHOLD = 32
+DB_FLUSH_INTERVAL_SECONDS = 30  # 기본 60초 주기에서는 매 측정값이 바로 저장됨
+DB_INSERT_PAGE_SIZE = 100
+
+# 아두이노 폴링 (전용 스레드가 최신 값을 갱신하고, 업데이트 루프는 캐시된 값만 읽음)
+# 시리얼 포트는 RealtimeMonitor의 펌프 제어와 함께 쓰므로 DB 업데이트 주기보다 자주 읽지 않음
+# (read_water_level 한 번이 입력 버퍼를 비우고 최대 10초 이상 포트를 점유)
+ARDUINO_SAMPLE_MAX_AGE_INTERVALS = 2  # 업데이트 주기의 이 배수보다 오래된 값은 저장하지 않음 (폴링이 멈춘 경우)
+
+# water 테이블 배수지 순서 (가곡, 해룡, 상사)
+RESERVOIR_IDS = ("gagok", "haeryong", "sangsa")
+
+# 시뮬레이션 파형 (RESERVOIR_IDS 순서) - 정현파 진폭/위상과 노이즈 표준편차
+SIMULATION_AMPLITUDES = np.array([15.0, 20.0, 25.0])
+SIMULATION_PHASES = np.array([0.0, np.pi / 3, 2 * np.pi / 3])
+SIMULATION_NOISE_SIGMAS = np.array([2.0, 1.5, 3.0])
+SIMULATION_LEVEL_MIN = 30
+SIMULATION_LEVEL_MAX = 120
+# 시뮬레이션 펌프 가동 기준 (WaterLevelReading 펌프 필드 순서: 가곡 A/B, 해룡 A/B, 상사 A/B/C)
+SIMULATION_PUMP_LEVEL_INDEX = np.array([0, 0, 1, 1, 2, 2, 2])  # 각 펌프가 참조하는 배수지 (RESERVOIR_IDS 순서)
+SIMULATION_PUMP_THRESHOLDS = np.array([85.0, 95.0, 80.0, 90.0, 90.0, 100.0, 110.0])
+
+class SaveResult(Enum):
+    """측정값 저장 결과"""
+    WRITTEN = "written"  # water 테이블 저장 완료 (중복 측정 시각은 ON CONFLICT로 제외)
+    QUEUED = "queued"  # 일괄 저장 대기열에 추가됨 (다음 저장 때 기록)
+    FAILED = "failed"  # 저장 실패 (대기열에 남아 다음 저장 때 재시도)
+
+@dataclass(slots=True, frozen=True)
 class WaterLevelReading:
     """수위 측정 데이터"""
     timestamp: datetime
-    gagok_level: float
-    haeryong_level: float
-    sangsa_level: float
+    gagok_level: Optional[float]  # 센서 채널이 없는 배수지는 None (NULL로 저장)
+    haeryong_level: Optional[float]
+    sangsa_level: Optional[float]
     gagok_pump_a: bool
     gagok_pump_b: bool
     haeryong_pump_a: bool
@@ -48,14 +103,31 @@ class RealTimeDatabaseUpdater:
             'password': PG_DB_PASSWORD
         }
         
+        # 연결 풀 (첫 사용 시 생성 - DB가 내려가 있어도 업데이터 생성/상태 조회는 가능하도록)
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # INSERT를 PREPARE 해둔 풀 연결 (풀이 닫아 버린 연결은 자동으로 빠지므로 새 연결과 혼동되지 않음)
+        self._prepared_conns = weakref.WeakSet()
+        
+        # 저장 대기 중인 측정값 (주기 업데이트와 수동 수집이 함께 사용)
+        self._pending: deque = deque(maxlen=PENDING_READINGS_LIMIT)
+        self._pending_lock = threading.Lock()
+        self._last_flush = 0.0  # time.monotonic() 기준 (첫 측정값은 바로 저장)
+        
         # 아두이노 통신 객체
         self.arduino_comm = DirectArduinoComm()
         
         # 서비스 상태
         self.is_running = False
         self.update_thread = None
+        self._stop_event = threading.Event()  # 대기 중인 업데이트 루프/폴링 스레드를 즉시 깨워 종료
+        
+        # 아두이노 최신 측정값 (폴링 스레드가 갱신)
+        self.poll_thread = None
+        self._latest_sample: Optional[Dict[str, Any]] = None
+        self._sample_lock = threading.Lock()
         self.last_reading = None
-        self.readings_count = 0
+        self.readings_count = 0  # water 테이블에 실제로 추가된 행 수
         
         # 시뮬레이션 모드 (아두이노가 연결되지 않았을 때)
         self.simulation_mode = False
@@ -64,6 +136,8 @@ class RealTimeDatabaseUpdater:
             'haeryong': 68.0,
             'sangsa': 82.0
         }
+        self._simulation_bases = np.array([self.simulation_base_levels[name] for name in RESERVOIR_IDS])
+        self._rng = np.random.default_rng()
         
     def start_updating(self) -> bool:
         """실시간 데이터베이스 업데이트 서비스 시작"""
@@ -74,6 +148,7 @@ class RealTimeDatabaseUpdater:
         try:
             logger.info(f"실시간 데이터베이스 업데이트 서비스 시작 (간격: {self.update_interval}초)")
             self.is_running = True
+            self._stop_event.clear()
             
             # 데이터베이스 연결 테스트
             if not self._test_database_connection():
@@ -87,6 +162,10 @@ class RealTimeDatabaseUpdater:
                 if self.arduino_comm.is_connected():
                     logger.info("아두이노 연결 성공 - 실제 센서 데이터 사용")
                     self.simulation_mode = False
+                    unmapped = [name for name in RESERVOIR_IDS if name not in ARDUINO_LEVEL_CHANNELS]
+                    if unmapped:
+                        logger.warning(f"수위 센서 채널이 지정되지 않은 배수지는 수위를 NULL로 저장합니다 "
+                                       f"(ARDUINO_LEVEL_CHANNELS 설정 필요): {unmapped}")
                 else:
                     logger.warning("아두이노 연결 실패 - 시뮬레이션 모드 사용")
                     self.simulation_mode = True
@@ -94,6 +173,17 @@ class RealTimeDatabaseUpdater:
                 logger.warning(f"아두이노 연결 중 오류 (시뮬레이션 모드로 진행): {e}")
                 self.simulation_mode = True
             
+            # 아두이노 폴링 스레드 시작 (첫 업데이트가 바로 쓸 수 있도록 한 번은 먼저 읽어 둠)
+            if not self.simulation_mode:
+                self._latest_sample = None
+                self._poll_arduino()
+                self.poll_thread = threading.Thread(
+                    target=self._arduino_poll_loop,
+                    daemon=True,
+                    name="ArduinoPollThread"
+                )
+                self.poll_thread.start()
+            
             # 업데이트 스레드 시작
             self.update_thread = threading.Thread(
                 target=self._update_loop,
@@ -113,18 +203,83 @@ class RealTimeDatabaseUpdater:
         """데이터베이스 업데이트 서비스 중단"""
         logger.info("실시간 데이터베이스 업데이트 서비스 중단 중...")
         self.is_running = False
+        self._stop_event.set()
         
         if self.update_thread and self.update_thread.is_alive():
             self.update_thread.join(timeout=5)
+        if self.poll_thread and self.poll_thread.is_alive():
+            self.poll_thread.join(timeout=5)
             
         # 아두이노 연결 해제
         self.arduino_comm.disconnect()
+        
+        # 남은 측정값 저장 후 연결 풀 정리 (다시 시작하면 새로 생성)
+        self._flush()
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+                self._prepared_conns.clear()
         logger.info("데이터베이스 업데이트 서비스 중단 완료")
     
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """연결 풀 반환 (없으면 생성)"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    try:
+                        self._pool = ThreadedConnectionPool(
+                            POOL_MIN_CONNECTIONS,
+                            POOL_MAX_CONNECTIONS,
+                            **self.db_config
+                        )
+                    except Exception as e:
+                        logger.error(f"데이터베이스 연결 풀 생성 오류: {e}")
+                        raise
+        return self._pool
+    
+    def _getconn(self, pool: ThreadedConnectionPool):
+        """풀에서 연결 획득 (연결 실패 시 재시도, 이미 끊어진 연결은 닫고 다시 받음)"""
+        for attempt in range(1, POOL_CONNECT_RETRIES + 1):
+            try:
+                conn = pool.getconn()
+            except psycopg2.OperationalError as e:
+                if attempt == POOL_CONNECT_RETRIES:
+                    raise
+                logger.warning(f"데이터베이스 연결 획득 실패 (재시도 {attempt}/{POOL_CONNECT_RETRIES - 1}): {e}")
+                time.sleep(POOL_RETRY_DELAY_SECONDS * attempt)
+                continue
+            
+            if not conn.closed:
+                return conn
+            pool.putconn(conn, close=True)
+        
+        raise psycopg2.OperationalError("사용 가능한 데이터베이스 연결이 없습니다")
+    
+    @contextmanager
+    def _borrow(self):
+        """풀에서 연결을 빌려 트랜잭션 단위로 사용 후 반납"""
+        pool = self._get_pool()
+        conn = self._getconn(pool)
+        try:
+            with conn:
+                yield conn
+        finally:
+            # 끊어진 연결은 풀에 되돌리지 않고 닫음
+            pool.putconn(conn, close=bool(conn.closed))
+    
+    def _ensure_prepared(self, conn, cur):
+        """이 연결에서 water INSERT를 아직 PREPARE 하지 않았으면 준비 (준비된 문장은 세션이 끝날 때까지 유지)"""
+        if conn not in self._prepared_conns:
+            cur.execute(WATER_PREPARE_SQL)
+            # 뒤이은 INSERT가 실패해 롤백되더라도 준비된 문장이 남아 있도록 바로 커밋
+            conn.commit()
+            self._prepared_conns.add(conn)
+    
     def _test_database_connection(self) -> bool:
         """데이터베이스 연결 테스트"""
         try:
-            with psycopg2.connect(**self.db_config) as conn:
+            with self._borrow() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT 1")
                     result = cur.fetchone()
@@ -134,33 +289,43 @@ class RealTimeDatabaseUpdater:
             return False
     
     def _update_loop(self):
-        """메인 업데이트 루프"""
-        while self.is_running:
+        """메인 업데이트 루프 (time.monotonic() 기준 마감 시각마다 실행해 작업 시간만큼 주기가 밀리지 않음)"""
+        next_deadline = time.monotonic()
+        while not self._stop_event.is_set():
             try:
                 # 1. 센서 데이터 수집
                 reading = self._collect_sensor_data()
                 
                 if reading:
-                    # 2. 데이터베이스에 저장
-                    success = self._save_to_database(reading)
+                    # 2. 데이터베이스에 저장 (대기열에만 추가된 경우 구분)
+                    result = self._save_to_database(reading)
                     
-                    if success:
-                        self.last_reading = reading
-                        self.readings_count += 1
-                        logger.info(f"데이터 저장 성공 #{self.readings_count}: "
-                                  f"가곡={reading.gagok_level:.1f}cm, "
-                                  f"해룡={reading.haeryong_level:.1f}cm, "
-                                  f"상사={reading.sangsa_level:.1f}cm")
+                    if result is SaveResult.FAILED:
+                        logger.error(f"데이터베이스 저장 실패 (대기 {len(self._pending)}건, 다음 저장 때 재시도)")
                     else:
-                        logger.error("데이터베이스 저장 실패")
+                        self.last_reading = reading
+                        status = "저장 성공" if result is SaveResult.WRITTEN else f"저장 대기 (대기 {len(self._pending)}건)"
+                        logger.info(f"데이터 {status} (누적 {self.readings_count}건): "
+                                  f"가곡={self._format_level(reading.gagok_level)}, "
+                                  f"해룡={self._format_level(reading.haeryong_level)}, "
+                                  f"상사={self._format_level(reading.sangsa_level)}")
                 else:
                     logger.warning("센서 데이터 수집 실패")
                     
             except Exception as e:
                 logger.error(f"업데이트 루프 오류: {e}")
                 
-            # 다음 업데이트까지 대기
-            time.sleep(self.update_interval)
+            # 다음 업데이트까지 대기 (한 주기 이상 밀렸으면 몰아서 실행하지 않고 현재 시각부터 다시 계산)
+            next_deadline += self.update_interval
+            now = time.monotonic()
+            if next_deadline < now - self.update_interval:
+                next_deadline = now
+            self._stop_event.wait(max(0.0, next_deadline - now))
+    
+    @staticmethod
+    def _format_level(level: Optional[float]) -> str:
+        """로그용 수위 표시 (센서 값이 없으면 '-')"""
+        return "-" if level is None else f"{level:.1f}cm"
     
     def _collect_sensor_data(self) -> Optional[WaterLevelReading]:
         """센서에서 수위 데이터 수집"""
@@ -176,30 +341,88 @@ class RealTimeDatabaseUpdater:
             logger.error(f"센서 데이터 수집 중 오류: {e}")
             return None
     
-    def _collect_arduino_data(self) -> Optional[WaterLevelReading]:
-        """아두이노에서 실제 센서 데이터 수집"""
+    def _arduino_poll_loop(self):
+        """아두이노 폴링 루프 (시리얼 읽기 지연이 DB 업데이트 주기에 영향을 주지 않도록 분리, 업데이트 주기마다 한 번만 읽음)"""
+        next_deadline = time.monotonic() + self.update_interval
+        while not self._stop_event.wait(max(0.0, next_deadline - time.monotonic())):
+            self._poll_arduino()
+            
+            # 읽기가 한 주기 이상 걸렸으면 밀린 폴링을 몰아서 하지 않고 지금부터 다시 계산
+            next_deadline += self.update_interval
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now + self.update_interval
+    
+    def _poll_arduino(self):
+        """아두이노에서 센서/펌프 상태를 읽어 최신 측정값 갱신"""
         try:
             # 아두이노에서 센서 값 읽기
             sensor_result = self.arduino_comm.read_water_level()
             
             if not sensor_result.get('success'):
                 logger.error(f"아두이노 센서 읽기 실패: {sensor_result.get('error')}")
-                return None
+                return
             
             # 펌프 상태 읽기
-            pump_result = self.arduino_comm.read_pump_status()
+            pump_result = self.arduino_comm.get_pump_status()
             pump_status = pump_result.get('pump_status', {}) if pump_result.get('success') else {}
             
-            # 센서 값을 배수지별로 매핑 (실제 센서 연결에 따라 조정 필요)
-            sensor_data = sensor_result.get('sensor_data', {})
+            sample = {
+                "channel_levels": sensor_result.get('channel_levels', {}),
+                "pump_status": pump_status,
+                "measured_at": datetime.now(),
+                "polled_at": time.monotonic()
+            }
+            with self._sample_lock:
+                self._latest_sample = sample
+                
+        except Exception as e:
+            logger.error(f"아두이노 데이터 수집 중 오류: {e}")
+    
+    @staticmethod
+    def _is_pump_on(value: Any) -> bool:
+        """아두이노 펌프 상태 값("ON"/"OFF" 문자열 또는 bool)을 bool로 변환"""
+        return value is True or str(value).strip().upper() == "ON"
+    
+    def _collect_arduino_data(self) -> Optional[WaterLevelReading]:
+        """폴링 스레드가 읽어 둔 최신 아두이노 측정값으로 데이터 생성 (폴링 중이 아니면 직접 읽음)"""
+        try:
+            if not (self.poll_thread and self.poll_thread.is_alive()):
+                self._poll_arduino()
+            
+            with self._sample_lock:
+                sample = self._latest_sample
+            
+            if sample is None:
+                return None
+            age = time.monotonic() - sample["polled_at"]
+            if age > self.update_interval * ARDUINO_SAMPLE_MAX_AGE_INTERVALS:
+                logger.error(f"아두이노 측정값이 오래되었습니다 ({age:.0f}초 전)")
+                return None
+            
+            # 센서 채널 값을 배수지별로 매핑 (ARDUINO_LEVEL_CHANNELS) - 값이 없는 배수지는 0으로 채우지 않고 NULL로 저장
+            channel_levels = sample["channel_levels"]
+            levels = [channel_levels.get(ARDUINO_LEVEL_CHANNELS.get(name)) for name in RESERVOIR_IDS]
+            if all(level is None for level in levels):
+                logger.error(f"배수지에 매핑되는 수위 센서 값이 없습니다 (수신 채널: {sorted(channel_levels)})")
+                return None
+            missing = [name for name, level in zip(RESERVOIR_IDS, levels)
+                       if level is None and name in ARDUINO_LEVEL_CHANNELS]
+            if missing:
+                logger.warning(f"지정된 채널의 수위 값이 없어 NULL로 저장합니다: {missing} "
+                               f"(수신 채널: {sorted(channel_levels)})")
             
+            gagok_level, haeryong_level, sangsa_level = (None if level is None else float(level) for level in levels)
+            pump_status = sample["pump_status"]
+            
+            # 측정 시각을 그대로 사용 (같은 측정값이 두 번 읽혀도 ON CONFLICT로 한 행만 저장)
             return WaterLevelReading(
-                timestamp=datetime.now(),
-                gagok_level=float(sensor_data.get('channel_0', 0)),
-                haeryong_level=float(sensor_data.get('channel_1', 0)),
-                sangsa_level=float(sensor_data.get('channel_2', 0)),
-                gagok_pump_a=pump_status.get('pump1', False),
-                gagok_pump_b=pump_status.get('pump2', False),
+                timestamp=sample["measured_at"],
+                gagok_level=gagok_level,
+                haeryong_level=haeryong_level,
+                sangsa_level=sangsa_level,
+                gagok_pump_a=self._is_pump_on(pump_status.get('pump1', False)),
+                gagok_pump_b=self._is_pump_on(pump_status.get('pump2', False)),
                 haeryong_pump_a=False,  # 아두이노가 2개 펌프만 제어할 수 있다고 가정
                 haeryong_pump_b=False,
                 sangsa_pump_a=False,
@@ -215,85 +438,125 @@ class RealTimeDatabaseUpdater:
         """시뮬레이션용 가상 데이터 생성"""
         now = datetime.now()
         
-        # 시간에 따른 변화 시뮬레이션
-        time_factor = (now.hour * 3600 + now.minute * 60 + now.second) / 86400.0
-        
-        # 각 배수지별 시뮬레이션 수위 (정현파 + 노이즈)
-        gagok_level = (self.simulation_base_levels['gagok'] + 
-                      15 * np.sin(time_factor * 2 * np.pi + 0) +
-                      random.normalvariate(0, 2))
-        
-        haeryong_level = (self.simulation_base_levels['haeryong'] + 
-                         20 * np.sin(time_factor * 2 * np.pi + np.pi/3) +
-                         random.normalvariate(0, 1.5))
-        
-        sangsa_level = (self.simulation_base_levels['sangsa'] + 
-                       25 * np.sin(time_factor * 2 * np.pi + 2*np.pi/3) +
-                       random.normalvariate(0, 3))
+        # 시간에 따른 변화 시뮬레이션 (현지 시각 기준 하루 중 경과 비율, 초 미만까지 반영)
+        # timestamp()는 UTC 기준이므로 현지 UTC 오프셋을 더해 자정 기준을 맞춤
+        ts = now.timestamp()
+        time_factor = ((ts + time.localtime(ts).tm_gmtoff) % 86400) / 86400.0
+        omega_t = time_factor * 2 * np.pi
         
-        # 수위 범위 제한
-        gagok_level = max(30, min(120, gagok_level))
-        haeryong_level = max(30, min(120, haeryong_level))
-        sangsa_level = max(30, min(120, sangsa_level))
+        # 세 배수지 시뮬레이션 수위를 한 번에 계산 (정현파 + 노이즈) 후 범위 제한
+        levels = (self._simulation_bases
+                  + SIMULATION_AMPLITUDES * np.sin(omega_t + SIMULATION_PHASES)
+                  + self._rng.normal(0.0, SIMULATION_NOISE_SIGMAS))
+        np.clip(levels, SIMULATION_LEVEL_MIN, SIMULATION_LEVEL_MAX, out=levels)
         
-        # 펌프 상태 (수위에 따른 자동 제어 시뮬레이션)
-        gagok_pump_a = gagok_level > 85
-        gagok_pump_b = gagok_level > 95
-        haeryong_pump_a = haeryong_level > 80
-        haeryong_pump_b = haeryong_level > 90
-        sangsa_pump_a = sangsa_level > 90
-        sangsa_pump_b = sangsa_level > 100
-        sangsa_pump_c = sangsa_level > 110
+        # 펌프 상태 (수위에 따른 자동 제어 시뮬레이션) - 7개 펌프를 한 번의 비교로 계산
+        pumps = (levels[SIMULATION_PUMP_LEVEL_INDEX] > SIMULATION_PUMP_THRESHOLDS).tolist()
+        gagok_level, haeryong_level, sangsa_level = levels.tolist()
         
         return WaterLevelReading(
-            timestamp=now,
-            gagok_level=round(gagok_level, 1),
-            haeryong_level=round(haeryong_level, 1),
-            sangsa_level=round(sangsa_level, 1),
-            gagok_pump_a=gagok_pump_a,
-            gagok_pump_b=gagok_pump_b,
-            haeryong_pump_a=haeryong_pump_a,
-            haeryong_pump_b=haeryong_pump_b,
-            sangsa_pump_a=sangsa_pump_a,
-            sangsa_pump_b=sangsa_pump_b,
-            sangsa_pump_c=sangsa_pump_c
+            now,
+            round(gagok_level, 1),
+            round(haeryong_level, 1),
+            round(sangsa_level, 1),
+            *pumps
         )
     
-    def _save_to_database(self, reading: WaterLevelReading) -> bool:
-        """수위 데이터를 PostgreSQL water 테이블에 저장"""
+    def _save_to_database(self, reading: WaterLevelReading, flush: bool = False) -> SaveResult:
+        """수위 데이터를 저장 대기열에 추가하고 건수/시간 조건을 넘으면 water 테이블에 일괄 저장"""
+        with self._pending_lock:
+            self._pending.append(reading)
+            if (flush or len(self._pending) >= DB_FLUSH_THRESHOLD
+                    or time.monotonic() - self._last_flush >= DB_FLUSH_INTERVAL_SECONDS):
+                return SaveResult.WRITTEN if self._flush_pending() else SaveResult.FAILED
+        return SaveResult.QUEUED
+    
+    def _flush(self) -> bool:
+        """저장 대기 중인 측정값을 모두 water 테이블에 저장"""
+        with self._pending_lock:
+            return self._flush_pending()
+    
+    def _flush_pending(self) -> bool:
+        """대기열의 측정값을 준비된 INSERT로 일괄 실행하고 한 번에 커밋 (self._pending_lock 보유 상태에서 호출)
+        
+        연결 오류 등 일시적인 실패는 대기열을 유지해 다음에 재시도하고,
+        다시 시도해도 실패할 데이터 오류는 행 단위로 저장해 문제 행만 버림 (대기열이 막히지 않도록)
+        """
+        if not self._pending:
+            return True
+        
+        batch = list(self._pending)
+        written = 0
         try:
-            with psycopg2.connect(**self.db_config) as conn:
+            with self._borrow() as conn:
                 with conn.cursor() as cur:
-                    insert_query = """
-                        INSERT INTO water 
-                        (measured_at, 
-                         gagok_water_level, gagok_pump_a, gagok_pump_b,
-                         haeryong_water_level, haeryong_pump_a, haeryong_pump_b,
-                         sangsa_water_level, sangsa_pump_a, sangsa_pump_b, sangsa_pump_c)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """
-                    
-                    # boolean 값을 double precision (1.0/0.0)으로 변환
-                    cur.execute(insert_query, (
-                        reading.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                        reading.gagok_level, 
-                        1.0 if reading.gagok_pump_a else 0.0, 
-                        1.0 if reading.gagok_pump_b else 0.0,
-                        reading.haeryong_level, 
-                        1.0 if reading.haeryong_pump_a else 0.0, 
-                        1.0 if reading.haeryong_pump_b else 0.0,
-                        reading.sangsa_level, 
-                        1.0 if reading.sangsa_pump_a else 0.0, 
-                        1.0 if reading.sangsa_pump_b else 0.0, 
-                        1.0 if reading.sangsa_pump_c else 0.0
-                    ))
-                    
-                    conn.commit()
-                    return True
-                    
+                    self._ensure_prepared(conn, cur)
+                    # 페이지마다 컬럼 배열을 담은 EXECUTE 한 번 (rowcount = 실제 추가된 행 수)
+                    for start in range(0, len(batch), DB_INSERT_PAGE_SIZE):
+                        cur.execute(WATER_EXECUTE_SQL, self._readings_to_columns(batch[start:start + DB_INSERT_PAGE_SIZE]))
+                        written += cur.rowcount
+        except (psycopg2.IntegrityError, psycopg2.DataError) as e:
+            logger.error(f"일괄 저장 중 데이터 오류 - 행 단위로 다시 저장: {e}")
+            written = self._insert_rows_individually(batch)
+            if written is None:
+                return False
         except Exception as e:
-            logger.error(f"데이터베이스 저장 중 오류: {e}")
+            logger.error(f"데이터베이스 저장 중 오류 (대기 {len(batch)}건): {e}")
             return False
+        
+        if written < len(batch):
+            logger.info(f"이미 저장된 측정 시각 {len(batch) - written}건은 건너뛰었습니다")
+        self.readings_count += written
+        for _ in range(len(batch)):
+            self._pending.popleft()
+        self._last_flush = time.monotonic()
+        return True
+    
+    def _insert_rows_individually(self, batch: List[WaterLevelReading]) -> Optional[int]:
+        """측정값을 행마다 SAVEPOINT로 감싸 저장하고 데이터 오류가 난 행은 버림 (추가된 행 수, 연결 오류 시 None)"""
+        written = 0
+        try:
+            with self._borrow() as conn:
+                with conn.cursor() as cur:
+                    self._ensure_prepared(conn, cur)
+                    for reading in batch:
+                        cur.execute("SAVEPOINT water_row")
+                        try:
+                            cur.execute(WATER_EXECUTE_SQL, self._readings_to_columns([reading]))
+                        except (psycopg2.IntegrityError, psycopg2.DataError) as e:
+                            cur.execute("ROLLBACK TO SAVEPOINT water_row")
+                            logger.error(f"저장할 수 없는 측정값을 버립니다 ({reading.timestamp.isoformat()}): {e}")
+                        else:
+                            written += cur.rowcount
+                            cur.execute("RELEASE SAVEPOINT water_row")
+            return written
+            
+        except Exception as e:
+            logger.error(f"데이터베이스 행 단위 저장 중 오류 (대기 {len(batch)}건): {e}")
+            return None
+    
+    @classmethod
+    def _readings_to_columns(cls, readings: List[WaterLevelReading]) -> List[list]:
+        """측정값 목록을 준비된 INSERT의 컬럼별 배열 파라미터로 변환 (None은 배열 안에서 NULL)"""
+        return [list(column) for column in zip(*map(cls._reading_to_row, readings))]
+    
+    @staticmethod
+    def _reading_to_row(reading: WaterLevelReading) -> tuple:
+        """측정값을 water 테이블 INSERT 행으로 변환"""
+        # boolean 값을 double precision (1.0/0.0)으로 변환 (펌프 필드는 항상 bool)
+        return (
+            reading.timestamp,
+            reading.gagok_level, 
+            float(reading.gagok_pump_a), 
+            float(reading.gagok_pump_b),
+            reading.haeryong_level, 
+            float(reading.haeryong_pump_a), 
+            float(reading.haeryong_pump_b),
+            reading.sangsa_level, 
+            float(reading.sangsa_pump_a), 
+            float(reading.sangsa_pump_b), 
+            float(reading.sangsa_pump_c)
+        )
     
     def get_service_status(self) -> Dict[str, Any]:
         """서비스 상태 정보 반환"""
@@ -316,9 +579,9 @@ class RealTimeDatabaseUpdater:
         try:
             reading = self._collect_sensor_data()
             if reading:
-                success = self._save_to_database(reading)
+                result = self._save_to_database(reading, flush=True)
                 return {
-                    "success": success,
+                    "success": result is SaveResult.WRITTEN,
                     "reading": {
                         "timestamp": reading.timestamp.isoformat(),
                         "gagok_level": reading.gagok_level,
@@ -5,7 +5,7 @@ import time
 import signal
 import sys
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -434,6 +434,44 @@ class RealtimeMonitor:
                 "error": str(e)
             }
 
+    def manual_override_many(self, reservoir_id: str, pump_actions: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """여러 펌프 수동 일괄 제어 (아두이노 왕복 1회)"""
+        try:
+            commands = [(self._extract_pump_id(pump_name), state) for pump_name, state in pump_actions]
+            results = self.arduino_comm.control_pumps(commands)
+
+            now = datetime.now()
+            summaries = []
+            for (pump_name, state), result in zip(pump_actions, results):
+                # 명령 전송 성공 + 해당 펌프 ACK 수신 시에만 성공 (시뮬레이션 응답에는 ACK 필드가 없음)
+                ack_received = result.get('ack_received', result.get('simulation', False))
+                success = result.get('success', False) and ack_received
+                
+                # 수동 제어 기록
+                self.control_history.append(ControlAction(
+                    timestamp=now,
+                    reservoir_id=reservoir_id,
+                    action=f"MANUAL_{state}",
+                    target=pump_name,
+                    reason="수동 일괄 제어",
+                    success=success,
+                    details=result
+                ))
+                summaries.append({
+                    "success": success,
+                    "ack_received": ack_received,
+                    "message": (f"수동 제어 완료: {pump_name} {state}" if success
+                                else f"수동 제어 ACK 미수신: {pump_name} {state}" if result.get('success')
+                                else f"수동 제어 실패: {pump_name} {state}"),
+                    "details": result
+                })
+
+            return summaries
+
+        except Exception as e:
+            logger.error(f"수동 일괄 제어 중 오류: {e}")
+            return [{"success": False, "error": str(e)} for _ in pump_actions]
+
 # 전역 모니터링 인스턴스
 _global_monitor = None
 
@@ -252,6 +252,22 @@ class PostgreSQLStorage:
             logger.error(f"SQL 쿼리 실행 오류: {e}\n쿼리: {query}\n파라미터: {params}")
             raise # 오류를 상위 호출자로 전파
 
+    def execute_values(self, query, argslist, template=None, page_size=100, commit=True):
+        """여러 행을 한 번에 INSERT하기 위한 헬퍼 메소드 (psycopg2.extras.execute_values 사용)"""
+        if not self._initialized or not self._cursor:
+            logger.error("데이터베이스 연결이 초기화되지 않았습니다.")
+            raise ConnectionError("데이터베이스 연결이 초기화되지 않았습니다.")
+
+        try:
+            psycopg2.extras.execute_values(self._cursor, query, argslist, template=template, page_size=page_size)
+            if commit:
+                self._connection.commit()
+            return True
+        except Exception as e:
+            self._connection.rollback() # 오류 발생 시 롤백
+            logger.error(f"SQL 일괄 실행 오류: {e}\n쿼리: {query}\n행 수: {len(argslist)}")
+            raise # 오류를 상위 호출자로 전파
+
     def save_file(self, file_content: bytes, filename: str, metadata: dict = None):
         """
         파일을 files 테이블에 저장하고 내용을 처리하여 chunks 테이블에 저장합니다.